@@ -0,0 +1,154 @@
+"""Partitioned request_log and validator_log by month of inserted_at
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17 10:00:00.000000
+
+This migration needs downtime. Both log tables are renamed and copied into the
+partitioned tables in the migration's single transaction, which holds ACCESS
+EXCLUSIVE locks on them until it commits. Every read and write of the logs,
+including the request log each validation call writes, waits until then, and
+the wait grows with the size of the tables. Stop the API (or run it in a
+maintenance window) while upgrading, and consider pruning old logs first.
+The downgrade copies the rows back the same way.
+"""
+
+from datetime import date, datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision = "005"
+branch_labels = None
+depends_on = None
+
+LOG_TABLES = ("request_log", "validator_log")
+
+# comments of validator_log.request_id with and without the foreign key
+REQUEST_ID_COMMENT = "Identifier of the associated request log entry"
+OLD_REQUEST_ID_COMMENT = "Foreign key to the associated request log entry"
+
+# monthly partitions created past the current month; app.core.log_partitions
+# keeps creating them from then on
+MONTHS_AHEAD = 3
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _partition_table(table: str) -> None:
+    old_table = f"{table}_unpartitioned"
+    op.rename_table(table, old_table)
+    op.execute(
+        f"CREATE TABLE {table} (LIKE {old_table} INCLUDING DEFAULTS "
+        "INCLUDING COMMENTS) PARTITION BY RANGE (inserted_at)"
+    )
+    op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+    first_inserted_at = (
+        op.get_bind()
+        .execute(sa.text(f"SELECT min(inserted_at) FROM {old_table}"))
+        .scalar()
+    )
+    current_month = datetime.now(timezone.utc).date().replace(day=1)
+    month = (
+        first_inserted_at.date().replace(day=1)
+        if first_inserted_at
+        else current_month
+    )
+    while month <= _add_months(current_month, MONTHS_AHEAD):
+        next_month = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE {table}_p{month:%Y%m} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month}') TO ('{next_month}')"
+        )
+        month = next_month
+
+    op.execute(f"INSERT INTO {table} SELECT * FROM {old_table}")
+    op.drop_table(old_table)
+
+    # Unique constraints of a partitioned table must include the partition key.
+    op.create_primary_key(f"{table}_pkey", table, ["id", "inserted_at"])
+
+
+def upgrade() -> None:
+    # A foreign key needs a unique key to point at, and request_log's is now
+    # (id, inserted_at); validator logs keep request_id without the constraint.
+    op.drop_constraint(
+        "validator_log_request_id_fkey", "validator_log", type_="foreignkey"
+    )
+
+    # Dropping the old tables drops the single-column indexes of 004 with them.
+    for table in LOG_TABLES:
+        _partition_table(table)
+
+    # LIKE ... INCLUDING COMMENTS copied the old comment.
+    op.execute(
+        f"COMMENT ON COLUMN validator_log.request_id IS '{REQUEST_ID_COMMENT}'"
+    )
+
+    # Each insert now updates two indexes per table. Time-range scans are
+    # pruned to their partitions, and most queries filter by tenant.
+    op.create_index("idx_request_log_request_id", "request_log", ["request_id"])
+    op.create_index(
+        "idx_request_log_org_project_inserted_at",
+        "request_log",
+        ["organization_id", "project_id", "inserted_at"],
+    )
+    op.create_index("idx_validator_log_request_id", "validator_log", ["request_id"])
+    op.create_index(
+        "idx_validator_log_org_project_inserted_at",
+        "validator_log",
+        ["organization_id", "project_id", "inserted_at"],
+    )
+
+
+def downgrade() -> None:
+    for table in LOG_TABLES:
+        old_table = f"{table}_unpartitioned"
+        op.execute(
+            f"CREATE TABLE {old_table} (LIKE {table} INCLUDING DEFAULTS "
+            "INCLUDING COMMENTS)"
+        )
+        op.execute(f"INSERT INTO {old_table} SELECT * FROM {table}")
+        # Drops the partitions and the indexes created in upgrade as well.
+        op.drop_table(table)
+        op.rename_table(old_table, table)
+        op.create_primary_key(f"{table}_pkey", table, ["id"])
+
+    # Retention may have dropped a request log but not all of its validator logs.
+    op.execute(
+        "DELETE FROM validator_log v WHERE NOT EXISTS "
+        "(SELECT 1 FROM request_log r WHERE r.id = v.request_id)"
+    )
+    op.create_foreign_key(
+        "validator_log_request_id_fkey",
+        "validator_log",
+        "request_log",
+        ["request_id"],
+        ["id"],
+    )
+    op.execute(
+        f"COMMENT ON COLUMN validator_log.request_id IS '{OLD_REQUEST_ID_COMMENT}'"
+    )
+
+    op.create_index("idx_request_log_request_id", "request_log", ["request_id"])
+    op.create_index("idx_request_log_status", "request_log", ["status"])
+    op.create_index("idx_request_log_inserted_at", "request_log", ["inserted_at"])
+    op.create_index(
+        "idx_request_log_organization_id", "request_log", ["organization_id"]
+    )
+    op.create_index("idx_request_log_project_id", "request_log", ["project_id"])
+
+    op.create_index("idx_validator_log_request_id", "validator_log", ["request_id"])
+    op.create_index("idx_validator_log_inserted_at", "validator_log", ["inserted_at"])
+    op.create_index("idx_validator_log_outcome", "validator_log", ["outcome"])
+    op.create_index("idx_validator_log_name", "validator_log", ["name"])
+    op.create_index(
+        "idx_validator_log_organization_id", "validator_log", ["organization_id"]
+    )
+    op.create_index("idx_validator_log_project_id", "validator_log", ["project_id"])
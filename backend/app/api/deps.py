@@ -1,4 +1,4 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from dataclasses import dataclass
 from typing import Annotated
 
@@ -9,9 +9,10 @@ import httpx
 from fastapi import Depends, Header, HTTPException, Security, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings
-from app.core.db import engine
+from app.core.db import async_engine, engine
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -22,6 +23,16 @@ def get_db() -> Generator[Session, None, None]:
 SessionDep = Annotated[Session, Depends(get_db)]
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    # Attributes stay loaded after commit: an expired attribute would be
+    # reloaded with blocking I/O, which AsyncSession does not allow.
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_db)]
+
+
 # Static bearer token auth for internal routes.
 security = HTTPBearer(auto_error=False)
 
@@ -2,19 +2,35 @@ from uuid import UUID
 import uuid
 
 from fastapi import APIRouter
+from fastapi.concurrency import run_in_threadpool
 from guardrails.guard import Guard
 from guardrails.validators import FailResult, PassResult
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.api.deps import AuthDep, SessionDep
+from app.api.deps import AsyncSessionDep, AuthDep
 from app.core.constants import BAN_LIST, REPHRASE_ON_FAIL_PREFIX
 from app.core.config import settings
-from app.core.guardrail_controller import build_guard, get_validator_config_models
+from app.core.guardrail_controller import (
+    build_guard,
+    get_validator_config_models,
+    run_validators,
+)
+from app.core.validator_executor import (
+    ExecutionResult,
+    runs_from_guard,
+    ValidatorRun,
+)
 from app.core.exception_handlers import _safe_error_message
 from app.core.validators.config.ban_list_safety_validator_config import (
     BanListSafetyValidatorConfig,
 )
+from app.core.log_writer import insert_logs_async, LogEntry, log_writer
 from app.crud.ban_list import ban_list_crud
+from app.crud.log_buffer import (
+    BufferedRequestLogCrud,
+    BufferedValidatorLogCrud,
+    LogBuffer,
+)
 from app.crud.request_log import RequestLogCrud
 from app.crud.validator_log import ValidatorLogCrud
 from app.schemas.guardrail_config import GuardrailRequest, GuardrailResponse
@@ -28,28 +44,40 @@ router = APIRouter(prefix="/guardrails", tags=["guardrails"])
 @router.post(
     "/", response_model=APIResponse[GuardrailResponse], response_model_exclude_none=True
 )
-def run_guardrails(
+async def run_guardrails(
     payload: GuardrailRequest,
-    session: SessionDep,
+    session: AsyncSessionDep,
     _: AuthDep,
     suppress_pass_logs: bool = True,
 ):
-    request_log_crud = RequestLogCrud(session=session)
-    validator_log_crud = ValidatorLogCrud(session=session)
+    # Validation runs on a worker thread against in-memory logs, so only the
+    # event loop talks to the database.
+    log_write_mode = settings.REQUEST_LOG_WRITE_MODE
+    log_buffer = LogBuffer()
+    request_log_crud = BufferedRequestLogCrud(log_buffer)
+    validator_log_crud = BufferedValidatorLogCrud(log_buffer)
 
     try:
         request_log = request_log_crud.create(payload)
     except ValueError:
         return APIResponse.failure_response(error="Invalid request_id")
 
-    _resolve_ban_list_banned_words(payload, session)
-    return _validate_with_guard(
-        payload,
-        request_log_crud,
-        request_log.id,
-        validator_log_crud,
-        suppress_pass_logs,
-    )
+    if log_write_mode == "sync":
+        session.add(request_log)
+        await session.commit()
+
+    try:
+        await _resolve_ban_list_banned_words(payload, session)
+        return await run_in_threadpool(
+            _validate_with_guard,
+            payload,
+            request_log_crud,
+            request_log.id,
+            validator_log_crud,
+            suppress_pass_logs,
+        )
+    finally:
+        await _save_logs(log_write_mode, log_buffer, session)
 
 
 @router.get("/")
@@ -82,7 +110,29 @@ def list_validators(_: AuthDep):
     return {"validators": validators}
 
 
-def _resolve_ban_list_banned_words(payload: GuardrailRequest, session: Session) -> None:
+async def _save_logs(
+    log_write_mode: str, log_buffer: LogBuffer, session: AsyncSession
+) -> None:
+    if log_write_mode == "background":
+        # submit() writes inline when the queue is full, so keep it off the loop.
+        await run_in_threadpool(
+            log_writer.submit, log_buffer.request_log, log_buffer.validator_logs
+        )
+    elif log_write_mode == "write_once":
+        await insert_logs_async(
+            [LogEntry(log_buffer.request_log, log_buffer.validator_logs)],
+            session=session,
+        )
+    else:
+        # The request log was committed when the request started; this commits
+        # its final state together with the validator logs.
+        session.add_all(log_buffer.validator_logs)
+        await session.commit()
+
+
+async def _resolve_ban_list_banned_words(
+    payload: GuardrailRequest, session: AsyncSession
+) -> None:
     for validator in payload.validators:
         if not isinstance(validator, BanListSafetyValidatorConfig):
             continue
@@ -90,7 +140,7 @@ def _resolve_ban_list_banned_words(payload: GuardrailRequest, session: Session)
         if validator.type != BAN_LIST or validator.banned_words is not None:
             continue
 
-        ban_list = ban_list_crud.get(
+        ban_list = await ban_list_crud.get_async(
             session,
             id=validator.ban_list_id,
             organization_id=payload.organization_id,
@@ -117,6 +167,7 @@ def _validate_with_guard(
     data = payload.input
     validators = payload.validators
     guard: Guard | None = None
+    execution: ExecutionResult | None = None
 
     def _finalize(
         *,
@@ -145,10 +196,10 @@ def _validate_with_guard(
             ),
         )
 
-        if guard is not None:
-            add_validator_logs(
-                guard, request_log_id, validator_log_crud, payload, suppress_pass_logs
-            )
+        runs = execution.runs if execution is not None else runs_from_guard(guard)
+        add_validator_logs(
+            runs, request_log_id, validator_log_crud, payload, suppress_pass_logs
+        )
 
         rephrase_needed = validated_output is not None and validated_output.startswith(
             REPHRASE_ON_FAIL_PREFIX
@@ -169,8 +220,15 @@ def _validate_with_guard(
         )
 
     try:
-        guard = build_guard(validators)
-        result = guard.validate(data)
+        mode = settings.VALIDATOR_EXECUTION_MODE
+        if mode != "guard":
+            execution = run_validators(validators, data, parallel=mode == "parallel")
+
+        if execution is not None:
+            result = execution
+        else:
+            guard = build_guard(validators)
+            result = guard.validate(data)
 
         # Case 1: validation passed OR failed-with-fix (on_fail=FIX)
         if result.validated_output is not None:
@@ -194,27 +252,14 @@ def _validate_with_guard(
 
 
 def add_validator_logs(
-    guard: Guard,
+    runs: list[ValidatorRun],
     request_log_id: UUID,
     validator_log_crud: ValidatorLogCrud,
     payload: GuardrailRequest,
     suppress_pass_logs: bool = False,
 ):
-    history = getattr(guard, "history", None)
-    if not history:
-        return
-
-    last_call = getattr(history, "last", None)
-    if not last_call or not getattr(last_call, "iterations", None):
-        return
-
-    iteration = last_call.iterations[-1]
-    outputs = getattr(iteration, "outputs", None)
-    if not outputs or not getattr(outputs, "validator_logs", None):
-        return
-
-    for log in iteration.outputs.validator_logs:
-        result = log.validation_result
+    for run in runs:
+        result = run.validation_result
 
         if suppress_pass_logs and isinstance(result, PassResult):
             continue
@@ -227,9 +272,9 @@ def add_validator_logs(
             request_id=request_log_id,
             organization_id=payload.organization_id,
             project_id=payload.project_id,
-            name=log.validator_name,
-            input=str(log.value_before_validation),
-            output=log.value_after_validation,
+            name=run.validator_name,
+            input=str(run.value_before_validation),
+            output=run.value_after_validation,
             error=error_message,
             outcome=ValidatorOutcome(result.outcome.upper()),
         )
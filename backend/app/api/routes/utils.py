@@ -1,4 +1,10 @@
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from starlette.status import HTTP_200_OK, HTTP_503_SERVICE_UNAVAILABLE
+
+from app.core.db import async_engine, engine
+from app.core.db_pool import pool_stats
+from app.core.warmup import validator_warmup
 
 router = APIRouter(prefix="/utils", tags=["utils"])
 
@@ -6,3 +12,30 @@ router = APIRouter(prefix="/utils", tags=["utils"])
 @router.get("/health-check/")
 def health_check() -> bool:
     return True
+
+
+@router.get("/readiness/")
+def readiness_check() -> JSONResponse:
+    """
+    Reports whether validator warm-up has finished, with the warm/cold state of
+    each validator type. Returns 503 until warm-up has finished, and after it
+    if any validator failed every warm-up attempt; such a worker stays unready
+    until it is restarted.
+    """
+    ready = validator_warmup.is_ready()
+    return JSONResponse(
+        status_code=HTTP_200_OK if ready else HTTP_503_SERVICE_UNAVAILABLE,
+        content={"ready": ready, "validators": validator_warmup.status()},
+    )
+
+
+@router.get("/db-pool/")
+def db_pool_stats() -> dict:
+    """
+    Connection pool state of this worker's sync and async engines: open and
+    checked-out connections, overflow, and how long checkouts waited.
+    """
+    return {
+        "sync": pool_stats(engine.pool),
+        "async": pool_stats(async_engine.pool),
+    }
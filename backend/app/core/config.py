@@ -1,10 +1,11 @@
 import os
 from pathlib import Path
 import re
-from typing import Any, ClassVar, Literal
+from typing import Annotated, Any, ClassVar, Literal
 import warnings
 
 from pydantic import (
+    BeforeValidator,
     HttpUrl,
     PostgresDsn,
     computed_field,
@@ -40,9 +41,84 @@ class Settings(BaseSettings):
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str = ""
     POSTGRES_DB: str = ""
+    # connections kept open per engine and worker (sync and async engines each
+    # have a pool), and how many more may be opened during a burst
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    # how long a request waits for a free connection before failing
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    # connections older than this are replaced (-1 never replaces them)
+    DB_POOL_RECYCLE_SECONDS: int = -1
+    # test each connection before handing it out
+    DB_POOL_PRE_PING: bool = False
+    # server-side limit on each statement's run time (0 disables)
+    DB_STATEMENT_TIMEOUT_MS: int = 0
     GUARDRAILS_HUB_API_KEY: str | None = None
     KAAPI_AUTH_URL: str = ""
     KAAPI_AUTH_TIMEOUT: int
+    # "native" runs validators in sequence with the in-house executor; "parallel"
+    # runs them concurrently on the original text and merges their fixes;
+    # "guard" runs them through a guardrails Guard (compatibility mode)
+    VALIDATOR_EXECUTION_MODE: Literal["native", "parallel", "guard"] = "native"
+    # threads running validators in parallel mode, shared by all requests
+    VALIDATOR_EXECUTION_WORKERS: int = 8
+    # "sync" commits request and validator logs during the request; "write_once"
+    # builds them in memory and inserts them in one transaction at the end;
+    # "background" bulk-inserts them from a writer thread
+    REQUEST_LOG_WRITE_MODE: Literal["sync", "write_once", "background"] = "sync"
+    # requests whose logs may wait in memory before new ones write inline
+    LOG_WRITER_QUEUE_SIZE: int = 10000
+    # requests per bulk insert, and the longest a queued log waits for one
+    LOG_WRITER_BATCH_SIZE: int = 200
+    LOG_WRITER_FLUSH_INTERVAL_MS: float = 200.0
+    # how long a request waits for room in a full queue before writing inline
+    LOG_WRITER_ENQUEUE_TIMEOUT_MS: float = 50.0
+    LOG_WRITER_DRAIN_TIMEOUT_SECONDS: float = 10.0
+    # request and validator logs older than this are dropped by
+    # `python -m app.core.log_partitions`, a month at a time (0 keeps them all)
+    LOG_RETENTION_DAYS: int = 0
+    # monthly log partitions created ahead of time by the same command
+    LOG_PARTITION_MONTHS_AHEAD: int = 3
+    # how long retention waits for the lock to detach an expired partition
+    LOG_PARTITION_LOCK_TIMEOUT_MS: int = 5000
+    # max number of distinct validator configs kept built per worker (0 disables)
+    GUARD_CACHE_MAX_SIZE: int = 128
+    # preload validator lists and models during startup, before serving traffic
+    VALIDATOR_WARMUP_ENABLED: bool = True
+    # tries per validator before warm-up gives up and the worker stays not ready
+    VALIDATOR_WARMUP_ATTEMPTS: int = 3
+    # wait before the second try, doubled before each later one
+    VALIDATOR_WARMUP_RETRY_DELAY_SECONDS: float = 1.0
+    # spaCy model Presidio uses for NER (en_core_web_sm, en_core_web_md, en_core_web_lg)
+    PII_SPACY_MODEL: str = "en_core_web_lg"
+    # pipeline components not loaded with it; NER needs none of them, but the
+    # lemmas from tagger/attribute_ruler/lemmatizer feed Presidio's context boost
+    PII_SPACY_EXCLUDED_COMPONENTS: Annotated[
+        list[str] | str, BeforeValidator(parse_cors)
+    ] = ["parser", "senter"]
+    # micro-batch spaCy NER calls from concurrent PII requests (opt-in)
+    PII_NLP_BATCHING_ENABLED: bool = False
+    PII_NLP_BATCH_MAX_SIZE: int = 16
+    # longest a request waits for others to join its batch
+    PII_NLP_BATCH_MAX_WAIT_MS: float = 5.0
+    # PII inputs longer than this are analyzed as overlapping chunks (0 disables)
+    PII_CHUNK_MAX_CHARS: int = 5000
+    # should exceed the longest entity expected to cross a chunk boundary
+    PII_CHUNK_OVERLAP_CHARS: int = 200
+    # threads analyzing the chunks of long inputs, shared by all requests
+    PII_CHUNK_WORKERS: int = 4
+    # processes running heavy validators outside the API worker (0 runs them inline)
+    VALIDATOR_PROCESS_POOL_SIZE: int = 0
+    VALIDATOR_PROCESS_POOL_TYPES: Annotated[
+        list[str] | str, BeforeValidator(parse_cors)
+    ] = ["pii_remover", "ban_list"]
+    # calls queued or running in the pool before new ones wait for a slot
+    VALIDATOR_PROCESS_POOL_MAX_PENDING: int = 32
+    VALIDATOR_PROCESS_POOL_TIMEOUT_SECONDS: float = 10.0
+    # time each server worker waits at startup for its pool processes to warm up
+    VALIDATOR_PROCESS_POOL_STARTUP_TIMEOUT_SECONDS: float = 300.0
+    # ban lists shorter than this are cheaper to run inline than to ship to the pool
+    VALIDATOR_PROCESS_POOL_BAN_LIST_MIN_WORDS: int = 1000
     CORE_DIR: ClassVar[Path] = Path(__file__).resolve().parent
 
     SLUR_LIST_FILENAME: ClassVar[str] = "curated_slurlist_hi_en.csv"
@@ -55,6 +131,12 @@ class Settings(BaseSettings):
         CORE_DIR / "validators" / "utils" / "files" / "gender_assumption_bias_words.csv"
     )
 
+    # built from the CSVs above by
+    # `python -m app.core.validators.utils.lexicon_artifact`
+    LEXICON_ARTIFACT_FILEPATH: ClassVar[Path] = (
+        CORE_DIR / "validators" / "utils" / "files" / "lexicons.bin"
+    )
+
     @computed_field  # type: ignore[prop-decorator]
     @property
     def SQLALCHEMY_DATABASE_URI(self) -> PostgresDsn:
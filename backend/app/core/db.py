@@ -1,8 +1,22 @@
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import Session, create_engine, select
 
 from app.core.config import settings
-
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+from app.core.db_pool import TimedAsyncQueuePool, TimedQueuePool, engine_options
+
+engine = create_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    poolclass=TimedQueuePool,
+    **engine_options(),
+)
+
+# Same database through psycopg's asyncio driver, for `async def` routes.
+# It has a pool of its own, sized by the same settings.
+async_engine = create_async_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    poolclass=TimedAsyncQueuePool,
+    **engine_options(),
+)
 
 
 # make sure all SQLModel models are imported (app.models) before initializing DB
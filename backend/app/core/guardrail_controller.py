@@ -1,15 +1,128 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
 from typing import get_args
 
 from guardrails import Guard
 
+from app.core.config import settings
+from app.core.validator_executor import ExecutionResult, validator_executor
+from app.core.validator_pool import validator_pool
+from app.core.validators.config.base_validator_config import BaseValidatorConfig
 from app.schemas.guardrail_config import ValidatorConfigItem
 
 
+class ValidatorCache:
+    """
+    Process-wide LRU cache of built validators, keyed by a canonical hash of the
+    validator config list. Validator order is part of the key because guards run
+    validators sequentially.
+    """
+
+    def __init__(self, max_size: int, build=None):
+        self.max_size = max_size
+        self.build = build or (lambda v_item: v_item.build())
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(validator_items) -> str | None:
+        """
+        Returns a stable key for the given configs, or None when any item is not a
+        validator config model (and therefore cannot be canonicalized).
+        """
+        canonical = []
+        for v_item in validator_items:
+            if not isinstance(v_item, BaseValidatorConfig):
+                return None
+            canonical.append(v_item.model_dump(mode="json"))
+
+        encoded = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def get_or_build(self, validator_items) -> list:
+        key = self.make_key(validator_items) if self.max_size > 0 else None
+        if key is None:
+            return [self.build(v_item) for v_item in validator_items]
+
+        with self._lock:
+            validators = self._entries.get(key)
+            if validators is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return list(validators)
+            self.misses += 1
+
+        # Build outside the lock so a slow build does not block cache hits.
+        validators = tuple(self.build(v_item) for v_item in validator_items)
+
+        with self._lock:
+            self._entries[key] = validators
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return list(validators)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def build_validator(v_item):
+    """
+    Builds the validator for a config, or a proxy to the validator pool for the
+    heavy validator types configured to run out of process.
+    """
+    if validator_pool.should_offload(v_item):
+        return validator_pool.proxy(v_item)
+    return v_item.build()
+
+
+validator_cache = ValidatorCache(
+    max_size=settings.GUARD_CACHE_MAX_SIZE, build=build_validator
+)
+
+
 def build_guard(validator_items):
-    validators = [v_item.build() for v_item in validator_items]
+    # A fresh Guard per call keeps call history request-scoped; only the
+    # expensive validator instances are shared across requests.
+    validators = validator_cache.get_or_build(validator_items)
     return Guard().use_many(*validators)
 
 
+def run_validators(
+    validator_items, value: str, parallel: bool = False
+) -> ExecutionResult | None:
+    """
+    Runs the validators with the in-house executor, concurrently when `parallel`
+    is set, or returns None when the list needs an on_fail action only a Guard
+    implements.
+    """
+    validators = validator_cache.get_or_build(validator_items)
+    if not validator_executor.supports(validators):
+        return None
+    return validator_executor.run(validators, value, parallel=parallel)
+
+
 def get_validator_config_models():
     annotated_args = get_args(ValidatorConfigItem)
     union_type = annotated_args[0]
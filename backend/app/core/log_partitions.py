@@ -0,0 +1,220 @@
+"""
+Monthly partitions of the request_log and validator_log tables.
+
+Migration 006 partitions both tables by range of `inserted_at`: one partition
+per calendar month (e.g. `request_log_p202603`) and a default partition for
+rows no monthly partition covers. `maintain_partitions` creates the partitions
+of the current and the next LOG_PARTITION_MONTHS_AHEAD months and drops the
+partitions that lie entirely before the retention window, so old logs go away
+without DELETEs, dead tuples or vacuum work. Expired partitions are detached one
+at a time outside the creation transaction and dropped once detached, so the
+parent table is locked only for each short detach. Run it daily:
+
+    python -m app.core.log_partitions
+"""
+import logging
+import re
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+
+from app.core.config import settings
+from app.core.db import engine
+from app.utils import now
+
+logger = logging.getLogger(__name__)
+
+LOG_TABLES = ("request_log", "validator_log")
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y%m}"
+
+
+def is_partitioned(connection: Connection, table: str) -> bool:
+    return connection.execute(
+        text(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+            "WHERE partrelid = to_regclass(:table))"
+        ),
+        {"table": table},
+    ).scalar()
+
+
+def has_default_partition(connection: Connection, table: str) -> bool:
+    return connection.execute(
+        text(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+            "WHERE partrelid = to_regclass(:table) AND partdefid <> 0)"
+        ),
+        {"table": table},
+    ).scalar()
+
+
+def list_partitions(connection: Connection, table: str) -> dict[date, str]:
+    """
+    Monthly partitions of `table`, by the first day of their month.
+    """
+    rows = connection.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(:table)"
+        ),
+        {"table": table},
+    )
+    pattern = re.compile(rf"^{table}_p(\d{{4}})(\d{{2}})$")
+    partitions = {}
+    for (name,) in rows:
+        match = pattern.match(name)
+        if match:
+            partitions[date(int(match[1]), int(match[2]), 1)] = name
+    return partitions
+
+
+def create_partition(connection: Connection, table: str, month: date) -> str:
+    name = partition_name(table, month)
+    default = f"{table}_default"
+    bounds = f"FOR VALUES FROM ('{month}') TO ('{add_months(month, 1)}')"
+    month_rows = {"start": month, "end": add_months(month, 1)}
+
+    in_default = connection.execute(
+        text(
+            f"SELECT EXISTS (SELECT 1 FROM {default} "
+            "WHERE inserted_at >= :start AND inserted_at < :end)"
+        ),
+        month_rows,
+    ).scalar()
+    if not in_default:
+        connection.execute(text(f"CREATE TABLE {name} PARTITION OF {table} {bounds}"))
+        return name
+
+    # The month's rows went to the default partition while it had none, and
+    # Postgres will not create a partition whose rows are in the default one:
+    # move them into a new table first, then attach it.
+    logger.warning(f"Moving rows of {name} out of {default}")
+    connection.execute(
+        text(
+            f"CREATE TABLE {name} "
+            f"(LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+    )
+    connection.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {default} "
+            "WHERE inserted_at >= :start AND inserted_at < :end RETURNING *) "
+            f"INSERT INTO {name} SELECT * FROM moved"
+        ),
+        month_rows,
+    )
+    connection.execute(text(f"ALTER TABLE {table} ATTACH PARTITION {name} {bounds}"))
+    return name
+
+
+def drop_expired_partitions(
+    connection: Connection,
+    table: str,
+    partitions: dict[date, str],
+    cutoff: datetime,
+    lock_timeout_ms: int = settings.LOG_PARTITION_LOCK_TIMEOUT_MS,
+) -> list[str]:
+    """
+    Detaches and drops the partitions whose whole month is older than `cutoff`,
+    and deletes older rows from the default partition. `connection` must be in
+    autocommit mode, so each statement commits on its own.
+
+    DETACH ... CONCURRENTLY never blocks queries on the parent, but Postgres
+    refuses it while the table has a default partition, as the log tables do.
+    A plain DETACH takes an ACCESS EXCLUSIVE lock on the parent for as long as
+    it runs, which is a catalog change only; it waits at most `lock_timeout_ms`
+    for the lock so it never queues log inserts behind a long query. A partition
+    that cannot be detached in time is left for the next run. Dropping happens
+    after the detach, when the partition is a table of its own.
+    """
+    concurrently = not has_default_partition(connection, table)
+    dropped = []
+    connection.execute(text(f"SET lock_timeout = {int(lock_timeout_ms)}"))
+    try:
+        for month, name in sorted(partitions.items()):
+            if add_months(month, 1) > cutoff.date():
+                break
+            try:
+                connection.execute(
+                    text(
+                        f"ALTER TABLE {table} DETACH PARTITION {name}"
+                        + (" CONCURRENTLY" if concurrently else "")
+                    )
+                )
+            except OperationalError as e:
+                logger.warning(f"Could not detach {name}, retrying next run: {e}")
+                break
+            connection.execute(text(f"DROP TABLE {name}"))
+            dropped.append(name)
+    finally:
+        connection.execute(text("RESET lock_timeout"))
+
+    connection.execute(
+        text(f"DELETE FROM {table}_default WHERE inserted_at < :cutoff"),
+        {"cutoff": cutoff},
+    )
+    return dropped
+
+
+def maintain_partitions(
+    bind: Engine = engine,
+    current_time: datetime | None = None,
+    months_ahead: int = settings.LOG_PARTITION_MONTHS_AHEAD,
+    retention_days: int = settings.LOG_RETENTION_DAYS,
+) -> dict[str, list[str]]:
+    current_time = current_time or now()
+    current_month = current_time.date().replace(day=1)
+    created, dropped = [], []
+    partitions_by_table = {}
+
+    # New partitions, and rows moved out of the default ones, commit together.
+    with bind.begin() as connection:
+        for table in LOG_TABLES:
+            if not is_partitioned(connection, table):
+                logger.warning(
+                    f"{table} is not partitioned; run the migrations first"
+                )
+                continue
+
+            partitions = list_partitions(connection, table)
+            for offset in range(max(0, months_ahead) + 1):
+                month = add_months(current_month, offset)
+                if month not in partitions:
+                    partitions[month] = create_partition(connection, table, month)
+                    created.append(partitions[month])
+            partitions_by_table[table] = partitions
+
+    if retention_days > 0 and partitions_by_table:
+        cutoff = current_time - timedelta(days=retention_days)
+        with bind.connect() as connection:
+            connection.execution_options(isolation_level="AUTOCOMMIT")
+            for table, partitions in partitions_by_table.items():
+                dropped.extend(
+                    drop_expired_partitions(connection, table, partitions, cutoff)
+                )
+
+    return {"created": created, "dropped": dropped}
+
+
+def main() -> None:
+    result = maintain_partitions()
+    logger.info(
+        f"Log partitions created: {result['created'] or 'none'}; "
+        f"dropped: {result['dropped'] or 'none'}"
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,239 @@
+"""
+Background writer for request and validator logs.
+
+With REQUEST_LOG_WRITE_MODE=write_once the route builds each request's logs in
+memory (see `app.crud.log_buffer`) and inserts them with `insert_logs_async`
+when the request is done. With REQUEST_LOG_WRITE_MODE=background it hands them to
+`log_writer` instead. A background
+thread collects them until LOG_WRITER_BATCH_SIZE requests are queued or
+LOG_WRITER_FLUSH_INTERVAL_MS has passed and inserts the batch with one INSERT
+per table in one transaction.
+
+The queue holds at most LOG_WRITER_QUEUE_SIZE requests. When it is full a
+request waits up to LOG_WRITER_ENQUEUE_TIMEOUT_MS for room and then writes its
+own logs, so a slow database slows requests down instead of losing logs.
+"""
+import logging
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable, Sequence
+from typing import NamedTuple
+
+from sqlalchemy import insert
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.core.db import engine
+from app.models.logging.request_log import RequestLog
+from app.models.logging.validator_log import ValidatorLog
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class LogEntry(NamedTuple):
+    request_log: RequestLog
+    validator_logs: list[ValidatorLog]
+
+
+def insert_logs(
+    entries: Sequence[LogEntry], session: Session | None = None
+) -> None:
+    """
+    Inserts the logs of several requests in one transaction with one INSERT per
+    table, request logs first since validator logs reference them. Nothing is
+    read back. Uses `session` when given, otherwise a session of its own.
+    """
+    if session is None:
+        with Session(engine) as own_session:
+            insert_logs(entries, own_session)
+        return
+
+    request_rows, validator_rows = _rows(entries)
+    if request_rows:
+        session.execute(insert(RequestLog), request_rows)
+    if validator_rows:
+        session.execute(insert(ValidatorLog), validator_rows)
+    session.commit()
+
+
+async def insert_logs_async(
+    entries: Sequence[LogEntry], session: AsyncSession
+) -> None:
+    """
+    `insert_logs` for async routes, on their AsyncSession.
+    """
+    request_rows, validator_rows = _rows(entries)
+    if request_rows:
+        await session.execute(insert(RequestLog), request_rows)
+    if validator_rows:
+        await session.execute(insert(ValidatorLog), validator_rows)
+    await session.commit()
+
+
+def _rows(entries: Sequence[LogEntry]) -> tuple[list[dict], list[dict]]:
+    request_rows = [entry.request_log.model_dump() for entry in entries]
+    validator_rows = [
+        log.model_dump() for entry in entries for log in entry.validator_logs
+    ]
+    return request_rows, validator_rows
+
+
+class LogWriter:
+    def __init__(
+        self,
+        max_queue_size: int,
+        batch_size: int,
+        flush_interval_ms: float,
+        enqueue_timeout_ms: float,
+        write: Callable[[Sequence[LogEntry]], None] = insert_logs,
+    ):
+        self.max_queue_size = max(1, max_queue_size)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.0, flush_interval_ms) / 1000
+        self.enqueue_timeout = max(0.0, enqueue_timeout_ms) / 1000
+        self.write = write
+        self._lock = threading.Lock()
+        self._queue: queue.Queue | None = None
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self._closed = False
+        self.batches = 0
+        self.written = 0
+        self.written_inline = 0
+        self.failed = 0
+
+    def submit(self, request_log: RequestLog, validator_logs: list[ValidatorLog]):
+        entry = LogEntry(request_log, list(validator_logs))
+        if not self._closed:
+            try:
+                self._ensure_worker().put(entry, timeout=self.enqueue_timeout)
+                return
+            except queue.Full:
+                logger.warning("Log writer queue is full; writing logs inline")
+
+        self._write([entry])
+        with self._lock:
+            self.written_inline += 1
+
+    def drain(self, timeout: float | None = None) -> None:
+        """
+        Writes everything still queued and stops the writer thread. Logs
+        submitted afterwards are written inline.
+        """
+        with self._lock:
+            self._closed = True
+            thread, pending = self._thread, self._queue
+            if self._pid != os.getpid():
+                thread = None
+            self._thread = None
+
+        if thread is None:
+            return
+        pending.put(_STOP)
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.warning(f"Log writer did not drain within {timeout}s")
+            return
+
+        # Requests that raced with the shutdown may have queued after the stop.
+        leftover = []
+        while True:
+            try:
+                entry = pending.get_nowait()
+            except queue.Empty:
+                break
+            if entry is not _STOP:
+                leftover.append(entry)
+        if leftover:
+            self._write(leftover)
+
+    def stats(self) -> dict:
+        return {
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue_size": self.max_queue_size,
+            "batches": self.batches,
+            "written": self.written,
+            "written_inline": self.written_inline,
+            "failed": self.failed,
+        }
+
+    def _ensure_worker(self) -> queue.Queue:
+        pid = os.getpid()
+        if self._pid == pid and self._thread is not None:
+            return self._queue
+
+        with self._lock:
+            if self._pid != pid or self._thread is None:
+                # A forked worker starts with its own, empty queue.
+                self._queue = queue.Queue(maxsize=self.max_queue_size)
+                self._thread = threading.Thread(
+                    target=self._run,
+                    args=(self._queue,),
+                    name="log-writer",
+                    daemon=True,
+                )
+                self._thread.start()
+                self._pid = pid
+        return self._queue
+
+    def _collect(self, pending: queue.Queue) -> tuple[list, bool]:
+        first = pending.get()
+        if first is _STOP:
+            return [], True
+
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                entry = (
+                    pending.get(timeout=remaining)
+                    if remaining > 0
+                    else pending.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if entry is _STOP:
+                return batch, True
+            batch.append(entry)
+        return batch, False
+
+    def _run(self, pending: queue.Queue) -> None:
+        stopping = False
+        while not stopping:
+            batch, stopping = self._collect(pending)
+            if batch:
+                self._write(batch)
+                with self._lock:
+                    self.batches += 1
+
+    def _write(self, entries: list) -> None:
+        try:
+            self.write(entries)
+        except Exception as e:
+            if len(entries) == 1:
+                logger.error(f"Failed to write request logs: {e}")
+                with self._lock:
+                    self.failed += 1
+                return
+            # Retry one request at a time so one bad row does not lose the batch.
+            logger.warning(f"Batched log write failed, retrying per request: {e}")
+            for entry in entries:
+                self._write([entry])
+            return
+
+        with self._lock:
+            self.written += len(entries)
+
+
+log_writer = LogWriter(
+    max_queue_size=settings.LOG_WRITER_QUEUE_SIZE,
+    batch_size=settings.LOG_WRITER_BATCH_SIZE,
+    flush_interval_ms=settings.LOG_WRITER_FLUSH_INTERVAL_MS,
+    enqueue_timeout_ms=settings.LOG_WRITER_ENQUEUE_TIMEOUT_MS,
+)
@@ -0,0 +1,355 @@
+"""
+In-house execution of a validator list.
+
+`ValidatorExecutor` runs our registered validators without a guardrails Guard:
+no call history, iteration or log objects and no telemetry, just one typed
+`ValidatorRun` per validator. Guard remains available as a compatibility mode.
+
+- EXCEPTION validators cannot change the text. Those configured before the
+  first validator that can (FIX or a custom action) see the input text either
+  way, so they run first, cheapest first by measured cost, and the first failure
+  ends the request without paying for the rest.
+- Sequential mode then runs the other validators in order, each on the text
+  fixed by the ones before it, as a Guard does. An EXCEPTION validator after a
+  fixing one therefore checks the fixed text, and its failure ends the request.
+- Parallel mode runs them concurrently on the original text and merges their
+  fixes: each FIX result is turned into edits of the original text (see
+  `text_edits`), and the edits of all validators are merged and applied in one
+  pass. A list with a validator that declares `requires_previous_fix`, or with
+  an EXCEPTION validator after a fixing one, runs sequentially.
+
+Lists with an on_fail action the executor does not implement run on the Guard.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from guardrails import OnFailAction
+from guardrails.validators import FailResult, ValidationResult, Validator
+
+from app.core.config import settings
+from app.core.validators.utils.text_edits import (
+    TextEdit,
+    apply_edits,
+    diff_edits,
+    merge_edits,
+)
+
+# on_fail actions the executor implements; the others need a Guard.
+SUPPORTED_ON_FAIL_ACTIONS = {
+    OnFailAction.FIX,
+    OnFailAction.EXCEPTION,
+    OnFailAction.NOOP,
+    "custom",
+}
+
+# on_fail actions that can change the text seen by the validators after them
+FIXING_ON_FAIL_ACTIONS = {OnFailAction.FIX, "custom"}
+
+
+@dataclass
+class ValidatorRun:
+    validator_name: str
+    value_before_validation: Any
+    value_after_validation: Any
+    validation_result: ValidationResult
+    duration_ms: float = 0.0
+    # edits of value_before_validation made by the validator's fix
+    spans: list[TextEdit] = field(default_factory=list)
+
+    @property
+    def outcome(self) -> str:
+        return self.validation_result.outcome
+
+    @property
+    def fix_value(self) -> Any:
+        if isinstance(self.validation_result, FailResult):
+            return self.validation_result.fix_value
+        return None
+
+
+@dataclass
+class ExecutionResult:
+    validated_output: str | None
+    error: str | None = None
+    runs: list[ValidatorRun] = field(default_factory=list)
+
+
+def runs_from_guard(guard) -> list[ValidatorRun]:
+    """
+    Validator runs of the guard's last call, read from its history.
+    """
+    history = getattr(guard, "history", None)
+    if not history:
+        return []
+
+    last_call = getattr(history, "last", None)
+    if not last_call or not getattr(last_call, "iterations", None):
+        return []
+
+    outputs = getattr(last_call.iterations[-1], "outputs", None)
+    if not outputs or not getattr(outputs, "validator_logs", None):
+        return []
+
+    runs = []
+    for log in outputs.validator_logs:
+        start_time = getattr(log, "start_time", None)
+        end_time = getattr(log, "end_time", None)
+        runs.append(
+            ValidatorRun(
+                validator_name=log.validator_name,
+                value_before_validation=log.value_before_validation,
+                value_after_validation=log.value_after_validation,
+                validation_result=log.validation_result,
+                duration_ms=(
+                    (end_time - start_time).total_seconds() * 1000
+                    if start_time and end_time
+                    else 0.0
+                ),
+            )
+        )
+    return runs
+
+
+class ValidatorCostTracker:
+    """
+    Exponentially weighted moving average of each validator's run time, keyed by
+    validator name. Validators without measurements sort first so they get one.
+    """
+
+    def __init__(self, alpha: float = 0.2):
+        self.alpha = alpha
+        self._costs: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, validator: Validator, seconds: float) -> None:
+        name = validator.rail_alias
+        with self._lock:
+            previous = self._costs.get(name)
+            self._costs[name] = (
+                seconds
+                if previous is None
+                else previous + self.alpha * (seconds - previous)
+            )
+
+    def estimate(self, validator: Validator) -> float:
+        return self._costs.get(validator.rail_alias, 0.0)
+
+    def order(self, validators: Sequence[Validator]) -> list[Validator]:
+        # sorted() is stable, so equal costs keep the configured order.
+        return sorted(validators, key=self.estimate)
+
+    def stats(self) -> dict:
+        """
+        Estimated run time of each validator, in milliseconds.
+        """
+        with self._lock:
+            return {name: cost * 1000 for name, cost in self._costs.items()}
+
+
+class ValidatorExecutor:
+    """
+    Runs the validators of one request. In parallel mode they share a thread
+    pool with all requests; the first validator runs on the calling thread, so
+    a request holds at most `len(validators) - 1` pool threads.
+    """
+
+    def __init__(self, max_workers: int, costs: ValidatorCostTracker | None = None):
+        self.max_workers = max(1, max_workers)
+        self.costs = costs or ValidatorCostTracker()
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._pid: int | None = None
+
+    @staticmethod
+    def supports(validators: Sequence[Validator]) -> bool:
+        return all(
+            validator.on_fail_descriptor in SUPPORTED_ON_FAIL_ACTIONS
+            for validator in validators
+        )
+
+    @staticmethod
+    def can_parallelize(validators: Sequence[Validator]) -> bool:
+        return not any(
+            getattr(validator, "requires_previous_fix", False)
+            for validator in validators
+        )
+
+    def run(
+        self,
+        validators: Sequence[Validator],
+        value: str,
+        metadata: dict = None,
+        parallel: bool = False,
+    ) -> ExecutionResult:
+        metadata = metadata or {}
+        runs = []
+
+        first_fixing = next(
+            (
+                index
+                for index, validator in enumerate(validators)
+                if validator.on_fail_descriptor in FIXING_ON_FAIL_ACTIONS
+            ),
+            len(validators),
+        )
+        blocking = [
+            validator
+            for validator in validators[:first_fixing]
+            if validator.on_fail_descriptor == OnFailAction.EXCEPTION
+        ]
+        for validator in self.costs.order(blocking):
+            run = self._run_validator(validator, value, metadata)
+            runs.append(run)
+            if isinstance(run.validation_result, FailResult):
+                return self._blocked(run, runs)
+
+        remaining = [
+            (index, validator)
+            for index, validator in enumerate(validators)
+            if index >= first_fixing
+            or validator.on_fail_descriptor != OnFailAction.EXCEPTION
+        ]
+        if (
+            parallel
+            and self.can_parallelize(validators)
+            and not any(
+                validator.on_fail_descriptor == OnFailAction.EXCEPTION
+                for _, validator in remaining
+            )
+        ):
+            return self._run_parallel(remaining, value, metadata, runs)
+        return self._run_sequential(remaining, value, metadata, runs)
+
+    @staticmethod
+    def _blocked(run: ValidatorRun, runs: list) -> ExecutionResult:
+        run.value_after_validation = None
+        return ExecutionResult(
+            validated_output=None,
+            error=(
+                "Validation failed for field with errors: "
+                f"{run.validation_result.error_message}"
+            ),
+            runs=runs,
+        )
+
+    def _run_sequential(self, remaining, value: str, metadata: dict, runs: list):
+        for _, validator in remaining:
+            run = self._run_validator(validator, value, metadata)
+            runs.append(run)
+            if not isinstance(run.validation_result, FailResult):
+                continue
+
+            action = validator.on_fail_descriptor
+            if action == OnFailAction.EXCEPTION:
+                return self._blocked(run, runs)
+            if action == OnFailAction.FIX:
+                if run.fix_value is None:
+                    run.value_after_validation = None
+                    return ExecutionResult(
+                        validated_output=None,
+                        error=run.validation_result.error_message,
+                        runs=runs,
+                    )
+                run.spans = diff_edits(value, run.fix_value)
+                value = run.value_after_validation = run.fix_value
+            elif action == "custom":
+                value = run.value_after_validation = validator.on_fail_method(
+                    value, run.validation_result
+                )
+
+        return ExecutionResult(validated_output=value, runs=runs)
+
+    def _run_parallel(self, fixing, value: str, metadata: dict, runs: list):
+        validator_runs = self._run_all(
+            [validator for _, validator in fixing], value, metadata
+        )
+
+        edits = []
+        for (index, validator), run in zip(fixing, validator_runs, strict=True):
+            runs.append(run)
+            if not isinstance(run.validation_result, FailResult):
+                continue
+
+            action = validator.on_fail_descriptor
+            if action == OnFailAction.FIX:
+                if run.fix_value is None:
+                    run.value_after_validation = None
+                    return ExecutionResult(
+                        validated_output=None,
+                        error=run.validation_result.error_message,
+                        runs=runs,
+                    )
+                run.value_after_validation = run.fix_value
+                run.spans = diff_edits(value, run.fix_value, source=index)
+                edits.extend(run.spans)
+            elif action == "custom":
+                # A custom action rewrites the whole text; in sequence the later
+                # validators would only have seen the rewritten text.
+                run.value_after_validation = validator.on_fail_method(
+                    value, run.validation_result
+                )
+                return ExecutionResult(
+                    validated_output=run.value_after_validation, runs=runs
+                )
+
+        return ExecutionResult(
+            validated_output=apply_edits(value, merge_edits(edits)), runs=runs
+        )
+
+    def _run_validator(
+        self, validator: Validator, value: str, metadata: dict
+    ) -> ValidatorRun:
+        # _validate rather than validate: the public method only adds guardrails
+        # telemetry around the same call.
+        start = time.perf_counter()
+        result = validator._validate(value, metadata)
+        elapsed = time.perf_counter() - start
+        self.costs.record(validator, elapsed)
+        return ValidatorRun(
+            validator_name=validator.rail_alias,
+            value_before_validation=value,
+            value_after_validation=value,
+            validation_result=result,
+            duration_ms=elapsed * 1000,
+        )
+
+    def _run_all(
+        self, validators: Sequence[Validator], value: str, metadata: dict
+    ) -> list[ValidatorRun]:
+        if not validators:
+            return []
+
+        executor = self._get_executor()
+        futures = [
+            executor.submit(self._run_validator, validator, value, metadata)
+            for validator in validators[1:]
+        ]
+        try:
+            first = self._run_validator(validators[0], value, metadata)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        return [first, *(future.result() for future in futures)]
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        pid = os.getpid()
+        if self._executor is None or self._pid != pid:
+            with self._lock:
+                if self._executor is None or self._pid != pid:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="validator",
+                    )
+                    self._pid = pid
+        return self._executor
+
+
+validator_executor = ValidatorExecutor(max_workers=settings.VALIDATOR_EXECUTION_WORKERS)
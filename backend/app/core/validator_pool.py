@@ -0,0 +1,265 @@
+"""
+Optional process-pool backend for CPU-heavy validators.
+
+Validators normally run inside the request thread, so regex and spaCy work from
+every in-flight request shares one GIL per worker. With VALIDATOR_PROCESS_POOL_SIZE
+set, validators of the types in VALIDATOR_PROCESS_POOL_TYPES are replaced in the
+guard by a proxy that sends each call to a pool of processes. Each pool process
+warms and caches its own validators (and models), in-flight calls are bounded by
+VALIDATOR_PROCESS_POOL_MAX_PENDING and each call is bounded by
+VALIDATOR_PROCESS_POOL_TIMEOUT_SECONDS.
+
+Every server worker starts its own pool from the app lifespan (`start`), so a
+prefork master never holds one, and the pool processes have finished their
+warm-up before the worker serves its first request.
+"""
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from guardrails.hub import BanList
+from guardrails.validators import (
+    ValidationResult,
+    Validator,
+    register_validator,
+)
+from pydantic import TypeAdapter
+
+from app.core.config import settings
+from app.core.enum import ValidatorType
+from app.core.validators.config.base_validator_config import BaseValidatorConfig
+from app.core.validators.gender_assumption_bias import GenderAssumptionBias
+from app.core.validators.lexical_slur import LexicalSlur
+from app.core.validators.pii_remover import PIIRemover
+
+logger = logging.getLogger(__name__)
+
+# Validator class built for each config type; the proxy reports its name.
+VALIDATOR_CLASSES = {
+    ValidatorType.BanList.value: BanList,
+    ValidatorType.GenderAssumptionBias.value: GenderAssumptionBias,
+    ValidatorType.LexicalSlur.value: LexicalSlur,
+    ValidatorType.PIIRemover.value: PIIRemover,
+}
+
+_in_pool_worker = False
+
+
+def _init_pool_worker(validator_types: list[str], ready) -> None:
+    global _in_pool_worker
+    _in_pool_worker = True
+
+    from app.core.warmup import validator_warmup
+
+    validator_warmup.run(
+        [
+            ValidatorType(validator_type)
+            for validator_type in validator_types
+            if validator_type in ValidatorType._value2member_map_
+        ]
+    )
+    ready.put(validator_warmup.is_ready())
+
+
+def _spawn_pool_worker() -> None:
+    # Submitted once per process at start-up: each submission to a pool without
+    # an idle process spawns one, so the pool is full before the first call.
+    pass
+
+
+def _validate_in_pool_worker(
+    config_data: dict, value: Any, metadata: dict
+) -> ValidationResult:
+    # Imported here: the controller imports this module to decide what to offload.
+    from app.core.guardrail_controller import validator_cache
+    from app.schemas.guardrail_config import ValidatorConfigItem
+
+    config = TypeAdapter(ValidatorConfigItem).validate_python(config_data)
+    (validator,) = validator_cache.get_or_build([config])
+    return validator.validate(value, metadata)
+
+
+class ValidatorPool:
+    def __init__(
+        self,
+        size: int,
+        validator_types: list[str],
+        max_pending: int,
+        timeout: float,
+        ban_list_min_words: int,
+    ):
+        self.size = size
+        self.validator_types = list(validator_types)
+        self.max_pending = max(1, max_pending)
+        self.timeout = timeout
+        self.ban_list_min_words = ban_list_min_words
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._slots: threading.BoundedSemaphore | None = None
+        self._ready = None
+        self._pid: int | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0 and not _in_pool_worker
+
+    def should_offload(self, config) -> bool:
+        if not self.enabled or not isinstance(config, BaseValidatorConfig):
+            return False
+        validator_type = getattr(config, "type", None)
+        if (
+            validator_type not in self.validator_types
+            or validator_type not in VALIDATOR_CLASSES
+        ):
+            return False
+        if validator_type == ValidatorType.BanList.value:
+            return len(config.banned_words or []) >= self.ban_list_min_words
+        return True
+
+    def start(self, timeout: float) -> None:
+        """
+        Starts every pool process of this server worker and waits until each has
+        run its initializer, so process start-up and warm-up do not count against
+        the timeout of the first calls. Raises TimeoutError if the processes are
+        not up within `timeout` seconds, and RuntimeError if one failed to warm up.
+        """
+        _, _, ready = self._ensure_executor()
+        deadline = time.monotonic() + timeout
+        for started in range(self.size):
+            try:
+                warmed = ready.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                raise TimeoutError(
+                    f"Validator pool started {started} of {self.size} processes "
+                    f"within {timeout}s"
+                )
+            if not warmed:
+                raise RuntimeError("Validator pool process failed to warm up")
+        logger.info(f"Validator pool started {self.size} processes")
+
+    def submit(self, config: BaseValidatorConfig, value: Any, metadata: dict):
+        """
+        Runs the validator for `config` in a pool process and returns its result.
+        Raises TimeoutError when the call does not get a slot and finish within
+        the pool timeout; waiting for the slot counts against the same deadline.
+        """
+        deadline = time.monotonic() + self.timeout
+        executor, slots, _ = self._ensure_executor()
+        if not slots.acquire(timeout=max(0.0, deadline - time.monotonic())):
+            raise TimeoutError(
+                f"Validator pool is busy ({self.max_pending} calls pending)"
+            )
+
+        try:
+            future = executor.submit(
+                _validate_in_pool_worker,
+                config.model_dump(mode="json"),
+                value,
+                metadata or {},
+            )
+        except BrokenProcessPool:
+            slots.release()
+            self._reset(executor)
+            raise
+        except BaseException:
+            slots.release()
+            raise
+        # The slot is held until the process is done, not until the caller gives up.
+        future.add_done_callback(lambda _: slots.release())
+
+        try:
+            return future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            future.cancel()
+            raise TimeoutError(
+                f"Validator {config.type} timed out after {self.timeout}s"
+            )
+        except BrokenProcessPool:
+            self._reset(executor)
+            raise
+
+    def proxy(self, config: BaseValidatorConfig) -> "ProcessPoolValidator":
+        return ProcessPoolValidator(
+            config,
+            rail_alias=VALIDATOR_CLASSES[config.type].rail_alias,
+            pool=self,
+            on_fail=config.resolve_on_fail(),
+        )
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+            self._slots = None
+            self._ready = None
+        if executor is not None and self._pid == os.getpid():
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _ensure_executor(
+        self,
+    ) -> tuple[ProcessPoolExecutor, threading.BoundedSemaphore, Any]:
+        pid = os.getpid()
+        with self._lock:
+            # A forked server worker must not reuse the parent's pool.
+            if self._executor is None or self._pid != pid:
+                context = multiprocessing.get_context("spawn")
+                # Each process reports here once its initializer has run.
+                self._ready = context.Queue()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.size,
+                    mp_context=context,
+                    initializer=_init_pool_worker,
+                    initargs=(self.validator_types, self._ready),
+                )
+                for _ in range(self.size):
+                    self._executor.submit(_spawn_pool_worker)
+                self._slots = threading.BoundedSemaphore(self.max_pending)
+                self._pid = pid
+            return self._executor, self._slots, self._ready
+
+    def _reset(self, executor: ProcessPoolExecutor) -> None:
+        logger.warning("Validator pool process died; starting a new pool")
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+@register_validator(name="process-pool-validator", data_type="string")
+class ProcessPoolValidator(Validator):
+    """
+    Stands in for a validator that runs in the validator pool. It reports the
+    wrapped validator's name and applies the same on_fail action to the result.
+    """
+
+    def __init__(
+        self,
+        config: BaseValidatorConfig,
+        rail_alias: str,
+        pool: ValidatorPool | None = None,
+        on_fail: Callable | None = None,
+    ):
+        super().__init__(on_fail=on_fail)
+        self.config = config
+        self.rail_alias = rail_alias
+        self.pool = pool or validator_pool
+
+    def _validate(self, value: Any, metadata: dict = None) -> ValidationResult:
+        return self.pool.submit(self.config, value, metadata)
+
+
+validator_pool = ValidatorPool(
+    size=settings.VALIDATOR_PROCESS_POOL_SIZE,
+    validator_types=settings.VALIDATOR_PROCESS_POOL_TYPES,
+    max_pending=settings.VALIDATOR_PROCESS_POOL_MAX_PENDING,
+    timeout=settings.VALIDATOR_PROCESS_POOL_TIMEOUT_SECONDS,
+    ban_list_min_words=settings.VALIDATOR_PROCESS_POOL_BAN_LIST_MIN_WORDS,
+)
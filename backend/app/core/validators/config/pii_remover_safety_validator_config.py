@@ -1,14 +1,19 @@
 from __future__ import annotations
-from typing import List, Literal, Optional
+from typing import Annotated, List, Literal, Optional
 
-from app.core.validators.pii_remover import PIIRemover
+from pydantic import Field
+
+from app.core.validators.pii_remover import DEFAULT_THRESHOLD, PIIRemover
 from app.core.validators.config.base_validator_config import BaseValidatorConfig
 
+Score = Annotated[float, Field(ge=0.0, le=1.0)]
+
 
 class PIIRemoverSafetyValidatorConfig(BaseValidatorConfig):
     type: Literal["pii_remover"]
     entity_types: Optional[List[str]] = None  # list of PII entity types to remove
-    threshold: float = 0.5  # confidence threshold for PII detection
+    # confidence threshold for PII detection, globally or per entity type
+    threshold: Score | dict[str, Score] = DEFAULT_THRESHOLD
 
     def build(self):
         return PIIRemover(
@@ -1,7 +1,6 @@
-import re
+import threading
 from typing import Callable, List, Optional
 
-import pandas
 from guardrails import OnFailAction
 from guardrails.validators import (
     FailResult,
@@ -11,8 +10,9 @@ from guardrails.validators import (
     Validator,
 )
 
-from app.core.config import Settings
 from app.core.enum import BiasCategories
+from app.core.validators.utils.bias_lexicon import BiasLexicon
+from app.core.validators.utils.lexicons import load_gender_bias_rows
 
 
 @register_validator(name="gender-assumption-bias", data_type="string")
@@ -21,32 +21,23 @@ class GenderAssumptionBias(Validator):
     Validate text for the presence of gender assumption in LLM generated outputs.
     """
 
+    # frozenset of category values -> (rows the lexicon was built from, lexicon)
+    _LEXICON_CACHE: dict = {}
+    _LEXICON_LOCK = threading.Lock()
+
     def __init__(
         self,
         categories: Optional[List[BiasCategories]] = None,
         on_fail: Optional[Callable] = OnFailAction.FIX,
     ):
         self.categories = categories or [BiasCategories.All]
-        self.gender_bias_list = self.load_gender_bias_list(self.categories)
+        self.lexicon = self._get_lexicon(self.categories)
         super().__init__(on_fail=on_fail)
 
     def _validate(self, value: str, metadata: dict = None) -> ValidationResult:
-        detected_biased_words = []
-        bias_check = False
-
-        for entry in self.gender_bias_list:
-            word = entry["word"]
-            neutral_term = entry["neutral-term"]
-
-            pattern = rf"\b{re.escape(word)}\b"
-
-            if re.search(pattern, value, flags=re.IGNORECASE):
-                detected_biased_words.append(word)
-
-                value = re.sub(pattern, neutral_term, value, flags=re.IGNORECASE)
-                bias_check = True
+        detected_biased_words, value = self.lexicon.apply(value)
 
-        if bias_check:
+        if detected_biased_words:
             return FailResult(
                 error_message=f"Detected gender assumption bias: {detected_biased_words}",
                 fix_value=value,
@@ -54,30 +45,53 @@ class GenderAssumptionBias(Validator):
 
         return PassResult(value=value)
 
-    def load_gender_bias_list(self, categories):
-        file_path = Settings.GENDER_BIAS_LIST_FILEPATH
+    @classmethod
+    def _get_lexicon(cls, categories) -> BiasLexicon:
+        """
+        Compiled lexicons are shared across instances and threads per category set.
+        """
+        cache_key = frozenset(BiasCategories(category).value for category in categories)
+        rows = load_gender_bias_rows()
+
+        with cls._LEXICON_LOCK:
+            cached = cls._LEXICON_CACHE.get(cache_key)
+            if cached is not None:
+                source, lexicon = cached
+                if source is rows or source == rows:
+                    return lexicon
+
+            lexicon = BiasLexicon(cls.load_gender_bias_list(categories, rows))
+            cls._LEXICON_CACHE[cache_key] = (rows, lexicon)
+            return lexicon
+
+    @classmethod
+    def cache_info(cls) -> dict:
+        """
+        Number of cached lexicons and their approximate memory footprint.
+        """
+        with cls._LEXICON_LOCK:
+            lexicons = {
+                ",".join(sorted(categories)): lexicon.memory_bytes()
+                for categories, (_, lexicon) in cls._LEXICON_CACHE.items()
+            }
+        return {
+            "entries": len(lexicons),
+            "memory_bytes": sum(lexicons.values()),
+            "lexicons": lexicons,
+        }
+
+    @staticmethod
+    def load_gender_bias_list(categories, rows=None):
+        """
+        Rows of the requested categories, each once and in lexicon order, so
+        overlapping selections such as [Generic, All] do not match twice.
+        """
         neutral_term_col = "neutral-term"
-        gender_bias_list = []
-
-        try:
-            df = pandas.read_csv(file_path)
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Gender bias file not found at {file_path}")
-        except Exception as e:
-            raise ValueError(f"Failed to load gender bias list from {file_path}: {e}")
-
-        df["word"] = df["word"].str.lower()
-        df[neutral_term_col] = df[neutral_term_col].str.lower()
-
-        for category in categories:
-            if category == BiasCategories.All:
-                temp = df
-            else:
-                temp = df[df["type"] == category.value]
-
-            rows = temp.to_dict(orient="records")
-            for row in rows:
-                gender_bias_list.append(
-                    {"word": row["word"], neutral_term_col: row[neutral_term_col]}
-                )
-        return gender_bias_list
+        rows = load_gender_bias_rows() if rows is None else rows
+        selected = {BiasCategories(category).value for category in categories}
+
+        return [
+            {"word": row["word"], neutral_term_col: row[neutral_term_col]}
+            for row in rows
+            if BiasCategories.All.value in selected or row["type"] in selected
+        ]
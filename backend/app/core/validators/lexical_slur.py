@@ -1,11 +1,11 @@
 import re
 import string
+import threading
 import unicodedata
 from typing import Callable, Optional
 
 import emoji
 import ftfy
-import pandas
 from guardrails import OnFailAction
 from guardrails.validators import (
     FailResult,
@@ -15,8 +15,19 @@ from guardrails.validators import (
     Validator,
 )
 
-from app.core.config import Settings
 from app.core.enum import SlurSeverity
+from app.core.validators.utils.lexicons import load_slur_list
+from app.core.validators.utils.text_normalization import (
+    normalize_with_offsets,
+    OffsetText,
+    redact_spans,
+)
+from app.core.validators.utils.word_matcher import WordMatcher
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+# Control characters are stripped by ftfy and "&" may start an HTML entity it
+# unescapes; anything outside printable ASCII may need the full pipeline.
+_NEEDS_FULL_NORMALIZATION = re.compile(r"[^\t\n\r\x20-\x7e]|&")
 
 
 @register_validator(name="lexical-slur", data_type="string")
@@ -26,6 +37,9 @@ class LexicalSlur(Validator):
     """
 
     _SLUR_CACHE: dict = {}
+    # (severity, languages) -> (slur list the matcher was built from, matcher)
+    _MATCHER_CACHE: dict = {}
+    _MATCHER_LOCK = threading.Lock()
 
     def __init__(
         self,
@@ -41,26 +55,58 @@ class LexicalSlur(Validator):
 
     def _validate(self, value: str, metadata: dict = None) -> ValidationResult:
         original_text = value
-        normalized_text = self.normalize_for_matching(value)
-        detected_slurs = []
-
-        for slur, pattern in self._slur_patterns:
-            if pattern.search(normalized_text):
-                detected_slurs.append(slur)
+        offset_text = None
+        if self.is_clean_ascii(value):
+            normalized_text = self.normalize_for_matching(value)
+        else:
+            # One pass of the full pipeline serves both matching and redaction.
+            offset_text = normalize_with_offsets(value)
+            normalized_text = offset_text.text
 
-        if not detected_slurs:
+        matches = self._slur_matcher.find_all(normalized_text)
+        if not matches:
             return PassResult(value=original_text)
 
-        redacted_text = normalized_text
-        for slur, pattern in self._slur_patterns:
-            if slur in detected_slurs:
-                redacted_text = pattern.sub("[REDACTED_SLUR]", redacted_text)
+        detected_slurs = self._slur_matcher.matched_words(matches)
+        redacted_text = self.redact_original(
+            original_text, normalized_text, matches, offset_text
+        )
 
         return FailResult(
             error_message=f"Mentioned toxic words: {', '.join(detected_slurs)}",
             fix_value=redacted_text,
         )
 
+    def redact_original(
+        self,
+        original_text: str,
+        normalized_text: str,
+        matches,
+        offset_text: OffsetText | None = None,
+    ):
+        """
+        Redacts matches found on the normalized text directly in the original text,
+        so characters outside the matched spans are returned unchanged.
+        `offset_text` is the detection pass's output; without it (clean ASCII
+        input) offsets are computed here, on the failure path, with the cheap
+        ASCII pipeline.
+        """
+        if offset_text is None:
+            offset_text = normalize_with_offsets(
+                original_text, clean_ascii=self.is_clean_ascii(original_text)
+            )
+        if offset_text.text != normalized_text:
+            # Should not happen; keep the redaction correct on the normalized text.
+            return self._slur_matcher.replace(
+                normalized_text, matches, "[REDACTED_SLUR]"
+            )
+
+        spans = [
+            offset_text.original_span(match.start, match.end)
+            for match in self._slur_matcher.select_non_overlapping(matches)
+        ]
+        return redact_spans(original_text, spans, "[REDACTED_SLUR]")
+
     def normalize_for_matching(self, text: str) -> str:
         """
         Normalize input text for detection:
@@ -69,13 +115,28 @@ class LexicalSlur(Validator):
         - normalize unicode (NFKC)
         - lowercase
         - normalize whitespace
+
+        Printable ASCII without HTML entities cannot contain emojis, mojibake or
+        NFKC-affected characters, so only the last two steps are run for it.
+        """
+        if self.is_clean_ascii(text):
+            return _WHITESPACE_PATTERN.sub(" ", text).strip().lower()
+        return self.normalize_full(text)
+
+    def normalize_full(self, text: str) -> str:
+        """
+        Runs every normalization stage regardless of the input.
         """
         text = self.remove_emojis(text)
         text = ftfy.fix_text(text)
         text = unicodedata.normalize("NFKC", text)
-        text = re.sub(r"\s+", " ", text).strip()
+        text = _WHITESPACE_PATTERN.sub(" ", text).strip()
         return text.lower()
 
+    @staticmethod
+    def is_clean_ascii(text: str) -> bool:
+        return text.isascii() and _NEEDS_FULL_NORMALIZATION.search(text) is None
+
     def remove_emojis(self, text):
         """
         Removed emojis from given string.
@@ -84,55 +145,53 @@ class LexicalSlur(Validator):
 
     def _compile_slur_patterns(self):
         """
-        Compile regex patterns for all slurs.
+        Build a single-pass matcher for all slurs.
         Uses Unicode-safe boundaries and longest-match-first ordering.
+        Matchers are shared across instances and threads per (severity, languages).
         """
-        self._slur_patterns = []
-
-        for slur in self.slur_list:
-            escaped = re.escape(slur)
-            pattern = rf"(?<!\w){escaped}(?!\w)"
-            compiled = re.compile(pattern, re.IGNORECASE)
-            self._slur_patterns.append((slur, compiled))
-
-        self._slur_patterns.sort(key=lambda x: len(x[0]), reverse=True)
-
-    def load_slur_list(self):
-        cache_key = (
+        cache_key = (self._severity_key(), tuple(self.languages))
+
+        with self._MATCHER_LOCK:
+            cached = self._MATCHER_CACHE.get(cache_key)
+            if cached is not None:
+                source, matcher = cached
+                if source is self.slur_list or source == self.slur_list:
+                    self._slur_matcher = matcher
+                    return
+
+            matcher = WordMatcher(self.slur_list)
+            self._MATCHER_CACHE[cache_key] = (self.slur_list, matcher)
+            self._slur_matcher = matcher
+
+    @classmethod
+    def cache_info(cls) -> dict:
+        """
+        Number of cached matchers and their approximate memory footprint.
+        """
+        with cls._MATCHER_LOCK:
+            matchers = {
+                f"{severity}:{','.join(languages)}": matcher.memory_bytes()
+                for (severity, languages), (_, matcher) in cls._MATCHER_CACHE.items()
+            }
+        return {
+            "entries": len(matchers),
+            "memory_bytes": sum(matchers.values()),
+            "matchers": matchers,
+        }
+
+    def _severity_key(self) -> str:
+        return (
             self.severity.value
             if hasattr(self.severity, "value")
             else str(self.severity)
         )
 
+    def load_slur_list(self):
+        cache_key = self._severity_key()
+
         if cache_key in self._SLUR_CACHE:
             return self._SLUR_CACHE[cache_key]
 
-        file_path = Settings.SLUR_LIST_FILEPATH
-
-        try:
-            df = pandas.read_csv(file_path)
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Slur list file not found at {file_path}")
-        except Exception as e:
-            raise ValueError(f"Failed to load slur list from {file_path}: {e}")
-
-        required_columns = ["label", "severity"]
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        if missing_columns:
-            raise ValueError(
-                f"Slur list CSV missing required columns: {missing_columns}"
-            )
-
-        df["label"] = df["label"].str.lower()
-
-        if self.severity == SlurSeverity.Low:
-            slurs = df[df["severity"].isin(["L", "M", "H"])]["label"].tolist()
-        elif self.severity == SlurSeverity.Medium:
-            slurs = df[df["severity"].isin(["M", "H"])]["label"].tolist()
-        elif self.severity == SlurSeverity.High:
-            slurs = df[df["severity"] == "H"]["label"].tolist()
-        else:
-            slurs = df["label"].tolist()
-
+        slurs = load_slur_list(cache_key)
         self._SLUR_CACHE[cache_key] = slurs
         return slurs
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import os
+from collections.abc import Mapping
 from typing import Callable, Optional
 
 from guardrails import OnFailAction
@@ -10,22 +11,15 @@ from guardrails.validators import (
     ValidationResult,
     Validator,
 )
-from presidio_analyzer import AnalyzerEngine
 from presidio_anonymizer import AnonymizerEngine
-from presidio_analyzer.predefined_recognizers.country_specific.india.in_aadhaar_recognizer import (
-    InAadhaarRecognizer,
-)
-from presidio_analyzer.predefined_recognizers.country_specific.india.in_pan_recognizer import (
-    InPanRecognizer,
-)
-from presidio_analyzer.predefined_recognizers.country_specific.india.in_passport_recognizer import (
-    InPassportRecognizer,
-)
-from presidio_analyzer.predefined_recognizers.country_specific.india.in_vehicle_registration_recognizer import (
-    InVehicleRegistrationRecognizer,
-)
-from presidio_analyzer.predefined_recognizers.country_specific.india.in_voter_recognizer import (
-    InVoterRecognizer,
+
+from app.core.config import settings
+from app.core.validators.utils.presidio_registry import get_analyzer
+from app.core.validators.utils.text_chunking import (
+    ChunkExecutor,
+    merge_spans,
+    split_text,
+    TextChunk,
 )
 
 ALL_ENTITY_TYPES = [
@@ -46,6 +40,10 @@ ALL_ENTITY_TYPES = [
     "IN_VOTER",
 ]
 
+DEFAULT_THRESHOLD = 0.5
+
+chunk_executor = ChunkExecutor(max_workers=settings.PII_CHUNK_WORKERS)
+
 
 @register_validator(name="pii-remover", data_type="string")
 class PIIRemover(Validator):
@@ -58,37 +56,82 @@ class PIIRemover(Validator):
     def __init__(
         self,
         entity_types=None,
-        threshold=0.5,
+        threshold: float | Mapping[str, float] = DEFAULT_THRESHOLD,
         on_fail: Optional[Callable] = OnFailAction.FIX,
     ):
         super().__init__(on_fail=on_fail)
 
         self.entity_types = entity_types or ALL_ENTITY_TYPES
         self.threshold = threshold
+        self.score_thresholds = self.resolve_thresholds(self.entity_types, threshold)
+        # The analyzer drops results below the lowest threshold; stricter
+        # per-entity thresholds are applied to what it returns.
+        self.score_threshold = min(self.score_thresholds.values(), default=0.0)
         self.on_fail = on_fail
+        self.max_chunk_chars = settings.PII_CHUNK_MAX_CHARS
+        self.chunk_overlap = settings.PII_CHUNK_OVERLAP_CHARS
         os.environ[
             "TOKENIZERS_PARALLELISM"
         ] = "false"  # Disables huggingface/tokenizers warning
 
-        self.analyzer = AnalyzerEngine()
-
-        if "IN_AADHAAR" in self.entity_types:
-            self.analyzer.registry.add_recognizer(InAadhaarRecognizer())
-        if "IN_PAN" in self.entity_types:
-            self.analyzer.registry.add_recognizer(InPanRecognizer())
-        if "IN_PASSPORT" in self.entity_types:
-            self.analyzer.registry.add_recognizer(InPassportRecognizer())
-        if "IN_VEHICLE_REGISTRATION" in self.entity_types:
-            self.analyzer.registry.add_recognizer(InVehicleRegistrationRecognizer())
-        if "IN_VOTER" in self.entity_types:
-            self.analyzer.registry.add_recognizer(InVoterRecognizer())
+        # Analyzers share one NLP engine and recognizer set per process.
+        self.analyzer = get_analyzer(self.entity_types, self.score_thresholds)
         self.anonymizer = AnonymizerEngine()
 
-    def _validate(self, value: str, metadata: dict = None) -> ValidationResult:
-        text = value
+    @staticmethod
+    def resolve_thresholds(
+        entity_types, threshold: float | Mapping[str, float]
+    ) -> dict[str, float]:
+        """
+        Per-entity score thresholds. A mapping sets thresholds for the entities it
+        names; the others keep DEFAULT_THRESHOLD.
+        """
+        if isinstance(threshold, Mapping):
+            return {
+                entity: threshold.get(entity, DEFAULT_THRESHOLD)
+                for entity in entity_types
+            }
+        return dict.fromkeys(entity_types, threshold)
+
+    def analyze(self, text: str) -> list:
+        """
+        Runs the analyzer on the text, or on overlapping chunks of it in parallel
+        when it is longer than `max_chunk_chars`, with spans in text offsets.
+        """
+        chunks = split_text(text, self.max_chunk_chars, self.chunk_overlap)
+        if len(chunks) == 1:
+            return self._analyze_chunk(chunks[0])
+        return merge_spans(
+            result
+            for results in chunk_executor.map(self._analyze_chunk, chunks)
+            for result in results
+        )
+
+    def _analyze_chunk(self, chunk: TextChunk) -> list:
         results = self.analyzer.analyze(
-            text=text, entities=self.entity_types, language="en"
+            text=chunk.text,
+            entities=self.entity_types,
+            language="en",
+            score_threshold=self.score_threshold,
         )
+        if chunk.start:
+            for result in results:
+                result.start += chunk.start
+                result.end += chunk.start
+        return results
+
+    def _validate(self, value: str, metadata: dict = None) -> ValidationResult:
+        text = value
+        results = self.analyze(text)
+        results = [
+            result
+            for result in results
+            if result.score
+            >= self.score_thresholds.get(result.entity_type, self.score_threshold)
+        ]
+        if not results:
+            return PassResult(value=text)
+
         anonymized = self.anonymizer.anonymize(text=text, analyzer_results=results)
         anonymized_text = anonymized.text
 
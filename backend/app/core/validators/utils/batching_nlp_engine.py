@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future
+
+from presidio_analyzer.nlp_engine import NlpArtifacts, NlpEngine
+
+logger = logging.getLogger(__name__)
+
+
+class BatchingNlpEngine(NlpEngine):
+    """
+    Presidio NLP engine that micro-batches `process_text` calls from concurrent
+    requests into one `process_batch` call on the wrapped engine.
+
+    A background thread waits for the first queued text, then keeps collecting
+    until `max_batch_size` texts are queued or `max_wait_ms` has passed, runs the
+    batch through spaCy's `nlp.pipe` and hands every caller its own artifacts.
+    A lone request therefore waits at most `max_wait_ms` extra.
+
+    The thread is started lazily and restarted after a fork, so an engine warmed
+    up in a pre-fork master keeps working in its workers.
+    """
+
+    def __init__(
+        self, engine: NlpEngine, max_batch_size: int = 16, max_wait_ms: float = 5.0
+    ):
+        self.engine = engine
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self._lock = threading.Lock()
+        self._queue: queue.Queue | None = None
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self.batches = 0
+        self.batched_texts = 0
+
+    def load(self) -> None:
+        self.engine.load()
+
+    def is_loaded(self) -> bool:
+        return self.engine.is_loaded()
+
+    def process_text(self, text: str, language: str) -> NlpArtifacts:
+        future: Future = Future()
+        self._ensure_worker().put((text, language, future))
+        return future.result()
+
+    def process_batch(
+        self,
+        texts: Iterable[str],
+        language: str,
+        batch_size: int = 1,
+        n_process: int = 1,
+        **kwargs,
+    ) -> Iterator[tuple[str, NlpArtifacts]]:
+        return self.engine.process_batch(
+            texts, language, batch_size=batch_size, n_process=n_process, **kwargs
+        )
+
+    def is_stopword(self, word: str, language: str) -> bool:
+        return self.engine.is_stopword(word, language)
+
+    def is_punct(self, word: str, language: str) -> bool:
+        return self.engine.is_punct(word, language)
+
+    def get_supported_entities(self) -> list[str]:
+        return self.engine.get_supported_entities()
+
+    def get_supported_languages(self) -> list[str]:
+        return self.engine.get_supported_languages()
+
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "texts": self.batched_texts,
+            "mean_batch_size": (
+                self.batched_texts / self.batches if self.batches else 0.0
+            ),
+        }
+
+    def _ensure_worker(self) -> queue.Queue:
+        pid = os.getpid()
+        if self._pid == pid and self._thread is not None:
+            return self._queue
+
+        with self._lock:
+            if self._pid != pid or self._thread is None:
+                self._queue = queue.Queue()
+                self._thread = threading.Thread(
+                    target=self._run,
+                    args=(self._queue,),
+                    name="nlp-micro-batcher",
+                    daemon=True,
+                )
+                self._thread.start()
+                self._pid = pid
+        return self._queue
+
+    def _collect(self, pending: queue.Queue) -> list:
+        batch = [pending.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(
+                    pending.get(timeout=remaining)
+                    if remaining > 0
+                    else pending.get_nowait()
+                )
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self, pending: queue.Queue) -> None:
+        while True:
+            batch = self._collect(pending)
+
+            by_language = defaultdict(list)
+            for text, language, future in batch:
+                if future.set_running_or_notify_cancel():
+                    by_language[language].append((text, future))
+
+            for language, items in by_language.items():
+                texts = [text for text, _ in items]
+                try:
+                    results = list(
+                        self.engine.process_batch(
+                            texts, language, batch_size=len(texts)
+                        )
+                    )
+                    if len(results) != len(items):
+                        raise RuntimeError(
+                            f"Expected {len(items)} NLP results, got {len(results)}"
+                        )
+                except Exception as e:
+                    logger.warning(f"Batched NLP processing failed: {e}")
+                    for _, future in items:
+                        future.set_exception(e)
+                    continue
+
+                self.batches += 1
+                self.batched_texts += len(texts)
+                for (_, future), (_, artifacts) in zip(items, results, strict=True):
+                    future.set_result(artifacts)
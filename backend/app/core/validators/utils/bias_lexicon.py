@@ -0,0 +1,128 @@
+import re
+import sys
+import unicodedata
+
+from app.core.validators.utils.word_matcher import is_word_char
+
+
+def _is_separator(char: str) -> bool:
+    """
+    A character that can never be part of a lexicon word: not a `\\w` character
+    and not a combining mark (e.g. a Devanagari matra).
+    """
+    return not is_word_char(char) and not unicodedata.category(char).startswith("M")
+
+
+class BiasLexicon:
+    """
+    A word -> neutral-term lexicon compiled into one `\\b(?:w1|w2|...)\\b` pattern.
+
+    `apply` returns exactly what searching and substituting every entry in lexicon
+    order would, in a single pass over the text. The alternatives keep lexicon
+    order, and each entry's replacement is resolved against the later entries at
+    compile time (e.g. "midwife" -> "birth attendant", which a later "attendant"
+    entry rewrites again), along with the later entries that fire on it.
+
+    The single pass is only taken when every match covers a whole run of word
+    characters with nothing else from the lexicon inside it; otherwise entries
+    could interact through the text around them, and the text is processed entry
+    by entry instead.
+    """
+
+    def __init__(self, entries: list[dict]):
+        self.words: list[str] = [entry["word"] for entry in entries]
+        self.neutral_terms: list[str] = [entry["neutral-term"] for entry in entries]
+        self.patterns = [
+            re.compile(rf"\b{re.escape(word)}\b", re.IGNORECASE) for word in self.words
+        ]
+
+        self.replacements: list[str] = []
+        self.chained: list[tuple[int, ...]] = []
+        for index, neutral_term in enumerate(self.neutral_terms):
+            value = re.sub(r"\A", neutral_term, "")  # expands the template as re.sub
+            fired = []
+            for later in range(index + 1, len(self.patterns)):
+                if self.patterns[later].search(value):
+                    fired.append(later)
+                    value = self.patterns[later].sub(self.neutral_terms[later], value)
+            self.replacements.append(value)
+            self.chained.append(tuple(fired))
+
+        single_pass = all(
+            word and not any(_is_separator(char) for char in word)
+            for word in self.words
+        )
+        self.pattern = None
+        if self.words and single_pass:
+            # The first-character lookahead is only a prefilter: `re` tries every
+            # alternative at every word start, which dominates the cost on clean text.
+            first_chars = "".join(sorted({re.escape(word[0]) for word in self.words}))
+            alternation = "|".join(f"({re.escape(word)})" for word in self.words)
+            self.pattern = re.compile(
+                rf"\b(?=[{first_chars}])(?:{alternation})\b", re.IGNORECASE
+            )
+
+    def _is_isolated(self, value: str, start: int, end: int) -> bool:
+        if start > 0 and not _is_separator(value[start - 1]):
+            return False
+        if end < len(value) and not _is_separator(value[end]):
+            return False
+        return self.pattern.search(value, start + 1, end) is None
+
+    def _apply_sequentially(self, value: str) -> tuple[list[str], str]:
+        detected = []
+        for index, pattern in enumerate(self.patterns):
+            if pattern.search(value):
+                detected.append(self.words[index])
+                value = pattern.sub(self.neutral_terms[index], value)
+        return detected, value
+
+    def apply(self, value: str) -> tuple[list[str], str]:
+        """
+        Returns the words of every entry that fired, in lexicon order, and the
+        text with each of them replaced by its neutral term.
+        """
+        if self.pattern is None:
+            return self._apply_sequentially(value)
+
+        matches = list(self.pattern.finditer(value))
+        if not matches:
+            return [], value
+
+        if not all(
+            self._is_isolated(value, match.start(), match.end()) for match in matches
+        ):
+            return self._apply_sequentially(value)
+
+        fired = set()
+        parts = []
+        cursor = 0
+        for match in matches:
+            index = match.lastindex - 1
+            fired.add(index)
+            fired.update(self.chained[index])
+            parts.append(value[cursor : match.start()])
+            parts.append(self.replacements[index])
+            cursor = match.end()
+        parts.append(value[cursor:])
+
+        return [self.words[index] for index in sorted(fired)], "".join(parts)
+
+    def memory_bytes(self) -> int:
+        """
+        Approximate memory held by the word lists, replacements and patterns.
+        """
+        strings = self.words + self.neutral_terms + self.replacements
+        size = sum(sys.getsizeof(item) for item in strings)
+        size += sum(
+            sys.getsizeof(items)
+            for items in (self.words, self.neutral_terms, self.replacements)
+        )
+        size += sys.getsizeof(self.chained) + sum(
+            sys.getsizeof(fired) for fired in self.chained
+        )
+        patterns = self.patterns + ([self.pattern] if self.pattern else [])
+        size += sys.getsizeof(self.patterns) + sum(
+            sys.getsizeof(pattern) for pattern in patterns
+        )
+        return size
@@ -0,0 +1,162 @@
+"""
+Build step and file format of the validator lexicon artifact.
+
+The artifact holds the parsed slur and gender bias rows as plain lists and
+dicts, never objects of our classes, so a change to a class cannot load stale
+instances. Loaders rebuild matchers from the word lists. ARTIFACT_VERSION is
+bumped whenever the layout of the payload changes.
+
+This module depends only on the CSV paths, not on application settings, so the
+artifact can be built where no environment is configured (e.g. an image build):
+
+    python -m app.core.validators.utils.lexicon_artifact [--output PATH]
+"""
+import argparse
+import csv
+import hashlib
+import logging
+import pickle
+import sys
+from pathlib import Path
+
+from app.core.enum import SlurSeverity
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_MAGIC = b"KGLEX"
+ARTIFACT_VERSION = 2
+
+FILES_DIR = Path(__file__).resolve().parent / "files"
+DEFAULT_SLUR_PATH = FILES_DIR / "curated_slurlist_hi_en.csv"
+DEFAULT_GENDER_BIAS_PATH = FILES_DIR / "gender_assumption_bias_words.csv"
+DEFAULT_ARTIFACT_PATH = FILES_DIR / "lexicons.bin"
+
+SLUR_REQUIRED_COLUMNS = ["label", "severity"]
+
+SLUR_SEVERITY_LEVELS = {
+    SlurSeverity.Low.value: {"L", "M", "H"},
+    SlurSeverity.Medium.value: {"M", "H"},
+    SlurSeverity.High.value: {"H"},
+    SlurSeverity.All.value: None,  # every row, whatever its severity
+}
+
+
+def read_csv_rows(file_path: Path) -> tuple[list[str], list[dict]]:
+    with open(file_path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        rows = list(reader)
+        return list(reader.fieldnames or []), rows
+
+
+def file_digest(file_path: Path) -> str:
+    return hashlib.sha256(Path(file_path).read_bytes()).hexdigest()
+
+
+def read_slur_rows(file_path: Path) -> list[dict]:
+    try:
+        columns, rows = read_csv_rows(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Slur list file not found at {file_path}")
+    except Exception as e:
+        raise ValueError(f"Failed to load slur list from {file_path}: {e}")
+
+    missing_columns = [col for col in SLUR_REQUIRED_COLUMNS if col not in columns]
+    if missing_columns:
+        raise ValueError(f"Slur list CSV missing required columns: {missing_columns}")
+    return rows
+
+
+def read_gender_bias_rows(file_path: Path) -> list[dict]:
+    try:
+        _, rows = read_csv_rows(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Gender bias file not found at {file_path}")
+    except Exception as e:
+        raise ValueError(f"Failed to load gender bias list from {file_path}: {e}")
+
+    try:
+        return [
+            {
+                "word": row["word"].lower(),
+                "neutral-term": row["neutral-term"].lower(),
+                "type": row["type"],
+            }
+            for row in rows
+        ]
+    except (KeyError, AttributeError) as e:
+        raise ValueError(f"Failed to load gender bias list from {file_path}: {e}")
+
+
+def slurs_by_severity(rows: list[dict]) -> dict[str, list[str]]:
+    slurs = {}
+    for severity, levels in SLUR_SEVERITY_LEVELS.items():
+        slurs[severity] = [
+            row["label"].lower()
+            for row in rows
+            if levels is None or row["severity"] in levels
+        ]
+    return slurs
+
+
+def build_lexicon_artifact(
+    output_path: Path, slur_path: Path, gender_bias_path: Path
+) -> Path:
+    output_path = Path(output_path)
+    payload = {
+        "version": ARTIFACT_VERSION,
+        "sources": {
+            "slur": file_digest(slur_path),
+            "gender_bias": file_digest(gender_bias_path),
+        },
+        "slurs": slurs_by_severity(read_slur_rows(slur_path)),
+        "gender_bias": read_gender_bias_rows(gender_bias_path),
+    }
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(ARTIFACT_MAGIC)
+        f.write(ARTIFACT_VERSION.to_bytes(2, "big"))
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_path.replace(output_path)
+    return output_path
+
+
+def read_artifact(artifact_path: Path) -> dict | None:
+    """
+    Returns the payload, or None if the file is missing, unreadable or written
+    in another format version.
+    """
+    try:
+        with open(artifact_path, "rb") as f:
+            if f.read(len(ARTIFACT_MAGIC)) != ARTIFACT_MAGIC:
+                return None
+            if int.from_bytes(f.read(2), "big") != ARTIFACT_VERSION:
+                return None
+            payload = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable lexicon artifact {artifact_path}: {e}")
+        return None
+
+    if not isinstance(payload, dict) or payload.get("version") != ARTIFACT_VERSION:
+        return None
+    return payload
+
+
+def main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(description="Build the lexicon artifact.")
+    parser.add_argument("--output", type=Path, default=DEFAULT_ARTIFACT_PATH)
+    parser.add_argument("--slur-csv", type=Path, default=DEFAULT_SLUR_PATH)
+    parser.add_argument(
+        "--gender-bias-csv", type=Path, default=DEFAULT_GENDER_BIAS_PATH
+    )
+    args = parser.parse_args(argv)
+    output = build_lexicon_artifact(args.output, args.slur_csv, args.gender_bias_csv)
+    logger.info(f"Lexicon artifact written to {output}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main(sys.argv[1:])
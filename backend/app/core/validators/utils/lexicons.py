@@ -0,0 +1,120 @@
+"""
+Loader for the validator lexicons (slur list, gender bias words).
+
+The CSV files under `utils/files` are the source of truth. The build step in
+`lexicon_artifact` turns them into one versioned binary artifact holding the
+parsed rows, which loads in about a millisecond. At runtime the artifact is used
+when it is present, matches ARTIFACT_VERSION and was built from the current CSVs;
+otherwise the CSVs are parsed directly with the csv module, once per file
+version. pandas is not needed.
+
+Build with: python -m app.core.validators.utils.lexicon_artifact
+"""
+import logging
+import threading
+from pathlib import Path
+
+from app.core.config import Settings
+from app.core.validators.utils import lexicon_artifact
+from app.core.validators.utils.lexicon_artifact import (
+    file_digest,
+    read_artifact,
+    read_gender_bias_rows,
+    read_slur_rows,
+    slurs_by_severity,
+)
+
+logger = logging.getLogger(__name__)
+
+_artifact_lock = threading.Lock()
+_artifact_cache: dict = {}
+# (source, path, mtime, size) -> rows parsed from the CSV when there is no artifact
+_csv_cache: dict = {}
+
+
+def build_lexicon_artifact(
+    output_path: Path | None = None,
+    slur_path: Path | None = None,
+    gender_bias_path: Path | None = None,
+) -> Path:
+    return lexicon_artifact.build_lexicon_artifact(
+        output_path or Settings.LEXICON_ARTIFACT_FILEPATH,
+        slur_path or Settings.SLUR_LIST_FILEPATH,
+        gender_bias_path or Settings.GENDER_BIAS_LIST_FILEPATH,
+    )
+
+
+def load_artifact(
+    source: str, source_path: Path, artifact_path: Path | None = None
+) -> dict | None:
+    """
+    Returns the artifact payload if it was built from the current `source_path`.
+    """
+    artifact_path = artifact_path or Settings.LEXICON_ARTIFACT_FILEPATH
+    key = (str(artifact_path), source, str(source_path))
+    with _artifact_lock:
+        if key in _artifact_cache:
+            return _artifact_cache[key]
+
+        payload = read_artifact(artifact_path)
+        if payload is not None:
+            try:
+                if payload["sources"][source] != file_digest(source_path):
+                    logger.warning(
+                        f"Lexicon artifact {artifact_path} is stale for {source_path}; "
+                        "falling back to CSV"
+                    )
+                    payload = None
+            except (FileNotFoundError, KeyError):
+                payload = None
+
+        _artifact_cache[key] = payload
+        return payload
+
+
+def _load_csv(source: str, file_path: Path, read):
+    """
+    Parses a lexicon CSV once per file version; a changed file is parsed again.
+    """
+    try:
+        stat = Path(file_path).stat()
+        key = (source, str(file_path), stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        # Let the reader raise its own error for a missing file.
+        return read(file_path)
+
+    with _artifact_lock:
+        if key in _csv_cache:
+            return _csv_cache[key]
+
+    rows = read(file_path)
+    with _artifact_lock:
+        _csv_cache[key] = rows
+    return rows
+
+
+def load_slur_list(severity: str) -> list[str]:
+    file_path = Settings.SLUR_LIST_FILEPATH
+    payload = load_artifact("slur", file_path)
+    if payload is not None:
+        return list(payload["slurs"][severity])
+
+    slurs = _load_csv(
+        "slur", file_path, lambda path: slurs_by_severity(read_slur_rows(path))
+    )
+    return list(slurs[severity])
+
+
+def load_gender_bias_rows() -> list[dict]:
+    file_path = Settings.GENDER_BIAS_LIST_FILEPATH
+    payload = load_artifact("gender_bias", file_path)
+    if payload is not None:
+        return payload["gender_bias"]
+
+    return _load_csv("gender_bias", file_path, read_gender_bias_rows)
+
+
+def clear_artifact_cache() -> None:
+    with _artifact_lock:
+        _artifact_cache.clear()
+        _csv_cache.clear()
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Mapping
+
+from presidio_analyzer import (
+    AnalyzerEngine,
+    EntityRecognizer,
+    PatternRecognizer,
+    RecognizerRegistry,
+)
+from presidio_analyzer.context_aware_enhancers import LemmaContextAwareEnhancer
+from presidio_analyzer.nlp_engine import NlpEngine
+from presidio_analyzer.predefined_recognizers import SpacyRecognizer
+from presidio_analyzer.predefined_recognizers.country_specific.india.in_aadhaar_recognizer import (
+    InAadhaarRecognizer,
+)
+from presidio_analyzer.predefined_recognizers.country_specific.india.in_pan_recognizer import (
+    InPanRecognizer,
+)
+from presidio_analyzer.predefined_recognizers.country_specific.india.in_passport_recognizer import (
+    InPassportRecognizer,
+)
+from presidio_analyzer.predefined_recognizers.country_specific.india.in_vehicle_registration_recognizer import (
+    InVehicleRegistrationRecognizer,
+)
+from presidio_analyzer.predefined_recognizers.country_specific.india.in_voter_recognizer import (
+    InVoterRecognizer,
+)
+
+from app.core.config import settings
+from app.core.validators.utils.batching_nlp_engine import BatchingNlpEngine
+from app.core.validators.utils.spacy_nlp_engine import TrimmedSpacyNlpEngine
+from app.core.validators.utils.tokenizer_nlp_engine import TokenizerNlpEngine
+
+SUPPORTED_LANGUAGE = "en"
+
+INDIA_RECOGNIZERS = [
+    InAadhaarRecognizer,
+    InPanRecognizer,
+    InPassportRecognizer,
+    InVehicleRegistrationRecognizer,
+    InVoterRecognizer,
+]
+
+
+def requires_nlp_model(recognizers: Iterable[EntityRecognizer]) -> bool:
+    """
+    Whether any recognizer reads the NER output of the NLP model (PERSON,
+    LOCATION, NRP, ...); the others only need tokens for context enhancement.
+    """
+    return any(isinstance(recognizer, SpacyRecognizer) for recognizer in recognizers)
+
+
+def max_reachable_score(
+    recognizer: EntityRecognizer, enhancer: LemmaContextAwareEnhancer
+) -> float:
+    """
+    Upper bound of the score a recognizer's results can end up with, including the
+    context boost. Only plain pattern recognizers are bounded below MAX_SCORE:
+    NER-based recognizers and pattern recognizers with their own validation (which
+    raises valid matches to MAX_SCORE) or scoring logic may reach any score.
+    """
+    recognizer_cls = type(recognizer)
+    if (
+        not isinstance(recognizer, PatternRecognizer)
+        or recognizer_cls.validate_result is not PatternRecognizer.validate_result
+        or recognizer_cls.analyze is not PatternRecognizer.analyze
+        or recognizer_cls.enhance_using_context
+        is not PatternRecognizer.enhance_using_context
+    ):
+        return EntityRecognizer.MAX_SCORE
+
+    score = max(
+        (pattern.score for pattern in recognizer.patterns),
+        default=EntityRecognizer.MIN_SCORE,
+    )
+    if recognizer.context:
+        score = max(
+            score + enhancer.context_similarity_factor,
+            enhancer.min_score_with_context_similarity,
+        )
+    return min(score, EntityRecognizer.MAX_SCORE)
+
+
+class PresidioRegistry:
+    """
+    Process-level registry for Presidio analyzers.
+
+    The spaCy NLP engine and the recognizer instances are created once and shared;
+    analyzers are handed out per entity-type set and score thresholds, and only hold
+    the recognizers that can emit one of the requested entities with a score that
+    passes its threshold. Analyzers without NER-backed recognizers only tokenize
+    the text, so the spaCy model is neither loaded nor run for them. With batching
+    enabled, model calls from concurrent requests are micro-batched.
+    """
+
+    def __init__(
+        self,
+        model_name: str | None = None,
+        excluded_components: Iterable[str] | None = None,
+        batching_enabled: bool | None = None,
+    ):
+        self._lock = threading.RLock()
+        self._set_model(model_name, excluded_components)
+        self.batching_enabled = (
+            settings.PII_NLP_BATCHING_ENABLED
+            if batching_enabled is None
+            else batching_enabled
+        )
+        self._nlp_engine: NlpEngine | None = None
+        self._batching_engine: BatchingNlpEngine | None = None
+        self._tokenizer_engine: TokenizerNlpEngine | None = None
+        self._recognizers: list[EntityRecognizer] | None = None
+        self._context_enhancer = LemmaContextAwareEnhancer()
+        self._analyzers: dict[tuple, AnalyzerEngine] = {}
+
+    def get_nlp_engine(self) -> NlpEngine:
+        if self._nlp_engine is None:
+            with self._lock:
+                if self._nlp_engine is None:
+                    engine = TrimmedSpacyNlpEngine(
+                        self.model_name,
+                        self.excluded_components,
+                        language=SUPPORTED_LANGUAGE,
+                    )
+                    engine.load()
+                    self._nlp_engine = engine
+        return self._nlp_engine
+
+    def get_batching_engine(self) -> BatchingNlpEngine:
+        if self._batching_engine is None:
+            with self._lock:
+                if self._batching_engine is None:
+                    self._batching_engine = BatchingNlpEngine(
+                        self.get_nlp_engine(),
+                        max_batch_size=settings.PII_NLP_BATCH_MAX_SIZE,
+                        max_wait_ms=settings.PII_NLP_BATCH_MAX_WAIT_MS,
+                    )
+        return self._batching_engine
+
+    def get_tokenizer_engine(self) -> TokenizerNlpEngine:
+        if self._tokenizer_engine is None:
+            with self._lock:
+                if self._tokenizer_engine is None:
+                    engine = TokenizerNlpEngine(SUPPORTED_LANGUAGE)
+                    engine.load()
+                    self._tokenizer_engine = engine
+        return self._tokenizer_engine
+
+    def get_recognizers(self) -> list[EntityRecognizer]:
+        if self._recognizers is None:
+            with self._lock:
+                if self._recognizers is None:
+                    self._recognizers = self._load_recognizers()
+        return self._recognizers
+
+    def get_analyzer(
+        self,
+        entity_types: Iterable[str],
+        score_thresholds: Mapping[str, float] | None = None,
+    ) -> AnalyzerEngine:
+        """
+        `score_thresholds` maps entity types to the minimum score the caller keeps;
+        recognizers that cannot reach it for any of their entities are left out.
+        """
+        entity_types = frozenset(entity_types)
+        score_thresholds = {
+            entity: score
+            for entity, score in (score_thresholds or {}).items()
+            if entity in entity_types and score > EntityRecognizer.MIN_SCORE
+        }
+        key = (entity_types, frozenset(score_thresholds.items()))
+        analyzer = self._analyzers.get(key)
+        if analyzer is not None:
+            return analyzer
+
+        with self._lock:
+            analyzer = self._analyzers.get(key)
+            if analyzer is None:
+                analyzer = self._build_analyzer(entity_types, score_thresholds)
+                self._analyzers[key] = analyzer
+        return analyzer
+
+    def configure(
+        self,
+        model_name: str | None = None,
+        excluded_components: Iterable[str] | None = None,
+    ) -> None:
+        """
+        Switches the spaCy model or pipeline; analyzers are rebuilt on next use.
+        Recognizers do not depend on the model and are kept.
+        """
+        with self._lock:
+            self._nlp_engine = None
+            self._batching_engine = None
+            self._tokenizer_engine = None
+            self._analyzers.clear()
+            self._set_model(model_name, excluded_components)
+
+    def is_loaded(self) -> bool:
+        return self._nlp_engine is not None and self._recognizers is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._nlp_engine = None
+            self._batching_engine = None
+            self._tokenizer_engine = None
+            self._recognizers = None
+            self._analyzers.clear()
+
+    def _set_model(
+        self, model_name: str | None, excluded_components: Iterable[str] | None
+    ) -> None:
+        self.model_name = model_name or settings.PII_SPACY_MODEL
+        self.excluded_components = list(
+            settings.PII_SPACY_EXCLUDED_COMPONENTS
+            if excluded_components is None
+            else excluded_components
+        )
+
+    def _load_recognizers(self) -> list[EntityRecognizer]:
+        registry = RecognizerRegistry(supported_languages=[SUPPORTED_LANGUAGE])
+        # Without an NLP engine Presidio picks the spaCy NER recognizer, which is what
+        # the default engine needs; passing the engine would load the model here.
+        registry.load_predefined_recognizers(languages=[SUPPORTED_LANGUAGE])
+
+        covered = {
+            entity
+            for recognizer in registry.recognizers
+            for entity in recognizer.supported_entities
+        }
+        for recognizer_cls in INDIA_RECOGNIZERS:
+            recognizer = recognizer_cls()
+            if not covered.intersection(recognizer.supported_entities):
+                registry.add_recognizer(recognizer)
+
+        return list(registry.recognizers)
+
+    def _can_reach_threshold(
+        self,
+        recognizer: EntityRecognizer,
+        entity_types: frozenset,
+        score_thresholds: Mapping[str, float],
+    ) -> bool:
+        entities = entity_types.intersection(recognizer.supported_entities)
+        if not entities:
+            return False
+        required = min(
+            score_thresholds.get(entity, EntityRecognizer.MIN_SCORE)
+            for entity in entities
+        )
+        if required <= EntityRecognizer.MIN_SCORE:
+            return True
+        return max_reachable_score(recognizer, self._context_enhancer) >= required
+
+    def _build_analyzer(
+        self, entity_types: frozenset, score_thresholds: Mapping[str, float]
+    ) -> AnalyzerEngine:
+        recognizers = [
+            recognizer
+            for recognizer in self.get_recognizers()
+            if self._can_reach_threshold(recognizer, entity_types, score_thresholds)
+        ]
+        registry = RecognizerRegistry(
+            recognizers=recognizers, supported_languages=[SUPPORTED_LANGUAGE]
+        )
+        if not requires_nlp_model(recognizers):
+            nlp_engine = self.get_tokenizer_engine()
+        elif self.batching_enabled:
+            nlp_engine = self.get_batching_engine()
+        else:
+            nlp_engine = self.get_nlp_engine()
+        return AnalyzerEngine(
+            registry=registry,
+            nlp_engine=nlp_engine,
+            supported_languages=[SUPPORTED_LANGUAGE],
+            context_aware_enhancer=self._context_enhancer,
+        )
+
+
+presidio_registry = PresidioRegistry()
+
+
+def get_analyzer(
+    entity_types: Iterable[str], score_thresholds: Mapping[str, float] | None = None
+) -> AnalyzerEngine:
+    return presidio_registry.get_analyzer(entity_types, score_thresholds)
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import os
+import re
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, TypeVar
+
+T = TypeVar("T")
+
+# End of a sentence (with any closing quotes or brackets) or a line break,
+# including the whitespace that follows it.
+_SENTENCE_END = re.compile(r"[.!?।]+[\"')\]]*\s+|\n\s*")
+_WHITESPACE = re.compile(r"\s+")
+_WORD_START = re.compile(r"(?<=\s)\S")
+
+
+class TextChunk(NamedTuple):
+    start: int  # offset of the chunk in the full text
+    text: str
+
+
+def split_text(text: str, max_chars: int, overlap: int) -> list[TextChunk]:
+    """
+    Splits `text` into chunks of at most `max_chars` characters.
+
+    Each chunk ends at the last sentence end in its second half, else at the last
+    whitespace, else at `max_chars`. The next chunk starts at the first word in
+    the `overlap` characters before that, so an entity shorter than `overlap`
+    that crosses a chunk end is seen whole by the next chunk. Texts that fit in
+    one chunk, or a `max_chars` of 0, give a single chunk.
+    """
+    if max_chars <= 0 or len(text) <= max_chars:
+        return [TextChunk(0, text)]
+
+    overlap = max(0, min(overlap, max_chars // 2))
+    chunks = []
+    start = 0
+    while start + max_chars < len(text):
+        end = _find_break(text, start + max_chars // 2, start + max_chars)
+        chunks.append(TextChunk(start, text[start:end]))
+
+        match = _WORD_START.search(text, end - overlap, end)
+        next_start = match.start() if match else end - overlap
+        start = next_start if next_start > start else end
+    chunks.append(TextChunk(start, text[start:]))
+    return chunks
+
+
+def _find_break(text: str, lo: int, hi: int) -> int:
+    for pattern in (_SENTENCE_END, _WHITESPACE):
+        # Keep only the last match of the window.
+        last = deque(pattern.finditer(text, lo, hi), maxlen=1)
+        if last:
+            return last[0].end()
+    return hi
+
+
+def merge_spans(results: Iterable) -> list:
+    """
+    Merges analyzer results found in overlapping chunks. Results of the same
+    entity type that overlap become one result covering both spans, with the
+    higher score; this folds an entity cut short at one chunk's end into the
+    whole match from the next chunk. Conflicts between different entity types
+    are left to the anonymizer, as for a single analysis.
+    """
+    merged = []
+    for result in sorted(results, key=lambda r: (r.entity_type, r.start, -r.end)):
+        last = merged[-1] if merged else None
+        if (
+            last is not None
+            and last.entity_type == result.entity_type
+            and result.start < last.end
+        ):
+            last.end = max(last.end, result.end)
+            last.score = max(last.score, result.score)
+        else:
+            merged.append(result)
+    return sorted(merged, key=lambda r: (r.start, r.end))
+
+
+class ChunkExecutor:
+    """
+    Thread pool shared by chunked analyses. spaCy releases the GIL for much of
+    its inference, so chunks of one text are analyzed concurrently. The pool is
+    created lazily and recreated after a fork.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max(1, max_workers)
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._pid: int | None = None
+
+    def map(self, fn: Callable[[TextChunk], T], chunks: list[TextChunk]) -> list[T]:
+        if len(chunks) == 1 or self.max_workers == 1:
+            return [fn(chunk) for chunk in chunks]
+        return list(self._get_executor().map(fn, chunks))
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        pid = os.getpid()
+        if self._executor is None or self._pid != pid:
+            with self._lock:
+                if self._executor is None or self._pid != pid:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="pii-chunk",
+                    )
+                    self._pid = pid
+        return self._executor
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Sequence
+from difflib import SequenceMatcher
+from typing import NamedTuple
+
+# Words, whitespace runs and single other characters; every character of a text
+# falls in exactly one token.
+_TOKEN = re.compile(r"\w+|\s+|[^\w\s]")
+
+
+class TextEdit(NamedTuple):
+    start: int  # range of the original text that is replaced
+    end: int
+    replacement: str
+    source: int = 0  # position of the validator that made the edit
+
+
+def diff_edits(original: str, fixed: str, source: int = 0) -> list[TextEdit]:
+    """
+    Edits that turn `original` into `fixed`, found by a token-level diff so that
+    a rewritten word or entity becomes one edit. Applying all of them to
+    `original` gives back `fixed` exactly.
+    """
+    if original == fixed:
+        return []
+
+    old = _TOKEN.findall(original)
+    new = _TOKEN.findall(fixed)
+
+    # Fixes usually touch a few spans; diff only what lies between them.
+    prefix = 0
+    while prefix < min(len(old), len(new)) and old[prefix] == new[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < min(len(old), len(new)) - prefix
+        and old[-1 - suffix] == new[-1 - suffix]
+    ):
+        suffix += 1
+
+    offsets = [0]
+    for token in old:
+        offsets.append(offsets[-1] + len(token))
+
+    old_middle = old[prefix : len(old) - suffix]
+    new_middle = new[prefix : len(new) - suffix]
+    edits = []
+    for tag, i1, i2, j1, j2 in SequenceMatcher(
+        None, old_middle, new_middle
+    ).get_opcodes():
+        if tag != "equal":
+            edits.append(
+                TextEdit(
+                    offsets[prefix + i1],
+                    offsets[prefix + i2],
+                    "".join(new_middle[j1:j2]),
+                    source,
+                )
+            )
+    return edits
+
+
+def merge_edits(edits: Iterable[TextEdit]) -> list[TextEdit]:
+    """
+    Combines the edits of several validators made on the same text into one
+    non-overlapping list, deterministically:
+
+    - identical edits are kept once;
+    - an edit covering every edit it overlaps wins over them (ties go to the
+      earlier validator);
+    - otherwise the union of the overlapping ranges is replaced by their
+      replacements in text order, so no flagged text survives the merge.
+
+    Edits that only touch, such as an insertion at the end of a replaced range,
+    do not overlap and are all kept.
+    """
+    unique = {}
+    for edit in sorted(edits, key=lambda e: e.source):
+        unique.setdefault(edit[:3], edit)
+    ordered = sorted(unique.values(), key=lambda e: (e.start, e.end, e.source))
+    merged = []
+    cluster: list = []
+    cluster_end = -1
+    for edit in ordered:
+        if cluster and edit.start < cluster_end:
+            cluster.append(edit)
+            cluster_end = max(cluster_end, edit.end)
+            continue
+        if cluster:
+            merged.append(_resolve(cluster, cluster_end))
+        cluster = [edit]
+        cluster_end = edit.end
+    if cluster:
+        merged.append(_resolve(cluster, cluster_end))
+    return merged
+
+
+def _resolve(cluster: Sequence[TextEdit], end: int) -> TextEdit:
+    if len(cluster) == 1:
+        return cluster[0]
+
+    start = cluster[0].start
+    covering = [e for e in cluster if e.start == start and e.end == end]
+    if covering:
+        return min(covering, key=lambda e: e.source)
+
+    return TextEdit(
+        start,
+        end,
+        "".join(e.replacement for e in cluster),
+        min(e.source for e in cluster),
+    )
+
+
+def apply_edits(text: str, edits: Sequence[TextEdit]) -> str:
+    """
+    Applies non-overlapping edits, sorted by position, in one splice pass.
+    """
+    parts = []
+    cursor = 0
+    for edit in edits:
+        parts.append(text[cursor : edit.start])
+        parts.append(edit.replacement)
+        cursor = edit.end
+    parts.append(text[cursor:])
+    return "".join(parts)
@@ -0,0 +1,250 @@
+"""
+Offset-preserving text normalization.
+
+Each stage returns, for every output character, the [start, end) range of input
+characters it came from. Composing the stages gives a map from positions in the
+normalized text back to the original text, so matches found on the normalized
+text can be redacted in the original.
+"""
+import re
+import unicodedata
+from collections.abc import Callable, Iterable
+from typing import NamedTuple
+
+import emoji
+import ftfy
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+Spans = list[tuple[int, int]]
+
+
+class OffsetText(NamedTuple):
+    text: str
+    starts: list[int]  # original start offset of each character of `text`
+    ends: list[int]  # original end offset of each character of `text`
+
+    def original_span(self, start: int, end: int) -> tuple[int, int]:
+        """
+        Maps the normalized range [start, end) to a range of the original text.
+        """
+        return self.starts[start], self.ends[end - 1]
+
+
+def _identity(text: str) -> OffsetText:
+    return OffsetText(text, list(range(len(text))), list(range(1, len(text) + 1)))
+
+
+def _compose(previous: OffsetText, text: str, spans: Spans) -> OffsetText:
+    """
+    Applies a stage whose output character i came from previous.text[a:b].
+    Characters inserted by a stage (a == b) map to an empty original range.
+    """
+    starts = previous.starts
+    ends = previous.ends
+    length = len(starts)
+    tail = ends[-1] if ends else 0
+    new_starts = []
+    new_ends = []
+    for a, b in spans:
+        if b > a:
+            new_starts.append(starts[a])
+            new_ends.append(ends[b - 1])
+        else:
+            position = starts[a] if a < length else tail
+            new_starts.append(position)
+            new_ends.append(position)
+    return OffsetText(text, new_starts, new_ends)
+
+
+# Alignment resynchronizes on a run of ALIGN_ANCHOR equal characters found
+# within ALIGN_WINDOW characters of a mismatch, which keeps it linear in the
+# text length. Normalization stages only change text locally.
+ALIGN_WINDOW = 64
+ALIGN_ANCHOR = 4
+
+
+def _resync(old: str, new: str, i: int, j: int) -> tuple[int, int] | None:
+    """
+    Closest positions (i', j') at or after (i, j) from which both texts agree
+    for ALIGN_ANCHOR characters, or both end. None if there is none within
+    ALIGN_WINDOW characters.
+    """
+    anchors = {}
+    for nj in range(j, min(j + ALIGN_WINDOW, len(new)) + 1):
+        anchors.setdefault(new[nj : nj + ALIGN_ANCHOR], nj)
+
+    best = None
+    for oi in range(i, min(i + ALIGN_WINDOW, len(old)) + 1):
+        if best is not None and oi - i >= best[0] + best[1] - i - j:
+            break
+        nj = anchors.get(old[oi : oi + ALIGN_ANCHOR])
+        if nj is not None and (best is None or oi + nj < best[0] + best[1]):
+            best = (oi, nj)
+    return best
+
+
+def _aligned_spans(old: str, new: str) -> Spans:
+    """
+    Generic fallback alignment for stages without an exact character mapping.
+    Characters of `new` that replace or are inserted into `old` map to the range
+    of `old` they stand in for.
+    """
+    spans: Spans = []
+    i = j = 0
+    while i < len(old) and j < len(new):
+        if old[i] == new[j]:
+            spans.append((i, i + 1))
+            i += 1
+            j += 1
+            continue
+
+        resync = _resync(old, new, i, j)
+        if resync is None:
+            # No common run nearby: map the next window as one replaced block.
+            oi = min(i + ALIGN_WINDOW, len(old))
+            nj = min(j + ALIGN_WINDOW, len(new))
+        else:
+            oi, nj = resync
+        spans.extend((i, oi) for _ in range(nj - j))
+        i, j = oi, nj
+
+    spans.extend((i, len(old)) for _ in range(len(new) - j))
+    return spans
+
+
+def _deletion_spans(
+    text: str, removed: Iterable[tuple[int, int]]
+) -> tuple[str, Spans]:
+    parts = []
+    spans: Spans = []
+    cursor = 0
+    for start, end in removed:
+        parts.append(text[cursor:start])
+        spans.extend((i, i + 1) for i in range(cursor, start))
+        cursor = end
+    parts.append(text[cursor:])
+    spans.extend((i, i + 1) for i in range(cursor, len(text)))
+    return "".join(parts), spans
+
+
+def remove_emojis(current: OffsetText) -> OffsetText:
+    text = current.text
+    expected = emoji.replace_emoji(text, replace="")
+    if expected == text:
+        return current
+
+    removed = [(m["match_start"], m["match_end"]) for m in emoji.emoji_list(text)]
+    result, spans = _deletion_spans(text, removed)
+    if result != expected:
+        spans = _aligned_spans(text, expected)
+    return _compose(current, expected, spans)
+
+
+def fix_encoding(current: OffsetText) -> OffsetText:
+    fixed = ftfy.fix_text(current.text)
+    if fixed == current.text:
+        return current
+    return _compose(current, fixed, _aligned_spans(current.text, fixed))
+
+
+def normalize_unicode(current: OffsetText) -> OffsetText:
+    text = current.text
+    if unicodedata.is_normalized("NFKC", text):
+        return current
+
+    expected = unicodedata.normalize("NFKC", text)
+
+    # Normalize per base character plus its combining marks, which is where
+    # NFKC composition happens, and map every output char to its cluster.
+    parts = []
+    spans: Spans = []
+    cluster_start = 0
+    for i in range(1, len(text) + 1):
+        if i < len(text) and unicodedata.combining(text[i]):
+            continue
+        normalized = unicodedata.normalize("NFKC", text[cluster_start:i])
+        parts.append(normalized)
+        spans.extend((cluster_start, i) for _ in normalized)
+        cluster_start = i
+
+    if "".join(parts) != expected:
+        spans = _aligned_spans(text, expected)
+    return _compose(current, expected, spans)
+
+
+def collapse_whitespace(current: OffsetText) -> OffsetText:
+    text = current.text
+    parts = []
+    spans: Spans = []
+    cursor = 0
+    for match in WHITESPACE_PATTERN.finditer(text):
+        start, end = match.span()
+        parts.append(text[cursor:start])
+        spans.extend((i, i + 1) for i in range(cursor, start))
+        if start > 0 and end < len(text):  # leading/trailing runs are stripped
+            parts.append(" ")
+            spans.append((start, end))
+        cursor = end
+    parts.append(text[cursor:])
+    spans.extend((i, i + 1) for i in range(cursor, len(text)))
+    return _compose(current, "".join(parts), spans)
+
+
+def lowercase(current: OffsetText) -> OffsetText:
+    text = current.text
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return OffsetText(lowered, current.starts, current.ends)
+
+    spans: Spans = []
+    for i, char in enumerate(text):
+        spans.extend((i, i + 1) for _ in char.lower())
+    if len(spans) != len(lowered):
+        spans = _aligned_spans(text, lowered)
+    return _compose(current, lowered, spans)
+
+
+FULL_PIPELINE: list[Callable[[OffsetText], OffsetText]] = [
+    remove_emojis,
+    fix_encoding,
+    normalize_unicode,
+    collapse_whitespace,
+    lowercase,
+]
+
+ASCII_PIPELINE: list[Callable[[OffsetText], OffsetText]] = [
+    collapse_whitespace,
+    lowercase,
+]
+
+
+def normalize_with_offsets(text: str, clean_ascii: bool = False) -> OffsetText:
+    current = _identity(text)
+    for stage in ASCII_PIPELINE if clean_ascii else FULL_PIPELINE:
+        current = stage(current)
+    return current
+
+
+def redact_spans(
+    text: str, spans: Iterable[tuple[int, int]], replacement: str
+) -> str:
+    """
+    Replaces the given ranges of `text` in one splice pass. Overlapping ranges
+    are merged into a single replacement.
+    """
+    merged: list[list[int]] = []
+    for start, end in sorted(spans):
+        if merged and start < merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+
+    parts = []
+    cursor = 0
+    for start, end in merged:
+        parts.append(text[cursor:start])
+        parts.append(replacement)
+        cursor = end
+    parts.append(text[cursor:])
+    return "".join(parts)
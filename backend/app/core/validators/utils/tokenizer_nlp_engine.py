@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+import spacy
+from presidio_analyzer.nlp_engine import NlpArtifacts, NlpEngine
+
+
+class TokenizerNlpEngine(NlpEngine):
+    """
+    Presidio NLP engine that only tokenizes, for analyzers whose recognizers are
+    all pattern based.
+
+    It runs spaCy's rule-based tokenizer from a blank pipeline, so no model is
+    loaded and no tagger, parser or NER runs. Pattern recognizers only use the
+    artifacts for context enhancement, which looks for context words inside the
+    lemmas of nearby tokens; the lowercased token text (`token.lower_`) stands in
+    for the lemma. Context words are matched as substrings, so "cards" still
+    finds "card", but irregular forms no longer match ("paid" for "pay"); context
+    boosted scores can then be lower than with the full model and a result near
+    the threshold can be dropped.
+    """
+
+    def __init__(self, language: str = "en"):
+        self.language = language
+        self.nlp: spacy.language.Language | None = None
+
+    def load(self) -> None:
+        self.nlp = spacy.blank(self.language)
+
+    def is_loaded(self) -> bool:
+        return self.nlp is not None
+
+    def process_text(self, text: str, language: str) -> NlpArtifacts:
+        if self.nlp is None:
+            self.load()
+        return self._doc_to_nlp_artifact(self.nlp(text), language)
+
+    def process_batch(
+        self,
+        texts: Iterable[str],
+        language: str,
+        batch_size: int = 1,
+        n_process: int = 1,
+        **kwargs,
+    ) -> Iterator[tuple[str, NlpArtifacts]]:
+        if self.nlp is None:
+            self.load()
+        texts = list(texts)
+        docs = self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        for text, doc in zip(texts, docs, strict=True):
+            yield text, self._doc_to_nlp_artifact(doc, language)
+
+    def is_stopword(self, word: str, language: str) -> bool:
+        if self.nlp is None:
+            self.load()
+        return self.nlp.vocab[word].is_stop
+
+    def is_punct(self, word: str, language: str) -> bool:
+        if self.nlp is None:
+            self.load()
+        return self.nlp.vocab[word].is_punct
+
+    def get_supported_entities(self) -> list[str]:
+        return []
+
+    def get_supported_languages(self) -> list[str]:
+        return [self.language]
+
+    def _doc_to_nlp_artifact(self, doc, language: str) -> NlpArtifacts:
+        return NlpArtifacts(
+            entities=[],
+            tokens=doc,
+            tokens_indices=[token.idx for token in doc],
+            lemmas=[token.lower_ for token in doc],
+            nlp_engine=self,
+            language=language,
+        )
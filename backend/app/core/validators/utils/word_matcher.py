@@ -0,0 +1,163 @@
+import bisect
+import sys
+from collections import deque
+from collections.abc import Iterable
+from typing import NamedTuple
+
+
+class WordMatch(NamedTuple):
+    start: int
+    end: int
+    index: int  # position of the matched word in WordMatcher.words
+
+
+def is_word_char(char: str) -> bool:
+    """
+    Same definition as the `\\w` class of Python's `re` module for str patterns.
+    """
+    return char.isalnum() or char == "_"
+
+
+class WordMatcher:
+    """
+    Aho-Corasick automaton that finds every occurrence of a fixed word list in one
+    scan of the text.
+
+    Matches follow the `(?<!\\w)word(?!\\w)` boundary semantics of the regex
+    patterns it replaces. Words are kept in longest-first order (ties keep the
+    input order), which is the priority used when overlapping matches compete
+    for redaction.
+    """
+
+    def __init__(self, words: Iterable[str]):
+        self.words: list[str] = sorted(words, key=len, reverse=True)
+        self._goto: list[dict] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[tuple] = [()]
+        self._build()
+
+    def _build(self) -> None:
+        goto = self._goto
+        terminal: list[list] = [[]]
+
+        for index, word in enumerate(self.words):
+            if not word:
+                continue
+            state = 0
+            for char in word:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    terminal.append([])
+                state = next_state
+            terminal[state].append(index)
+
+        fail = [0] * len(goto)
+        output = [()] * len(goto)
+        queue = deque()
+        for child in goto[0].values():
+            queue.append(child)
+
+        # Breadth-first so a state's fail target is finalized before the state.
+        while queue:
+            state = queue.popleft()
+            output[state] = tuple(
+                (len(self.words[index]), index) for index in terminal[state]
+            ) + output[fail[state]]
+
+            for char, child in goto[state].items():
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[child] = goto[fallback].get(char, 0)
+                queue.append(child)
+
+        self._fail = fail
+        self._output = output
+
+    def find_all(self, text: str) -> list[WordMatch]:
+        """
+        Returns every word-bounded occurrence of every word, including
+        overlapping ones, ordered by end position.
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        text_length = len(text)
+        matches = []
+        state = 0
+
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            if not output[state]:
+                continue
+
+            end = position + 1
+            if end < text_length and is_word_char(text[end]):
+                continue
+
+            for length, index in output[state]:
+                start = end - length
+                if start > 0 and is_word_char(text[start - 1]):
+                    continue
+                matches.append(WordMatch(start, end, index))
+
+        return matches
+
+    def matched_words(self, matches: Iterable[WordMatch]) -> list[str]:
+        """
+        Distinct matched words, in priority order.
+        """
+        indices = sorted({match.index for match in matches})
+        return [self.words[index] for index in indices]
+
+    def select_non_overlapping(self, matches: Iterable[WordMatch]) -> list[WordMatch]:
+        """
+        Resolves overlapping matches by word priority (longest first), then by
+        position, and returns the kept matches ordered by start.
+        """
+        starts: list[int] = []
+        selected: list[WordMatch] = []
+        for match in sorted(matches, key=lambda m: (m.index, m.start)):
+            position = bisect.bisect_left(starts, match.start)
+            if position > 0 and selected[position - 1].end > match.start:
+                continue
+            if position < len(selected) and selected[position].start < match.end:
+                continue
+            starts.insert(position, match.start)
+            selected.insert(position, match)
+        return selected
+
+    def replace(
+        self, text: str, matches: Iterable[WordMatch], replacement: str
+    ) -> str:
+        """
+        Replaces the selected non-overlapping matches in one splice pass.
+        """
+        parts = []
+        cursor = 0
+        for match in self.select_non_overlapping(matches):
+            parts.append(text[cursor : match.start])
+            parts.append(replacement)
+            cursor = match.end
+        parts.append(text[cursor:])
+        return "".join(parts)
+
+    def memory_bytes(self) -> int:
+        """
+        Approximate memory held by the automaton tables and word list.
+        """
+        size = sys.getsizeof(self.words) + sum(sys.getsizeof(w) for w in self.words)
+        size += sys.getsizeof(self._goto) + sum(sys.getsizeof(t) for t in self._goto)
+        size += sys.getsizeof(self._fail) + sys.getsizeof(self._output)
+        size += sum(
+            sys.getsizeof(out) + sum(sys.getsizeof(entry) for entry in out)
+            for out in self._output
+            if out
+        )
+        return size
@@ -0,0 +1,162 @@
+import logging
+import threading
+import time
+from collections.abc import Iterable
+from enum import Enum
+
+from app.core.config import settings
+from app.core.enum import ValidatorType
+from app.core.guardrail_controller import validator_cache
+from app.core.validator_pool import ProcessPoolValidator
+from app.core.validators.config.ban_list_safety_validator_config import (
+    BanListSafetyValidatorConfig,
+)
+from app.core.validators.config.gender_assumption_bias_safety_validator_config import (
+    GenderAssumptionBiasSafetyValidatorConfig,
+)
+from app.core.validators.config.lexical_slur_safety_validator_config import (
+    LexicalSlurSafetyValidatorConfig,
+)
+from app.core.validators.config.pii_remover_safety_validator_config import (
+    PIIRemoverSafetyValidatorConfig,
+)
+
+logger = logging.getLogger(__name__)
+
+WARMUP_SAMPLE_TEXT = "Warm up sample text for validators."
+
+
+class WarmupState(str, Enum):
+    COLD = "cold"
+    WARMING = "warming"
+    WARM = "warm"
+    FAILED = "failed"
+
+
+def _warm(validator_config) -> None:
+    # Building through the shared cache means the first request with a default
+    # config is a cache hit as well.
+    for validator in validator_cache.get_or_build([validator_config]):
+        # Pool processes warm their own validators when the pool starts; calling
+        # the proxy here would start a pool in this process (e.g. a prefork master).
+        if isinstance(validator, ProcessPoolValidator):
+            continue
+        validator.validate(WARMUP_SAMPLE_TEXT, metadata={})
+
+
+_WARMUP_CONFIGS = {
+    ValidatorType.LexicalSlur: lambda: LexicalSlurSafetyValidatorConfig(
+        type=ValidatorType.LexicalSlur.value
+    ),
+    ValidatorType.GenderAssumptionBias: lambda: GenderAssumptionBiasSafetyValidatorConfig(
+        type=ValidatorType.GenderAssumptionBias.value
+    ),
+    # Runs one analysis so spaCy allocates its pipeline buffers up front.
+    ValidatorType.PIIRemover: lambda: PIIRemoverSafetyValidatorConfig(
+        type=ValidatorType.PIIRemover.value
+    ),
+    ValidatorType.BanList: lambda: BanListSafetyValidatorConfig(
+        type=ValidatorType.BanList.value, banned_words=["warmup"]
+    ),
+}
+
+
+class ValidatorWarmup:
+    """
+    Tracks warm-up state per validator type so readiness can be reported
+    independently of liveness.
+    """
+
+    def __init__(
+        self,
+        attempts: int = settings.VALIDATOR_WARMUP_ATTEMPTS,
+        retry_delay: float = settings.VALIDATOR_WARMUP_RETRY_DELAY_SECONDS,
+    ):
+        self.attempts = max(1, attempts)
+        self.retry_delay = retry_delay
+        self._lock = threading.Lock()
+        self._states = dict.fromkeys(_WARMUP_CONFIGS, WarmupState.COLD)
+        self._durations_ms: dict[ValidatorType, float] = {}
+        self._errors: dict[ValidatorType, str] = {}
+        self.completed = False
+
+    def run(self, validator_types: Iterable[ValidatorType] | None = None) -> None:
+        """
+        Preloads every validator type, or only `validator_types`. A validator
+        that fails is tried again up to `attempts` times in all, waiting
+        `retry_delay` seconds and then twice as long before each new try, so a
+        transient error does not leave the worker unready. A validator that still
+        fails is recorded and logged rather than raised, and keeps the worker from
+        reporting ready until it is restarted.
+        """
+        selected = set(_WARMUP_CONFIGS if validator_types is None else validator_types)
+        for validator_type, build_config in _WARMUP_CONFIGS.items():
+            if validator_type not in selected:
+                continue
+            self._set_state(validator_type, WarmupState.WARMING)
+            start = time.perf_counter()
+            try:
+                self._warm_with_retries(validator_type, build_config)
+            except Exception as e:
+                logger.exception(f"Warm-up failed for validator {validator_type.value}")
+                with self._lock:
+                    self._errors[validator_type] = str(e)
+                self._set_state(validator_type, WarmupState.FAILED)
+                continue
+            finally:
+                with self._lock:
+                    self._durations_ms[validator_type] = (
+                        time.perf_counter() - start
+                    ) * 1000
+
+            self._set_state(validator_type, WarmupState.WARM)
+            logger.info(
+                f"Warmed up validator {validator_type.value} in "
+                f"{self._durations_ms[validator_type]:.0f}ms"
+            )
+
+        self.completed = True
+
+    def mark_skipped(self) -> None:
+        """
+        Marks warm-up as done without preloading; validators load lazily on first use.
+        """
+        self.completed = True
+
+    def is_ready(self) -> bool:
+        with self._lock:
+            failed = WarmupState.FAILED in self._states.values()
+        return self.completed and not failed
+
+    def status(self) -> dict:
+        with self._lock:
+            return {
+                validator_type.value: {
+                    "state": state.value,
+                    "duration_ms": self._durations_ms.get(validator_type),
+                    "error": self._errors.get(validator_type),
+                }
+                for validator_type, state in self._states.items()
+            }
+
+    def _warm_with_retries(self, validator_type: ValidatorType, build_config) -> None:
+        for attempt in range(1, self.attempts + 1):
+            try:
+                _warm(build_config())
+                return
+            except Exception as e:
+                if attempt == self.attempts:
+                    raise
+                delay = self.retry_delay * 2 ** (attempt - 1)
+                logger.warning(
+                    f"Warm-up attempt {attempt} of {self.attempts} failed for "
+                    f"validator {validator_type.value}, retrying in {delay:.1f}s: {e}"
+                )
+                time.sleep(delay)
+
+    def _set_state(self, validator_type: ValidatorType, state: WarmupState) -> None:
+        with self._lock:
+            self._states[validator_type] = state
+
+
+validator_warmup = ValidatorWarmup()
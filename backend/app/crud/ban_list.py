@@ -4,6 +4,7 @@ from uuid import UUID
 from fastapi import HTTPException
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models.config.ban_list import BanList
 from app.schemas.ban_list import BanListCreate, BanListUpdate
@@ -48,14 +49,18 @@ class BanListCrud:
         require_owner: bool = False,
     ) -> BanList:
         ban_list = session.get(BanList, id)
+        return self._check_access(ban_list, organization_id, project_id, require_owner)
 
-        if ban_list is None:
-            raise HTTPException(status_code=404, detail="Ban list not found")
-
-        if require_owner or not ban_list.is_public:
-            self.check_owner(ban_list, organization_id, project_id)
-
-        return ban_list
+    async def get_async(
+        self,
+        session: AsyncSession,
+        id: UUID,
+        organization_id: int,
+        project_id: int,
+        require_owner: bool = False,
+    ) -> BanList:
+        ban_list = await session.get(BanList, id)
+        return self._check_access(ban_list, organization_id, project_id, require_owner)
 
     def list(
         self,
@@ -131,6 +136,21 @@ class BanListCrud:
             session.rollback()
             raise
 
+    def _check_access(
+        self,
+        ban_list: BanList | None,
+        organization_id: int,
+        project_id: int,
+        require_owner: bool,
+    ) -> BanList:
+        if ban_list is None:
+            raise HTTPException(status_code=404, detail="Ban list not found")
+
+        if require_owner or not ban_list.is_public:
+            self.check_owner(ban_list, organization_id, project_id)
+
+        return ban_list
+
     def check_owner(
         self, ban_list: BanList, organization_id: int, project_id: int
     ) -> None:
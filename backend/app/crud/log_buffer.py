@@ -0,0 +1,68 @@
+from uuid import UUID
+
+from app.models.logging.request_log import RequestLog, RequestLogUpdate, RequestStatus
+from app.models.logging.validator_log import ValidatorLog
+from app.schemas.guardrail_config import GuardrailRequest
+from app.utils import now
+
+
+class LogBuffer:
+    """
+    Request log and validator logs of one request, built in memory and written
+    once the request is finished.
+    """
+
+    def __init__(self):
+        self.request_log: RequestLog | None = None
+        self.validator_logs: list[ValidatorLog] = []
+
+
+class BufferedRequestLogCrud:
+    """
+    RequestLogCrud counterpart that keeps the request log in a LogBuffer instead
+    of committing it, so the log is written once, already finished.
+    """
+
+    def __init__(self, buffer: LogBuffer):
+        self.buffer = buffer
+
+    def create(self, payload: GuardrailRequest) -> RequestLog:
+        self.buffer.request_log = RequestLog(
+            request_id=UUID(payload.request_id),
+            request_text=payload.input,
+            organization_id=payload.organization_id,
+            project_id=payload.project_id,
+        )
+        return self.buffer.request_log
+
+    def update(
+        self,
+        request_log_id: UUID,
+        request_status: RequestStatus,
+        request_log_update: RequestLogUpdate,
+    ):
+        request_log = self.buffer.request_log
+        if request_log is None or request_log.id != request_log_id:
+            raise ValueError(f"Request Log not found for id {request_log_id}")
+
+        update_data = request_log_update.model_dump(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(request_log, field, value)
+
+        request_log.updated_at = now()
+        request_log.status = request_status
+        return request_log
+
+
+class BufferedValidatorLogCrud:
+    """
+    ValidatorLogCrud counterpart that appends validator logs to a LogBuffer.
+    """
+
+    def __init__(self, buffer: LogBuffer):
+        self.buffer = buffer
+
+    def create(self, log: ValidatorLog) -> ValidatorLog:
+        log.updated_at = now()
+        self.buffer.validator_logs.append(log)
+        return log
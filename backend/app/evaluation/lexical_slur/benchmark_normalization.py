@@ -0,0 +1,59 @@
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from app.core.validators.lexical_slur import LexicalSlur
+from app.evaluation.common.helper import write_json
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+OUT_DIR = BASE_DIR / "outputs" / "lexical_slur"
+REPEATS = 5
+
+df = pd.read_csv(BASE_DIR / "datasets" / "lexical_slur_testing_dataset.csv")
+texts = df["commentText"].astype(str).tolist()
+
+validator = LexicalSlur()
+
+
+def time_normalizer(normalize) -> list[float]:
+    latencies = []
+    for _ in range(REPEATS):
+        for text in texts:
+            start = time.perf_counter()
+            normalize(text)
+            latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def summarize(latencies: list[float]) -> dict:
+    ordered = sorted(latencies)
+    return {
+        "mean": sum(ordered) / len(ordered),
+        "p50": ordered[len(ordered) // 2],
+        "p95": ordered[int(len(ordered) * 0.95)],
+        "max": ordered[-1],
+    }
+
+
+mismatches = [
+    text
+    for text in texts
+    if validator.normalize_for_matching(text) != validator.normalize_full(text)
+]
+
+full = summarize(time_normalizer(validator.normalize_full))
+tiered = summarize(time_normalizer(validator.normalize_for_matching))
+
+write_json(
+    {
+        "guardrail": "lexical_slur",
+        "benchmark": "normalization",
+        "num_samples": len(texts),
+        "fast_path_ratio": sum(map(validator.is_clean_ascii, texts)) / len(texts),
+        "mismatches": len(mismatches),
+        "latency_ms": {"full": full, "tiered": tiered},
+        "speedup_mean": full["mean"] / tiered["mean"] if tiered["mean"] else None,
+    },
+    OUT_DIR / "normalization_benchmark.json",
+)
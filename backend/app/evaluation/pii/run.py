@@ -1,41 +1,138 @@
+import argparse
 from pathlib import Path
+import time
+
 import pandas as pd
 from guardrails.validators import FailResult
 
+from app.core.config import settings
 from app.core.validators.pii_remover import PIIRemover
+from app.core.validators.utils.presidio_registry import presidio_registry
 from app.evaluation.pii.entity_metrics import compute_entity_metrics
-from app.evaluation.common.helper import write_csv, write_json
+from app.evaluation.common.helper import Profiler, write_csv, write_json
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 OUT_DIR = BASE_DIR / "outputs" / "pii_remover"
 
-df = pd.read_csv(BASE_DIR / "datasets" / "pii_detection_testing_dataset.csv")
 
-validator = PIIRemover()
+def overall_metrics(entity_report: dict) -> dict:
+    """
+    Micro-averaged precision / recall / F1 over all entity types.
+    """
+    tp = sum(s["tp"] for s in entity_report.values())
+    fp = sum(s["fp"] for s in entity_report.values())
+    fn = sum(s["fn"] for s in entity_report.values())
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {"precision": precision, "recall": recall, "f1": f1}
 
 
-def run_pii(text: str) -> str:
-    result = validator._validate(text)
-    if isinstance(result, FailResult):
-        return result.fix_value
-    return text
+def evaluate(df: pd.DataFrame, model_name: str, excluded_components: list[str]):
+    """
+    Runs PIIRemover on the dataset after reconfiguring the shared Presidio
+    registry, so each model and pipeline choice is loaded and measured from scratch.
+    """
+    df = df.copy()
 
+    with Profiler() as p:
+        start = time.perf_counter()
+        presidio_registry.configure(model_name, excluded_components)
+        validator = PIIRemover()
+        validator._validate("Warm up sample text for validators.")
+        load_ms = (time.perf_counter() - start) * 1000
 
-df["anonymized"] = df["source_text"].astype(str).apply(run_pii)
+        def run_pii(text: str) -> str:
+            result = p.record(validator._validate, text)
+            if isinstance(result, FailResult):
+                return result.fix_value
+            return text
 
-entity_report = compute_entity_metrics(
-    df["target_text"],
-    df["anonymized"],
-)
+        df["anonymized"] = df["source_text"].astype(str).apply(run_pii)
 
-# ---- Save outputs ----
-write_csv(df, OUT_DIR / "predictions.csv")
+    entity_report = compute_entity_metrics(df["target_text"], df["anonymized"])
 
-write_json(
-    {
+    metrics = {
         "guardrail": "pii_remover",
         "num_samples": len(df),
+        "nlp": {
+            "model": model_name,
+            "excluded_components": excluded_components,
+            "pipeline": presidio_registry.get_nlp_engine().nlp["en"].pipe_names,
+        },
+        "overall_metrics": overall_metrics(entity_report),
         "entity_metrics": entity_report,
-    },
-    OUT_DIR / "metrics.json",
-)
+        "performance": {
+            "load_ms": load_ms,
+            "latency_ms": {
+                "mean": sum(p.latencies) / len(p.latencies),
+                "p95": sorted(p.latencies)[int(len(p.latencies) * 0.95)],
+                "max": max(p.latencies),
+            },
+            "memory_mb": p.peak_memory_mb,
+        },
+    }
+    return df, metrics
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Evaluate PIIRemover, optionally across spaCy models."
+    )
+    parser.add_argument(
+        "--models",
+        nargs="+",
+        help=(
+            "spaCy models to compare, e.g. en_core_web_sm en_core_web_lg "
+            f"(default: {settings.PII_SPACY_MODEL})"
+        ),
+    )
+    parser.add_argument(
+        "--exclude",
+        nargs="*",
+        default=None,
+        help=(
+            "pipeline components to exclude "
+            f"(default: {' '.join(settings.PII_SPACY_EXCLUDED_COMPONENTS)})"
+        ),
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    df = pd.read_csv(BASE_DIR / "datasets" / "pii_detection_testing_dataset.csv")
+    excluded = (
+        list(settings.PII_SPACY_EXCLUDED_COMPONENTS)
+        if args.exclude is None
+        else args.exclude
+    )
+
+    if not args.models:
+        predictions, metrics = evaluate(df, settings.PII_SPACY_MODEL, excluded)
+        write_csv(predictions, OUT_DIR / "predictions.csv")
+        write_json(metrics, OUT_DIR / "metrics.json")
+        return
+
+    # ---- Compare models: one output folder per model plus a summary ----
+    summary = []
+    for model_name in args.models:
+        predictions, metrics = evaluate(df, model_name, excluded)
+        write_csv(predictions, OUT_DIR / model_name / "predictions.csv")
+        write_json(metrics, OUT_DIR / model_name / "metrics.json")
+        summary.append(
+            {
+                **metrics["nlp"],
+                "f1": metrics["overall_metrics"]["f1"],
+                **metrics["performance"],
+            }
+        )
+
+    write_json(
+        {"guardrail": "pii_remover", "num_samples": len(df), "models": summary},
+        OUT_DIR / "nlp_benchmark.json",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,19 @@
+from contextlib import asynccontextmanager
+
 from asgi_correlation_id.middleware import CorrelationIdMiddleware
 import sentry_sdk
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.routing import APIRoute
 
 from app.api.main import api_router
 from app.core.config import settings
+from app.core.db import async_engine
 from app.core.exception_handlers import register_exception_handlers
+from app.core.log_writer import log_writer
 from app.core.middleware import http_request_logger
+from app.core.validator_pool import validator_pool
+from app.core.warmup import validator_warmup
 from app.load_env import load_environment
 
 # Load environment variables
@@ -21,8 +28,34 @@ def custom_generate_unique_id(route: APIRoute) -> str:
 if settings.SENTRY_DSN and settings.ENVIRONMENT != "local":
     sentry_sdk.init(dsn=str(settings.SENTRY_DSN), enable_tracing=True)
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # Uvicorn only starts accepting connections once startup has finished, so
+    # validators are warm before the first request reaches this worker.
+    # Under app.prefork the master has already warmed up before forking.
+    if validator_warmup.is_ready():
+        pass
+    elif settings.VALIDATOR_WARMUP_ENABLED:
+        # Warm-up blocks on model loading; keep it off the event loop.
+        await run_in_threadpool(validator_warmup.run)
+    else:
+        validator_warmup.mark_skipped()
+    if validator_pool.enabled:
+        # Each worker starts its own pool; startup fails if it does not come up.
+        await run_in_threadpool(
+            validator_pool.start,
+            settings.VALIDATOR_PROCESS_POOL_STARTUP_TIMEOUT_SECONDS,
+        )
+    yield
+    log_writer.drain(timeout=settings.LOG_WRITER_DRAIN_TIMEOUT_SECONDS)
+    validator_pool.shutdown()
+    await async_engine.dispose()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
+    lifespan=lifespan,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
 )
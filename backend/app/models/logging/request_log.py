@@ -18,6 +18,9 @@ class RequestStatus(str, Enum):
 class RequestLog(SQLModel, table=True):
     __tablename__ = "request_log"
 
+    # The table is partitioned by month of inserted_at (migration 006), so its
+    # primary key in the database is (id, inserted_at). The ORM identifies rows
+    # by id alone.
     id: UUID = Field(
         default_factory=uuid4,
         primary_key=True,
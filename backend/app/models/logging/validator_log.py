@@ -15,6 +15,9 @@ class ValidatorOutcome(str, Enum):
 class ValidatorLog(SQLModel, table=True):
     __tablename__ = "validator_log"
 
+    # The table is partitioned by month of inserted_at (migration 006), so its
+    # primary key in the database is (id, inserted_at). The ORM identifies rows
+    # by id alone.
     id: UUID = Field(
         default_factory=uuid4,
         primary_key=True,
@@ -31,10 +34,11 @@ class ValidatorLog(SQLModel, table=True):
         sa_column_kwargs={"comment": "Identifier for the project"},
     )
 
+    # No foreign key: request_log is partitioned and only unique on
+    # (id, inserted_at), see migration 006.
     request_id: UUID = Field(
-        foreign_key="request_log.id",
         nullable=False,
-        sa_column_kwargs={"comment": "Foreign key to the associated request log entry"},
+        sa_column_kwargs={"comment": "Identifier of the associated request log entry"},
     )
 
     name: str = Field(
@@ -0,0 +1,245 @@
+"""
+Pre-fork server for production.
+
+The master process imports the app and warms every validator (slur lists, lexicons,
+Presidio/spaCy models) before forking the uvicorn workers, so the read-only model
+memory is shared copy-on-write between workers instead of being loaded once per
+worker. Workers serve on one listening socket inherited from the master.
+
+Usage: python -m app.prefork --workers 4 --port 80
+"""
+import argparse
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from pathlib import Path
+
+import uvicorn
+from uvicorn.main import STARTUP_FAILURE
+
+from app.core.db import async_engine, engine
+from app.core.warmup import validator_warmup
+from app.main import app
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+MEMORY_FIELDS = (
+    "Rss",
+    "Pss",
+    "Shared_Clean",
+    "Shared_Dirty",
+    "Private_Clean",
+    "Private_Dirty",
+)
+
+
+def read_memory_stats(
+    pid: int | str = "self", proc_root: Path = Path("/proc")
+) -> dict:
+    """
+    Returns RSS, PSS, shared and private memory in MB for a process, read from
+    smaps_rollup. PSS charges shared pages proportionally, so RSS - PSS is the
+    memory a worker saves by sharing pages with its siblings.
+    """
+    values = {}
+    try:
+        with open(proc_root / str(pid) / "smaps_rollup") as f:
+            for line in f:
+                parts = line.split()
+                key = parts[0].rstrip(":")
+                if key in MEMORY_FIELDS:
+                    values[key] = int(parts[1]) / 1024  # kB -> MB
+    except (FileNotFoundError, PermissionError, IndexError, ValueError):
+        return {}
+
+    return {
+        "rss_mb": values.get("Rss", 0.0),
+        "pss_mb": values.get("Pss", 0.0),
+        "shared_mb": values.get("Shared_Clean", 0.0)
+        + values.get("Shared_Dirty", 0.0),
+        "private_mb": values.get("Private_Clean", 0.0)
+        + values.get("Private_Dirty", 0.0),
+    }
+
+
+def _log_memory(label: str, pid: int | str = "self") -> None:
+    stats = read_memory_stats(pid)
+    if not stats:
+        return
+    logger.info(
+        f"{label}: rss={stats['rss_mb']:.1f}MB pss={stats['pss_mb']:.1f}MB "
+        f"shared={stats['shared_mb']:.1f}MB private={stats['private_mb']:.1f}MB "
+        f"saved_by_sharing={stats['rss_mb'] - stats['pss_mb']:.1f}MB"
+    )
+
+
+class RestartBackoff:
+    """
+    Delay before replacing a worker that exited. A worker that dies within
+    `min_uptime` seconds of starting doubles the delay, up to `max_delay`, so a
+    worker that cannot start is not restarted in a tight loop. One that stayed
+    up longer resets it and is replaced at once.
+    """
+
+    def __init__(
+        self,
+        initial_delay: float = 0.5,
+        max_delay: float = 60.0,
+        min_uptime: float = 30.0,
+    ):
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.min_uptime = min_uptime
+        self.failures = 0
+
+    def next_delay(self, uptime: float) -> float:
+        if uptime >= self.min_uptime:
+            self.failures = 0
+            return 0.0
+        self.failures += 1
+        return min(self.max_delay, self.initial_delay * 2 ** (self.failures - 1))
+
+
+def _bind_socket(host: str, port: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(sock: socket.socket) -> int:
+    # Connections must never be shared across forks; the master has not opened any,
+    # but drop whatever the pool holds without closing the parent's sockets.
+    engine.dispose(close=False)
+    async_engine.sync_engine.dispose(close=False)
+    config = uvicorn.Config(
+        app,
+        proxy_headers=True,
+        forwarded_allow_ips="*",
+        log_level="info",
+    )
+    server = uvicorn.Server(config)
+    server.run(sockets=[sock])
+    # Uvicorn returns rather than raising when startup (the lifespan) fails.
+    return 0 if server.started else STARTUP_FAILURE
+
+
+def _spawn_worker(sock: socket.socket) -> int:
+    pid = os.fork()
+    if pid == 0:
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        # The master's restart log and backoff need to tell a crash from a stop.
+        exit_code = 1
+        try:
+            exit_code = _run_worker(sock)
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else 1
+        except BaseException:
+            logger.exception(f"Worker pid={os.getpid()} crashed")
+        finally:
+            os._exit(exit_code)
+    logger.info(f"Started worker pid={pid}")
+    return pid
+
+
+def serve(args: argparse.Namespace) -> None:
+    validator_warmup.run()
+    _log_memory("Master after warm-up")
+
+    # Move everything allocated so far out of the GC's reach; otherwise the first
+    # collection in each worker touches every object header and un-shares the pages.
+    gc.collect()
+    gc.freeze()
+
+    sock = _bind_socket(args.host, args.port)
+    # pid -> start time, and the times at which replacements are due
+    workers = {_spawn_worker(sock): time.monotonic() for _ in range(args.workers)}
+    restarts_due: list[float] = []
+    backoff = RestartBackoff(max_delay=args.max_restart_delay)
+    shutting_down = False
+
+    def _shutdown(_signum, _frame):
+        nonlocal shutting_down
+        shutting_down = True
+        restarts_due.clear()
+        for pid in workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, _shutdown)
+    signal.signal(signal.SIGINT, _shutdown)
+
+    last_report = 0.0
+    while workers or restarts_due:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            pid, status = 0, 0
+            if not restarts_due:
+                break
+
+        if pid:
+            started = workers.pop(pid, None)
+            if not shutting_down:
+                uptime = time.monotonic() - (started or 0.0)
+                delay = backoff.next_delay(uptime)
+                logger.warning(
+                    f"Worker pid={pid} exited with code "
+                    f"{os.waitstatus_to_exitcode(status)} after "
+                    f"{uptime:.1f}s; restarting in {delay:.1f}s"
+                )
+                restarts_due.append(time.monotonic() + delay)
+            continue
+
+        now = time.monotonic()
+        for due in [due for due in restarts_due if due <= now]:
+            restarts_due.remove(due)
+            workers[_spawn_worker(sock)] = time.monotonic()
+
+        report_due = now - last_report >= args.memory_report_interval
+        if args.memory_report_interval and report_due:
+            last_report = now
+            for worker_pid in sorted(workers):
+                _log_memory(f"Worker pid={worker_pid}", worker_pid)
+
+        time.sleep(0.5)
+
+    sock.close()
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Run the API with pre-forked workers."
+    )
+    parser.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8000")))
+    parser.add_argument(
+        "--workers", type=int, default=int(os.getenv("WEB_CONCURRENCY", "4"))
+    )
+    parser.add_argument(
+        "--memory-report-interval",
+        type=float,
+        default=float(os.getenv("PREFORK_MEMORY_REPORT_INTERVAL", "300")),
+        help="Seconds between per-worker memory reports (0 disables).",
+    )
+    parser.add_argument(
+        "--max-restart-delay",
+        type=float,
+        default=float(os.getenv("PREFORK_MAX_RESTART_DELAY", "60")),
+        help="Longest wait before replacing a worker that keeps failing to start.",
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    serve(parse_args(sys.argv[1:]))
@@ -2,14 +2,19 @@
 import os
 
 os.environ["ENVIRONMENT"] = "testing"
+os.environ.setdefault("VALIDATOR_WARMUP_ENABLED", "false")
 
 import pytest
 from fastapi import Header
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
 from sqlmodel import Session, create_engine, SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.main import app
 from app.api.deps import (
+    get_async_db,
     SessionDep,
     TenantContext,
     validate_multitenant_key,
@@ -35,12 +40,25 @@ test_engine = create_engine(
     pool_pre_ping=True,
 )
 
+# Each TestClient runs the app on its own event loop, and asyncio connections
+# cannot be shared between loops, so nothing is pooled.
+test_async_engine = create_async_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    echo=False,
+    poolclass=NullPool,
+)
+
 
 def override_session():
     with Session(test_engine) as session:
         yield session
 
 
+async def override_async_session():
+    async with AsyncSession(test_async_engine, expire_on_commit=False) as session:
+        yield session
+
+
 def seed_test_data(session: Session) -> None:
     for payload in BAN_LIST_PAYLOADS.values():
         session.add(
@@ -110,6 +128,7 @@ def override_dependencies():
     app.dependency_overrides[validate_multitenant_key] = override_multitenant_key
 
     app.dependency_overrides[SessionDep] = override_session
+    app.dependency_overrides[get_async_db] = override_async_session
 
     yield
 
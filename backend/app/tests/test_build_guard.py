@@ -1,7 +1,10 @@
 import pytest
 from unittest.mock import Mock, patch
 
-from app.core.guardrail_controller import build_guard
+from app.core.guardrail_controller import ValidatorCache, build_guard
+from app.core.validators.config.ban_list_safety_validator_config import (
+    BanListSafetyValidatorConfig,
+)
 
 
 def test_build_guard_with_validators():
@@ -73,3 +76,60 @@ def test_build_guard_use_many_failure():
     ):
         with pytest.raises(RuntimeError, match="guard failure"):
             build_guard([cfg])
+
+
+def _ban_list_config(words):
+    return BanListSafetyValidatorConfig(type="ban_list", banned_words=words)
+
+
+def test_validator_cache_reuses_validators_for_identical_configs():
+    cache = ValidatorCache(max_size=4)
+
+    with patch.object(
+        BanListSafetyValidatorConfig, "build", side_effect=lambda: Mock()
+    ) as build_mock:
+        first = cache.get_or_build([_ban_list_config(["foo"])])
+        second = cache.get_or_build([_ban_list_config(["foo"])])
+
+    assert build_mock.call_count == 1
+    assert first == second
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_validator_cache_key_is_order_preserving():
+    a = _ban_list_config(["foo"])
+    b = _ban_list_config(["bar"])
+
+    assert ValidatorCache.make_key([a, b]) != ValidatorCache.make_key([b, a])
+    assert ValidatorCache.make_key([a, b]) == ValidatorCache.make_key(
+        [_ban_list_config(["foo"]), _ban_list_config(["bar"])]
+    )
+
+
+def test_validator_cache_evicts_least_recently_used():
+    cache = ValidatorCache(max_size=1)
+
+    with patch.object(
+        BanListSafetyValidatorConfig, "build", side_effect=lambda: Mock()
+    ) as build_mock:
+        cache.get_or_build([_ban_list_config(["foo"])])
+        cache.get_or_build([_ban_list_config(["bar"])])
+        cache.get_or_build([_ban_list_config(["foo"])])
+
+    assert build_mock.call_count == 3
+    assert cache.stats()["evictions"] == 2
+    assert cache.stats()["size"] == 1
+
+
+def test_validator_cache_disabled_when_max_size_is_zero():
+    cache = ValidatorCache(max_size=0)
+
+    with patch.object(
+        BanListSafetyValidatorConfig, "build", side_effect=lambda: Mock()
+    ) as build_mock:
+        cache.get_or_build([_ban_list_config(["foo"])])
+        cache.get_or_build([_ban_list_config(["foo"])])
+
+    assert build_mock.call_count == 2
+    assert cache.stats()["size"] == 0
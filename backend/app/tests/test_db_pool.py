@@ -0,0 +1,59 @@
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, exc
+
+from app.core.db_pool import TimedQueuePool, engine_options, pool_stats
+
+DB_POOL_API_PATH = "/api/v1/utils/db-pool/"
+
+
+def _engine(**kwargs):
+    return create_engine(
+        "sqlite://", poolclass=TimedQueuePool, pool_size=1, max_overflow=0, **kwargs
+    )
+
+
+def test_reports_checked_out_connections():
+    engine = _engine()
+
+    with engine.connect():
+        stats = pool_stats(engine.pool)
+
+    assert stats["pool"] == "TimedQueuePool"
+    assert stats["checked_out"] == 1
+    assert stats["checkouts"] == 1
+    assert pool_stats(engine.pool)["checked_out"] == 0
+
+
+def test_records_pool_timeouts():
+    engine = _engine(pool_timeout=0.01)
+
+    with engine.connect():
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    stats = pool_stats(engine.pool)
+    assert stats["timeouts"] == 1
+    assert stats["wait_ms_max"] >= 5
+
+
+def test_engine_options_set_statement_timeout():
+    with patch("app.core.db_pool.settings.DB_STATEMENT_TIMEOUT_MS", 500):
+        options = engine_options()
+
+    assert options["connect_args"] == {"options": "-c statement_timeout=500"}
+
+
+def test_engine_options_without_statement_timeout():
+    with patch("app.core.db_pool.settings.DB_STATEMENT_TIMEOUT_MS", 0):
+        assert "connect_args" not in engine_options()
+
+
+def test_db_pool_endpoint_reports_both_engines(client):
+    response = client.get(DB_POOL_API_PATH)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert set(body) == {"sync", "async"}
+    assert "checked_out" in body["sync"]
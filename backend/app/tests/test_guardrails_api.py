@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -10,19 +10,17 @@ from app.tests.seed_data import (
 from app.tests.utils.constants import SAFE_TEXT_FIELD, VALIDATE_API_PATH
 
 build_guard_path = "app.api.routes.guardrails.build_guard"
-crud_path = "app.api.routes.guardrails.RequestLogCrud"
 
 request_id = "123e4567-e89b-12d3-a456-426614174000"
 organization_id = VALIDATOR_TEST_ORGANIZATION_ID
 project_id = VALIDATOR_TEST_PROJECT_ID
 
 
-@pytest.fixture
-def mock_crud():
-    with patch(crud_path) as mock:
-        instance = mock.return_value
-        instance.create.return_value = MagicMock(id=1)
-        yield instance
+@pytest.fixture(autouse=True)
+def guard_mode():
+    # These tests mock the Guard, so they run in Guard compatibility mode.
+    with patch("app.api.routes.guardrails.settings.VALIDATOR_EXECUTION_MODE", "guard"):
+        yield
 
 
 def test_route_exists(client):
@@ -55,7 +53,7 @@ def test_validate_guardrails_success(client):
     assert "response_id" in body["data"]
 
 
-def test_validate_guardrails_failure(client, mock_crud):
+def test_validate_guardrails_failure(client):
     class MockGuard:
         def validate(self, data):
             return MockResult(validated_output=None)
@@ -80,7 +78,7 @@ def test_validate_guardrails_failure(client, mock_crud):
     assert body["error"]
 
 
-def test_guardrails_internal_error(client, mock_crud):
+def test_guardrails_internal_error(client):
     with patch(build_guard_path, side_effect=Exception("Invalid validator config")):
         response = client.post(
             VALIDATE_API_PATH,
@@ -99,3 +97,31 @@ def test_guardrails_internal_error(client, mock_crud):
     assert body["success"] is False
     assert SAFE_TEXT_FIELD not in body["data"]
     assert "Invalid validator config" in body["error"]
+
+
+def test_validate_guardrails_write_once_logging(client):
+    class MockGuard:
+        def validate(self, data):
+            return MockResult(validated_output="clean text")
+
+    with patch(build_guard_path, return_value=MockGuard()), patch(
+        "app.api.routes.guardrails.settings.REQUEST_LOG_WRITE_MODE", "write_once"
+    ), patch(
+        "app.api.routes.guardrails.insert_logs_async"
+    ) as mock_insert_logs:
+        response = client.post(
+            VALIDATE_API_PATH,
+            json={
+                "request_id": request_id,
+                "organization_id": organization_id,
+                "project_id": project_id,
+                "input": "hello world",
+                "validators": [],
+            },
+        )
+
+    assert response.status_code == 200
+    assert response.json()["data"][SAFE_TEXT_FIELD] == "clean text"
+    (entry,) = mock_insert_logs.call_args.args[0]
+    assert entry.request_log.status == "success"
+    assert entry.request_log.response_text == "clean text"
@@ -0,0 +1,153 @@
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.exc import OperationalError
+
+from app.core.log_partitions import (
+    add_months,
+    drop_expired_partitions,
+    maintain_partitions,
+    partition_name,
+)
+
+module_path = "app.core.log_partitions"
+
+
+def test_add_months_crosses_years():
+    assert add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+
+def test_partition_name():
+    assert partition_name("request_log", date(2026, 3, 1)) == "request_log_p202603"
+
+
+def test_maintain_creates_missing_months_and_drops_expired():
+    existing = {
+        date(2025, 12, 1): "request_log_p202512",
+        date(2026, 1, 1): "request_log_p202601",
+        date(2026, 3, 1): "request_log_p202603",
+    }
+
+    with patch(f"{module_path}.is_partitioned", return_value=True), patch(
+        f"{module_path}.list_partitions", side_effect=lambda c, t: dict(existing)
+    ), patch(
+        f"{module_path}.create_partition",
+        side_effect=lambda c, table, month: partition_name(table, month),
+    ) as mock_create, patch(
+        f"{module_path}.drop_expired_partitions", return_value=[]
+    ) as mock_drop:
+        result = maintain_partitions(
+            MagicMock(),
+            current_time=datetime(2026, 3, 15),
+            months_ahead=1,
+            retention_days=60,
+        )
+
+    assert result["created"] == ["request_log_p202604", "validator_log_p202604"]
+    assert mock_create.call_count == 2
+    cutoff = mock_drop.call_args.args[3]
+    assert cutoff == datetime(2026, 1, 14)
+
+
+def test_maintain_keeps_everything_without_retention():
+    with patch(f"{module_path}.is_partitioned", return_value=True), patch(
+        f"{module_path}.list_partitions", return_value={}
+    ), patch(f"{module_path}.create_partition"), patch(
+        f"{module_path}.drop_expired_partitions"
+    ) as mock_drop:
+        maintain_partitions(
+            MagicMock(), current_time=datetime(2026, 3, 15), retention_days=0
+        )
+
+    mock_drop.assert_not_called()
+
+
+def test_maintain_skips_unpartitioned_tables():
+    with patch(f"{module_path}.is_partitioned", return_value=False), patch(
+        f"{module_path}.create_partition"
+    ) as mock_create:
+        result = maintain_partitions(MagicMock(), current_time=datetime(2026, 3, 15))
+
+    mock_create.assert_not_called()
+    assert result == {"created": [], "dropped": []}
+
+
+def test_maintain_uses_autocommit_connection_only_for_retention():
+    bind = MagicMock()
+    with patch(f"{module_path}.is_partitioned", return_value=True), patch(
+        f"{module_path}.list_partitions", return_value={}
+    ), patch(f"{module_path}.create_partition"), patch(
+        f"{module_path}.drop_expired_partitions", return_value=[]
+    ):
+        maintain_partitions(bind, current_time=datetime(2026, 3, 15), retention_days=30)
+
+    bind.begin.assert_called_once()
+    connection = bind.connect.return_value.__enter__.return_value
+    connection.execution_options.assert_called_once_with(isolation_level="AUTOCOMMIT")
+
+
+PARTITIONS = {
+    date(2025, 12, 1): "request_log_p202512",
+    date(2026, 1, 1): "request_log_p202601",
+    date(2026, 2, 1): "request_log_p202602",
+}
+
+
+def _statements(connection):
+    return [str(call.args[0]) for call in connection.execute.call_args_list]
+
+
+def test_drop_expired_partitions_detaches_then_drops_whole_months_before_cutoff():
+    connection = MagicMock()
+
+    with patch(f"{module_path}.has_default_partition", return_value=True):
+        dropped = drop_expired_partitions(
+            connection, "request_log", PARTITIONS, datetime(2026, 2, 1), 100
+        )
+
+    assert dropped == ["request_log_p202512", "request_log_p202601"]
+    statements = _statements(connection)
+    assert statements[:6] == [
+        "SET lock_timeout = 100",
+        "ALTER TABLE request_log DETACH PARTITION request_log_p202512",
+        "DROP TABLE request_log_p202512",
+        "ALTER TABLE request_log DETACH PARTITION request_log_p202601",
+        "DROP TABLE request_log_p202601",
+        "RESET lock_timeout",
+    ]
+    assert statements[6].startswith("DELETE FROM request_log_default")
+
+
+def test_drop_expired_partitions_detaches_concurrently_without_default_partition():
+    connection = MagicMock()
+
+    with patch(f"{module_path}.has_default_partition", return_value=False):
+        drop_expired_partitions(
+            connection, "request_log", PARTITIONS, datetime(2026, 1, 1)
+        )
+
+    assert (
+        "ALTER TABLE request_log DETACH PARTITION request_log_p202512 CONCURRENTLY"
+        in _statements(connection)
+    )
+
+
+def test_drop_expired_partitions_leaves_partition_it_cannot_lock():
+    connection = MagicMock()
+
+    def execute(statement, *_args):
+        if "DETACH" in str(statement):
+            raise OperationalError(str(statement), {}, Exception("lock timeout"))
+
+    connection.execute.side_effect = execute
+
+    with patch(f"{module_path}.has_default_partition", return_value=True):
+        dropped = drop_expired_partitions(
+            connection, "request_log", PARTITIONS, datetime(2026, 2, 1)
+        )
+
+    assert dropped == []
+    statements = _statements(connection)
+    assert not any(statement.startswith("DROP") for statement in statements)
+    assert "RESET lock_timeout" in statements
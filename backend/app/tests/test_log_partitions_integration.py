@@ -0,0 +1,111 @@
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import text
+
+from app.core.log_partitions import (
+    create_partition,
+    drop_expired_partitions,
+    has_default_partition,
+    list_partitions,
+)
+from app.tests.conftest import test_engine
+
+pytestmark = pytest.mark.integration
+
+# A table of its own: the log tables of the test database are created from the
+# models and are not partitioned.
+TABLE = "partition_test_log"
+
+
+@pytest.fixture
+def partitioned_table():
+    with test_engine.begin() as connection:
+        connection.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+        connection.execute(
+            text(
+                f"CREATE TABLE {TABLE} (id integer NOT NULL, "
+                "inserted_at timestamp NOT NULL) PARTITION BY RANGE (inserted_at)"
+            )
+        )
+        connection.execute(
+            text(f"CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT")
+        )
+    yield TABLE
+    with test_engine.begin() as connection:
+        connection.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+
+
+def _insert(connection, *rows):
+    for row_id, inserted_at in rows:
+        connection.execute(
+            text(f"INSERT INTO {TABLE} VALUES (:id, :inserted_at)"),
+            {"id": row_id, "inserted_at": inserted_at},
+        )
+
+
+def _ids(connection, table):
+    return sorted(connection.execute(text(f"SELECT id FROM {table}")).scalars())
+
+
+@pytest.mark.usefixtures("partitioned_table")
+def test_create_partition_routes_new_rows_to_it():
+    with test_engine.begin() as connection:
+        name = create_partition(connection, TABLE, date(2026, 3, 1))
+        _insert(connection, (1, datetime(2026, 3, 10)))
+
+        assert name == f"{TABLE}_p202603"
+        assert list_partitions(connection, TABLE) == {date(2026, 3, 1): name}
+        assert _ids(connection, name) == [1]
+        assert _ids(connection, f"{TABLE}_default") == []
+
+
+@pytest.mark.usefixtures("partitioned_table")
+def test_create_partition_moves_month_rows_out_of_default():
+    with test_engine.begin() as connection:
+        _insert(
+            connection,
+            (1, datetime(2026, 3, 1)),
+            (2, datetime(2026, 3, 31, 23, 59)),
+            (3, datetime(2026, 4, 1)),
+        )
+
+        name = create_partition(connection, TABLE, date(2026, 3, 1))
+
+        assert list_partitions(connection, TABLE) == {date(2026, 3, 1): name}
+        assert _ids(connection, name) == [1, 2]
+        assert _ids(connection, f"{TABLE}_default") == [3]
+        assert _ids(connection, TABLE) == [1, 2, 3]
+
+
+@pytest.mark.usefixtures("partitioned_table")
+def test_drop_expired_partitions_detaches_and_drops():
+    with test_engine.begin() as connection:
+        partitions = {
+            month: create_partition(connection, TABLE, month)
+            for month in (date(2026, 1, 1), date(2026, 2, 1))
+        }
+        # Rows in the default partition older than the cutoff are deleted too.
+        _insert(
+            connection,
+            (1, datetime(2025, 6, 1)),
+            (2, datetime(2026, 1, 15)),
+            (3, datetime(2026, 2, 15)),
+        )
+
+    with test_engine.connect() as connection:
+        connection.execution_options(isolation_level="AUTOCOMMIT")
+        assert has_default_partition(connection, TABLE)
+
+        dropped = drop_expired_partitions(
+            connection, TABLE, partitions, datetime(2026, 2, 10)
+        )
+
+        assert dropped == [f"{TABLE}_p202601"]
+        assert connection.execute(
+            text(f"SELECT to_regclass('{TABLE}_p202601')")
+        ).scalar() is None
+        assert list_partitions(connection, TABLE) == {
+            date(2026, 2, 1): f"{TABLE}_p202602"
+        }
+        assert _ids(connection, TABLE) == [3]
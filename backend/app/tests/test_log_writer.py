@@ -0,0 +1,203 @@
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.core.log_writer import (
+    LogEntry,
+    LogWriter,
+    insert_logs,
+    insert_logs_async,
+)
+from app.crud.log_buffer import (
+    BufferedRequestLogCrud,
+    BufferedValidatorLogCrud,
+    LogBuffer,
+)
+from app.models.logging.request_log import RequestLogUpdate, RequestStatus
+from app.schemas.guardrail_config import GuardrailRequest
+from app.tests.seed_data import (
+    VALIDATOR_TEST_ORGANIZATION_ID,
+    VALIDATOR_TEST_PROJECT_ID,
+)
+
+
+def _writer(write, **kwargs):
+    options = {
+        "max_queue_size": 100,
+        "batch_size": 3,
+        "flush_interval_ms": 20,
+        "enqueue_timeout_ms": 10,
+    }
+    options.update(kwargs)
+    return LogWriter(write=write, **options)
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert condition()
+
+
+def test_writes_full_batches():
+    batches = []
+    writer = _writer(
+        lambda entries: batches.append(list(entries)), flush_interval_ms=500
+    )
+
+    for i in range(3):
+        writer.submit(f"request-{i}", [f"validator-{i}"])
+
+    _wait_for(lambda: len(batches) == 1)
+    assert [entry.request_log for entry in batches[0]] == [
+        "request-0",
+        "request-1",
+        "request-2",
+    ]
+    assert batches[0][0].validator_logs == ["validator-0"]
+    writer.drain(timeout=1)
+
+
+def test_flushes_partial_batch_after_interval():
+    batches = []
+    writer = _writer(lambda entries: batches.append(list(entries)))
+
+    writer.submit("request", [])
+
+    _wait_for(lambda: len(batches) == 1)
+    assert writer.stats()["written"] == 1
+    writer.drain(timeout=1)
+
+
+def test_full_queue_writes_inline():
+    release = threading.Event()
+    written = []
+
+    def write(entries):
+        if threading.current_thread().name == "log-writer":
+            release.wait(2)
+        written.extend(entry.request_log for entry in entries)
+
+    writer = _writer(write, max_queue_size=1, batch_size=1, flush_interval_ms=0)
+    writer.submit("first", [])  # taken by the writer thread, which then blocks
+    _wait_for(lambda: writer.stats()["queued"] == 0)
+    writer.submit("second", [])  # fills the queue
+
+    writer.submit("third", [])
+
+    assert written == ["third"]
+    assert writer.stats()["written_inline"] == 1
+    release.set()
+    writer.drain(timeout=1)
+    assert sorted(written) == ["first", "second", "third"]
+
+
+def test_drain_writes_queued_logs_and_later_ones_inline():
+    written = []
+    writer = _writer(
+        lambda entries: written.extend(e.request_log for e in entries),
+        flush_interval_ms=1000,
+        batch_size=10,
+    )
+    writer.submit("queued", [])
+
+    writer.drain(timeout=1)
+    assert written == ["queued"]
+
+    writer.submit("late", [])
+    assert written == ["queued", "late"]
+
+
+def test_failed_batch_is_retried_per_request():
+    written = []
+
+    def write(entries):
+        if len(entries) > 1 or entries[0].request_log == "bad":
+            raise RuntimeError("insert failed")
+        written.append(entries[0].request_log)
+
+    writer = _writer(write, flush_interval_ms=1000)
+    for name in ("good-1", "bad", "good-2"):
+        writer.submit(name, [])
+
+    _wait_for(lambda: writer.stats()["failed"] == 1)
+    assert written == ["good-1", "good-2"]
+    writer.drain(timeout=1)
+
+
+def _payload(request_id=None):
+    return GuardrailRequest(
+        request_id=request_id or str(uuid4()),
+        organization_id=VALIDATOR_TEST_ORGANIZATION_ID,
+        project_id=VALIDATOR_TEST_PROJECT_ID,
+        input="hello",
+        validators=[],
+    )
+
+
+def test_buffered_cruds_build_finished_logs_in_memory():
+    buffer = LogBuffer()
+    request_log_crud = BufferedRequestLogCrud(buffer)
+    validator_log_crud = BufferedValidatorLogCrud(buffer)
+
+    request_log = request_log_crud.create(_payload())
+    response_id = uuid4()
+    request_log_crud.update(
+        request_log_id=request_log.id,
+        request_status=RequestStatus.SUCCESS,
+        request_log_update=RequestLogUpdate(
+            response_text="hello", response_id=response_id
+        ),
+    )
+    validator_log = MagicMock()
+    validator_log_crud.create(log=validator_log)
+
+    assert buffer.request_log is request_log
+    assert request_log.status == RequestStatus.SUCCESS
+    assert request_log.response_id == response_id
+    assert buffer.validator_logs == [validator_log]
+
+
+def test_buffered_request_log_rejects_invalid_request_id():
+    with pytest.raises(ValueError):
+        BufferedRequestLogCrud(LogBuffer()).create(_payload(request_id="not-a-uuid"))
+
+
+def test_insert_logs_writes_one_statement_per_table():
+    session = MagicMock()
+    entries = [
+        LogEntry(MagicMock(), [MagicMock(), MagicMock()]),
+        LogEntry(MagicMock(), []),
+    ]
+
+    insert_logs(entries, session=session)
+
+    assert session.execute.call_count == 2
+    request_rows = session.execute.call_args_list[0].args[1]
+    validator_rows = session.execute.call_args_list[1].args[1]
+    assert len(request_rows) == 2
+    assert len(validator_rows) == 2
+    session.commit.assert_called_once()
+    session.refresh.assert_not_called()
+
+
+def test_insert_logs_skips_empty_validator_logs():
+    session = MagicMock()
+
+    insert_logs([LogEntry(MagicMock(), [])], session=session)
+
+    assert session.execute.call_count == 1
+    session.commit.assert_called_once()
+
+
+async def test_insert_logs_async_writes_one_statement_per_table():
+    session = AsyncMock()
+    entries = [LogEntry(MagicMock(), [MagicMock()])]
+
+    await insert_logs_async(entries, session=session)
+
+    assert session.execute.await_count == 2
+    session.commit.assert_awaited_once()
@@ -0,0 +1,77 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from uvicorn.main import STARTUP_FAILURE
+
+from app.prefork import RestartBackoff, _spawn_worker, read_memory_stats
+
+SMAPS_ROLLUP = """\
+00400000-7ffd5a1ff000 ---p 00000000 00:00 0                      [rollup]
+Rss:              409600 kB
+Pss:              153600 kB
+Shared_Clean:     256000 kB
+Shared_Dirty:       5120 kB
+Private_Clean:     10240 kB
+Private_Dirty:    138240 kB
+"""
+
+
+def test_read_memory_stats_parses_smaps_rollup(tmp_path):
+    proc_dir = tmp_path / "123"
+    proc_dir.mkdir()
+    (proc_dir / "smaps_rollup").write_text(SMAPS_ROLLUP)
+
+    stats = read_memory_stats(123, proc_root=tmp_path)
+
+    assert stats == {
+        "rss_mb": 400.0,
+        "pss_mb": 150.0,
+        "shared_mb": 255.0,
+        "private_mb": 145.0,
+    }
+
+
+def test_read_memory_stats_missing_process_returns_empty(tmp_path):
+    assert read_memory_stats(999, proc_root=tmp_path) == {}
+
+
+def test_restart_backoff_doubles_for_workers_that_die_at_startup():
+    backoff = RestartBackoff(initial_delay=0.5, max_delay=3.0, min_uptime=30.0)
+
+    delays = [backoff.next_delay(uptime=1.0) for _ in range(5)]
+
+    assert delays == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+
+def test_restart_backoff_resets_after_a_healthy_worker():
+    backoff = RestartBackoff(initial_delay=0.5, min_uptime=30.0)
+    backoff.next_delay(uptime=1.0)
+    backoff.next_delay(uptime=1.0)
+
+    assert backoff.next_delay(uptime=120.0) == 0.0
+    assert backoff.next_delay(uptime=1.0) == 0.5
+
+
+class _Exited(Exception):
+    pass
+
+
+def _exit_code_of_worker(run_worker):
+    # `run_worker` stands in for _run_worker: a callable or an exception to raise.
+    with patch("app.prefork.os.fork", return_value=0), patch(
+        "app.prefork.signal.signal"
+    ), patch("app.prefork._run_worker", side_effect=run_worker), patch(
+        "app.prefork.os._exit", side_effect=_Exited
+    ) as mock_exit:
+        with pytest.raises(_Exited):
+            _spawn_worker(MagicMock())
+    return mock_exit.call_args.args[0]
+
+
+def test_worker_exit_code_reports_crash():
+    assert _exit_code_of_worker(RuntimeError("boom")) == 1
+
+
+def test_worker_exit_code_passes_run_result_through():
+    assert _exit_code_of_worker(lambda sock: 0) == 0
+    assert _exit_code_of_worker(lambda sock: STARTUP_FAILURE) == STARTUP_FAILURE
@@ -2,11 +2,13 @@ from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 import pytest
+from guardrails.validators import FailResult
 
 from app.api.routes.guardrails import (
     _resolve_ban_list_banned_words,
     _validate_with_guard,
 )
+from app.core.validator_executor import ExecutionResult, ValidatorRun
 from app.schemas.guardrail_config import GuardrailRequest
 from app.tests.guardrails_mocks import MockResult
 from app.tests.seed_data import (
@@ -20,6 +22,13 @@ mock_validator_log_crud = MagicMock()
 mock_request_log_id = uuid4()
 
 
+@pytest.fixture(autouse=True)
+def guard_mode():
+    # These tests mock the Guard; the parallel ones switch modes themselves.
+    with patch("app.api.routes.guardrails.settings.VALIDATOR_EXECUTION_MODE", "guard"):
+        yield
+
+
 def _build_payload(input_text: str) -> GuardrailRequest:
     return GuardrailRequest(
         request_id=str(uuid4()),
@@ -92,7 +101,82 @@ def test_validate_with_guard_exception():
     assert response.error == "Invalid config"
 
 
-def test_resolve_ban_list_banned_words_from_ban_list_id():
+def test_validate_with_guard_native_mode():
+    with patch(
+        "app.api.routes.guardrails.settings.VALIDATOR_EXECUTION_MODE", "native"
+    ), patch(
+        "app.api.routes.guardrails.run_validators",
+        return_value=ExecutionResult(validated_output="clean text"),
+    ) as mock_run, patch(
+        "app.api.routes.guardrails.build_guard"
+    ) as mock_build_guard:
+        response = _validate_with_guard(
+            payload=_build_payload("hello"),
+            request_log_crud=mock_request_log_crud,
+            request_log_id=mock_request_log_id,
+            validator_log_crud=mock_validator_log_crud,
+        )
+
+    assert response.success is True
+    assert response.data.safe_text == "clean text"
+    mock_run.assert_called_once_with([], "hello", parallel=False)
+    mock_build_guard.assert_not_called()
+
+
+def test_validate_with_guard_parallel_mode():
+    run = ValidatorRun(
+        validator_name="pii-remover",
+        value_before_validation="John",
+        value_after_validation="<PERSON>",
+        validation_result=FailResult(error_message="PII", fix_value="<PERSON>"),
+    )
+    validator_log_crud = MagicMock()
+
+    with patch(
+        "app.api.routes.guardrails.settings.VALIDATOR_EXECUTION_MODE", "parallel"
+    ), patch(
+        "app.api.routes.guardrails.run_validators",
+        return_value=ExecutionResult(validated_output="<PERSON>", runs=[run]),
+    ), patch(
+        "app.api.routes.guardrails.build_guard"
+    ) as mock_build_guard:
+        response = _validate_with_guard(
+            payload=_build_payload("John"),
+            request_log_crud=mock_request_log_crud,
+            request_log_id=mock_request_log_id,
+            validator_log_crud=validator_log_crud,
+        )
+
+    assert response.success is True
+    assert response.data.safe_text == "<PERSON>"
+    mock_build_guard.assert_not_called()
+    log = validator_log_crud.create.call_args.kwargs["log"]
+    assert log.name == "pii-remover"
+    assert log.output == "<PERSON>"
+
+
+def test_validate_with_guard_falls_back_to_guard():
+    class MockGuard:
+        def validate(self, data):
+            return MockResult(validated_output="clean text")
+
+    with patch(
+        "app.api.routes.guardrails.settings.VALIDATOR_EXECUTION_MODE", "parallel"
+    ), patch("app.api.routes.guardrails.run_validators", return_value=None), patch(
+        "app.api.routes.guardrails.build_guard", return_value=MockGuard()
+    ):
+        response = _validate_with_guard(
+            payload=_build_payload("hello"),
+            request_log_crud=mock_request_log_crud,
+            request_log_id=mock_request_log_id,
+            validator_log_crud=mock_validator_log_crud,
+        )
+
+    assert response.success is True
+    assert response.data.safe_text == "clean text"
+
+
+async def test_resolve_ban_list_banned_words_from_ban_list_id():
     ban_list_id = str(uuid4())
     payload = GuardrailRequest(
         request_id=str(uuid4()),
@@ -103,9 +187,9 @@ def test_resolve_ban_list_banned_words_from_ban_list_id():
     )
     mock_session = MagicMock()
 
-    with patch("app.api.routes.guardrails.ban_list_crud.get") as mock_get:
+    with patch("app.api.routes.guardrails.ban_list_crud.get_async") as mock_get:
         mock_get.return_value = MagicMock(banned_words=["foo", "bar"])
-        _resolve_ban_list_banned_words(payload, mock_session)
+        await _resolve_ban_list_banned_words(payload, mock_session)
 
     assert payload.validators[0].banned_words == ["foo", "bar"]
     mock_get.assert_called_once_with(
@@ -116,7 +200,7 @@ def test_resolve_ban_list_banned_words_from_ban_list_id():
     )
 
 
-def test_resolve_ban_list_banned_words_skips_lookup_when_banned_words_provided():
+async def test_resolve_ban_list_banned_words_skips_lookup_when_banned_words_provided():
     payload = GuardrailRequest(
         request_id=str(uuid4()),
         organization_id=VALIDATOR_TEST_ORGANIZATION_ID,
@@ -128,7 +212,7 @@ def test_resolve_ban_list_banned_words_skips_lookup_when_banned_words_provided()
     )
     mock_session = MagicMock()
 
-    with patch("app.api.routes.guardrails.ban_list_crud.get") as mock_get:
-        _resolve_ban_list_banned_words(payload, mock_session)
+    with patch("app.api.routes.guardrails.ban_list_crud.get_async") as mock_get:
+        await _resolve_ban_list_banned_words(payload, mock_session)
 
     mock_get.assert_not_called()
@@ -0,0 +1,251 @@
+from unittest.mock import MagicMock
+
+from guardrails import OnFailAction
+from guardrails.validators import (
+    FailResult,
+    PassResult,
+    Validator,
+    register_validator,
+)
+
+from app.core.validator_executor import (
+    ValidatorCostTracker,
+    ValidatorExecutor,
+    runs_from_guard,
+)
+
+
+@register_validator(name="test-replace-word", data_type="string")
+class ReplaceWord(Validator):
+    def __init__(self, word, replacement, on_fail=OnFailAction.FIX):
+        super().__init__(on_fail=on_fail, word=word, replacement=replacement)
+        self.word = word
+        self.replacement = replacement
+
+    def _validate(self, value, metadata=None):
+        if self.word not in value:
+            return PassResult(value=value)
+        return FailResult(
+            error_message=f"Found {self.word}",
+            fix_value=value.replace(self.word, self.replacement),
+        )
+
+
+@register_validator(name="test-cheap-word", data_type="string")
+class CheapWord(ReplaceWord):
+    pass
+
+
+executor = ValidatorExecutor(max_workers=2)
+
+
+def test_merges_fixes_of_all_validators():
+    validators = [
+        ReplaceWord("John", "<PERSON>"),
+        ReplaceWord("chairman", "chairperson"),
+        ReplaceWord("absent", "[X]"),
+    ]
+
+    result = executor.run(validators, "John is the chairman", parallel=True)
+
+    assert result.validated_output == "<PERSON> is the chairperson"
+    assert result.error is None
+    assert [run.validation_result.outcome for run in result.runs] == [
+        "fail",
+        "fail",
+        "pass",
+    ]
+    assert [run.value_after_validation for run in result.runs] == [
+        "<PERSON> is the chairman",
+        "John is the chairperson",
+        "John is the chairman",
+    ]
+    assert all(
+        run.value_before_validation == "John is the chairman" for run in result.runs
+    )
+
+
+def test_validators_see_original_text():
+    # In sequence the second validator would no longer find "John".
+    validators = [
+        ReplaceWord("John Smith", "<PERSON>"),
+        ReplaceWord("John", "[NAME]"),
+    ]
+
+    result = executor.run(validators, "Hi John Smith", parallel=True)
+
+    assert result.validated_output == "Hi <PERSON>"
+
+
+def test_exception_failure_returns_error():
+    validators = [
+        ReplaceWord("John", "<PERSON>"),
+        ReplaceWord("bad", "[X]", on_fail=OnFailAction.EXCEPTION),
+    ]
+
+    result = executor.run(validators, "John is bad")
+
+    assert result.validated_output is None
+    assert result.error == "Validation failed for field with errors: Found bad"
+    # Configured after the FIX validator, it checks the fixed text.
+    assert [run.value_before_validation for run in result.runs] == [
+        "John is bad",
+        "<PERSON> is bad",
+    ]
+    assert result.runs[1].validation_result.error_message == "Found bad"
+
+
+def test_exception_validator_after_fix_checks_fixed_text():
+    validators = [
+        ReplaceWord("John", "<PERSON>"),
+        ReplaceWord("John", "[X]", on_fail=OnFailAction.EXCEPTION),
+    ]
+
+    for parallel in (False, True):
+        result = executor.run(validators, "Hi John", parallel=parallel)
+
+        assert result.error is None
+        assert result.validated_output == "Hi <PERSON>"
+        assert [run.outcome for run in result.runs] == ["fail", "pass"]
+
+
+def test_exception_validators_before_fixes_run_first():
+    validators = [
+        ReplaceWord("John", "<PERSON>"),
+        ReplaceWord("bad", "[X]", on_fail=OnFailAction.EXCEPTION),
+    ]
+    leading = ReplaceWord("bad", "[X]", on_fail=OnFailAction.EXCEPTION)
+
+    result = executor.run([leading, *validators], "John is bad")
+
+    assert result.error == "Validation failed for field with errors: Found bad"
+    # The FIX validator is skipped once the request is blocked.
+    assert [run.value_before_validation for run in result.runs] == ["John is bad"]
+
+
+def test_exception_validators_run_cheapest_first_and_stop_at_failure():
+    costs = ValidatorCostTracker()
+    expensive = ReplaceWord("bad", "[X]", on_fail=OnFailAction.EXCEPTION)
+    cheap = CheapWord("bad", "[X]", on_fail=OnFailAction.EXCEPTION)
+    costs.record(expensive, 0.5)
+    costs.record(cheap, 0.001)
+    expensive._validate = MagicMock(wraps=expensive._validate)
+
+    result = ValidatorExecutor(max_workers=2, costs=costs).run(
+        [expensive, cheap], "bad text"
+    )
+
+    assert result.error == "Validation failed for field with errors: Found bad"
+    assert [run.validator_name for run in result.runs] == ["test-cheap-word"]
+    expensive._validate.assert_not_called()
+
+
+def test_cost_tracker_moving_average():
+    costs = ValidatorCostTracker(alpha=0.5)
+    validator = ReplaceWord("a", "b")
+
+    assert costs.estimate(validator) == 0.0
+    costs.record(validator, 1.0)
+    costs.record(validator, 3.0)
+
+    assert costs.estimate(validator) == 2.0
+    assert costs.stats() == {"test-replace-word": 2000.0}
+
+
+def test_custom_on_fail_rewrites_text_in_parallel():
+    validators = [
+        ReplaceWord("John", "<PERSON>"),
+        ReplaceWord("bad", "[X]", on_fail=lambda value, result: "Please rephrase"),
+        ReplaceWord("is", "[IS]"),
+    ]
+
+    result = executor.run(validators, "John is bad", parallel=True)
+
+    assert result.validated_output == "Please rephrase"
+    assert len(result.runs) == 2
+
+
+def test_supports_only_implemented_on_fail_actions():
+    assert executor.supports([ReplaceWord("a", "b")])
+    assert not executor.supports([ReplaceWord("a", "b", on_fail=OnFailAction.REASK)])
+
+
+def test_validators_needing_previous_fix_run_sequentially():
+    chained = ReplaceWord("<PERSON>", "<NAME>")
+    chained.requires_previous_fix = True
+    validators = [ReplaceWord("John", "<PERSON>"), chained]
+
+    assert not executor.can_parallelize(validators)
+    result = executor.run(validators, "Hi John", parallel=True)
+
+    assert result.validated_output == "Hi <NAME>"
+
+
+def test_sequential_run_passes_fixed_text_on():
+    validators = [
+        ReplaceWord("John Smith", "<PERSON>"),
+        ReplaceWord("<PERSON>", "<NAME>"),
+        ReplaceWord("absent", "[X]"),
+    ]
+
+    result = executor.run(validators, "Hi John Smith")
+
+    assert result.validated_output == "Hi <NAME>"
+    assert [run.value_before_validation for run in result.runs] == [
+        "Hi John Smith",
+        "Hi <PERSON>",
+        "Hi <NAME>",
+    ]
+
+
+def test_runs_are_typed():
+    result = executor.run([ReplaceWord("John", "<PERSON>")], "Hi John")
+
+    (run,) = result.runs
+    assert run.validator_name == "test-replace-word"
+    assert run.outcome == "fail"
+    assert run.fix_value == "Hi <PERSON>"
+    assert [(e.start, e.end, e.replacement) for e in run.spans] == [
+        (3, 7, "<PERSON>")
+    ]
+    assert run.duration_ms >= 0
+
+
+def test_sequential_custom_on_fail_continues_with_rewritten_text():
+    validators = [
+        ReplaceWord("bad", "[X]", on_fail=lambda value, result: "Please rephrase"),
+        ReplaceWord("rephrase", "reword"),
+    ]
+
+    result = executor.run(validators, "bad text")
+
+    assert result.validated_output == "Please reword"
+
+
+def test_no_validators_returns_input():
+    result = executor.run([], "text")
+
+    assert result.validated_output == "text"
+    assert result.runs == []
+
+
+def test_runs_from_guard_without_history():
+    assert runs_from_guard(None) == []
+    assert runs_from_guard(MagicMock(history=None)) == []
+
+
+def test_runs_from_guard_reads_last_iteration():
+    log = MagicMock(
+        validator_name="test-replace-word",
+        value_before_validation="a",
+        value_after_validation="b",
+        validation_result=PassResult(),
+    )
+    guard = MagicMock()
+    iteration = MagicMock(outputs=MagicMock(validator_logs=[log]))
+    guard.history.last.iterations = [iteration]
+
+    (run,) = runs_from_guard(guard)
+
+    assert run.validator_name == "test-replace-word"
+    assert run.value_after_validation == "b"
@@ -0,0 +1,218 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from unittest.mock import Mock, patch
+
+import pytest
+from guardrails.validators import PassResult
+
+from app.core.guardrail_controller import ValidatorCache, build_validator
+from app.core.validator_pool import ProcessPoolValidator, ValidatorPool
+from app.core.validators.config.ban_list_safety_validator_config import (
+    BanListSafetyValidatorConfig,
+)
+from app.core.validators.config.pii_remover_safety_validator_config import (
+    PIIRemoverSafetyValidatorConfig,
+)
+from app.core.validators.pii_remover import PIIRemover
+from app.core.warmup import _warm
+
+POOL_PATH = "app.core.validator_pool"
+
+
+def _pool(size=2, **kwargs):
+    options = {
+        "validator_types": ["pii_remover", "ban_list"],
+        "max_pending": 2,
+        "timeout": 0.05,
+        "ban_list_min_words": 3,
+    }
+    options.update(kwargs)
+    return ValidatorPool(size=size, **options)
+
+
+def _pii_config():
+    return PIIRemoverSafetyValidatorConfig(type="pii_remover")
+
+
+def test_offloads_configured_types_only():
+    pool = _pool(validator_types=["pii_remover"])
+
+    assert pool.should_offload(_pii_config())
+    assert not pool.should_offload(
+        BanListSafetyValidatorConfig(type="ban_list", banned_words=["a", "b", "c"])
+    )
+
+
+def test_offloads_only_large_ban_lists():
+    pool = _pool()
+
+    small = BanListSafetyValidatorConfig(type="ban_list", banned_words=["a"])
+    large = BanListSafetyValidatorConfig(type="ban_list", banned_words=["a", "b", "c"])
+
+    assert not pool.should_offload(small)
+    assert pool.should_offload(large)
+
+
+def test_disabled_pool_offloads_nothing():
+    assert not _pool(size=0).should_offload(_pii_config())
+
+
+def test_proxy_keeps_validator_name_and_on_fail():
+    config = _pii_config()
+
+    proxy = _pool().proxy(config)
+
+    assert isinstance(proxy, ProcessPoolValidator)
+    assert proxy.rail_alias == PIIRemover.rail_alias
+    assert proxy.on_fail_descriptor == config.resolve_on_fail()
+
+
+def test_build_validator_uses_proxy_when_offloaded():
+    config = _pii_config()
+
+    with patch("app.core.guardrail_controller.validator_pool", _pool()):
+        validator = build_validator(config)
+
+    assert isinstance(validator, ProcessPoolValidator)
+
+
+def test_submit_returns_result_from_pool():
+    pool = _pool()
+    executor = Mock()
+    future = Future()
+    future.set_result(PassResult(value="text"))
+    executor.submit.return_value = future
+
+    with patch(f"{POOL_PATH}.ProcessPoolExecutor", return_value=executor):
+        result = pool.proxy(_pii_config())._validate("text", {})
+
+    assert result.outcome == "pass"
+    args = executor.submit.call_args.args
+    assert args[1]["type"] == "pii_remover"
+    assert args[2:] == ("text", {})
+
+
+def test_submit_times_out():
+    pool = _pool()
+    executor = Mock()
+    executor.submit.side_effect = lambda *args: Future()
+
+    with patch(f"{POOL_PATH}.ProcessPoolExecutor", return_value=executor):
+        with pytest.raises(TimeoutError, match="timed out"):
+            pool.submit(_pii_config(), "text", {})
+
+
+def _running_future():
+    # A call a pool process has picked up; cancelling it no longer succeeds.
+    future = Future()
+    future.set_running_or_notify_cancel()
+    return future
+
+
+def test_submit_rejects_when_all_slots_are_busy():
+    pool = _pool(max_pending=1)
+    executor = Mock()
+    executor.submit.side_effect = lambda *args: _running_future()
+
+    with patch(f"{POOL_PATH}.ProcessPoolExecutor", return_value=executor):
+        with pytest.raises(TimeoutError, match="timed out"):
+            pool.submit(_pii_config(), "text", {})
+        # The first call is still running in the pool and holds the only slot.
+        with pytest.raises(TimeoutError, match="busy"):
+            pool.submit(_pii_config(), "text", {})
+
+
+def test_cancelling_a_queued_call_frees_its_slot():
+    pool = _pool(max_pending=1)
+    executor = Mock()
+    executor.submit.side_effect = lambda *args: Future()
+
+    with patch(f"{POOL_PATH}.ProcessPoolExecutor", return_value=executor):
+        with pytest.raises(TimeoutError, match="timed out"):
+            pool.submit(_pii_config(), "text", {})
+        # The first call never left the queue, so its timeout cancelled it.
+        with pytest.raises(TimeoutError, match="timed out"):
+            pool.submit(_pii_config(), "text", {})
+
+
+def _ready_queue(*reports):
+    ready = queue.Queue()
+    for warmed in reports:
+        ready.put(warmed)
+    context = Mock()
+    context.Queue.return_value = ready
+    return ready, context
+
+
+def test_start_spawns_every_process_and_waits_for_initializers():
+    pool = _pool(size=2)
+    executor = Mock()
+    ready, context = _ready_queue(True, True)
+
+    with (
+        patch(f"{POOL_PATH}.ProcessPoolExecutor", return_value=executor) as factory,
+        patch(f"{POOL_PATH}.multiprocessing.get_context", return_value=context),
+    ):
+        pool.start(timeout=1)
+
+    assert executor.submit.call_count == 2
+    assert factory.call_args.kwargs["initargs"][1] is ready
+    assert ready.empty()
+
+
+def test_start_times_out_when_a_process_is_not_up():
+    pool = _pool(size=2)
+    _, context = _ready_queue(True)
+
+    with (
+        patch(f"{POOL_PATH}.ProcessPoolExecutor", return_value=Mock()),
+        patch(f"{POOL_PATH}.multiprocessing.get_context", return_value=context),
+    ):
+        with pytest.raises(TimeoutError, match="1 of 2"):
+            pool.start(timeout=0.05)
+
+
+def test_start_fails_when_a_process_failed_to_warm_up():
+    pool = _pool(size=2)
+    _, context = _ready_queue(True, False)
+
+    with (
+        patch(f"{POOL_PATH}.ProcessPoolExecutor", return_value=Mock()),
+        patch(f"{POOL_PATH}.multiprocessing.get_context", return_value=context),
+    ):
+        with pytest.raises(RuntimeError, match="warm up"):
+            pool.start(timeout=1)
+
+
+def test_waiting_for_a_slot_counts_against_the_call_timeout():
+    pool = _pool(max_pending=1, timeout=0.5)
+    executor = Mock()
+    executor.submit.side_effect = lambda *args: Future()
+
+    with patch(f"{POOL_PATH}.ProcessPoolExecutor", return_value=executor):
+        _, slots, _ = pool._ensure_executor()
+        slots.acquire()
+        threading.Timer(0.35, slots.release).start()
+
+        start = time.monotonic()
+        with pytest.raises(TimeoutError, match="timed out"):
+            pool.submit(_pii_config(), "text", {})
+        elapsed = time.monotonic() - start
+
+    # With separate waits the call would take 0.35s + 0.5s.
+    assert elapsed < 0.7
+
+
+def test_warm_up_does_not_start_a_pool_for_offloaded_validators():
+    cache = ValidatorCache(max_size=4, build=build_validator)
+
+    with (
+        patch("app.core.guardrail_controller.validator_pool", _pool()),
+        patch("app.core.warmup.validator_cache", cache),
+        patch(f"{POOL_PATH}.ProcessPoolExecutor") as factory,
+    ):
+        _warm(_pii_config())
+
+    factory.assert_not_called()
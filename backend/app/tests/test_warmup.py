@@ -0,0 +1,79 @@
+from unittest.mock import patch
+
+from app.core.enum import ValidatorType
+from app.core.warmup import ValidatorWarmup
+
+READINESS_API_PATH = "/api/v1/utils/readiness/"
+
+
+def test_readiness_reports_ready_when_warmup_skipped(client):
+    response = client.get(READINESS_API_PATH)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["ready"] is True
+    assert set(body["validators"]) == {v.value for v in ValidatorType}
+
+
+def test_warmup_not_ready_before_run():
+    warmup = ValidatorWarmup()
+
+    assert warmup.is_ready() is False
+    assert all(v["state"] == "cold" for v in warmup.status().values())
+
+
+def test_warmup_marks_each_validator_warm():
+    warmup = ValidatorWarmup()
+
+    with patch("app.core.warmup._warm") as mock_warm:
+        warmup.run()
+
+    assert mock_warm.call_count == len(ValidatorType)
+    assert warmup.is_ready() is True
+    assert all(v["state"] == "warm" for v in warmup.status().values())
+
+
+def test_warmup_failure_is_recorded_and_does_not_block_others():
+    warmup = ValidatorWarmup(attempts=2, retry_delay=0)
+
+    def fail_for_pii(config):
+        if config.type == ValidatorType.PIIRemover.value:
+            raise RuntimeError("model missing")
+
+    with patch("app.core.warmup._warm", side_effect=fail_for_pii):
+        warmup.run()
+
+    status = warmup.status()
+    assert status[ValidatorType.PIIRemover.value]["state"] == "failed"
+    assert status[ValidatorType.PIIRemover.value]["error"] == "model missing"
+    assert status[ValidatorType.LexicalSlur.value]["state"] == "warm"
+    assert warmup.is_ready() is False
+
+
+def test_warmup_retries_transient_failure():
+    warmup = ValidatorWarmup(attempts=3, retry_delay=0)
+    failures = {ValidatorType.PIIRemover.value: 2}
+
+    def fail_twice_for_pii(config):
+        if failures.get(config.type):
+            failures[config.type] -= 1
+            raise RuntimeError("model not yet available")
+
+    with patch("app.core.warmup._warm", side_effect=fail_twice_for_pii) as mock_warm:
+        warmup.run()
+
+    assert mock_warm.call_count == len(ValidatorType) + 2
+    assert warmup.status()[ValidatorType.PIIRemover.value]["state"] == "warm"
+    assert warmup.is_ready() is True
+
+
+def test_warmup_gives_up_after_attempts():
+    warmup = ValidatorWarmup(attempts=2, retry_delay=0)
+
+    with patch(
+        "app.core.warmup._warm", side_effect=RuntimeError("model missing")
+    ) as mock_warm:
+        warmup.run([ValidatorType.PIIRemover])
+
+    assert mock_warm.call_count == 2
+    assert warmup.is_ready() is False
@@ -0,0 +1,66 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.validators.utils.batching_nlp_engine import BatchingNlpEngine
+
+
+@pytest.fixture
+def inner_engine():
+    engine = MagicMock()
+    engine.process_batch.side_effect = lambda texts, language, **kwargs: [
+        (text, f"artifacts:{text}") for text in texts
+    ]
+    return engine
+
+
+def test_process_text_returns_own_artifacts(inner_engine):
+    engine = BatchingNlpEngine(inner_engine, max_batch_size=4, max_wait_ms=1)
+
+    assert engine.process_text("hello", "en") == "artifacts:hello"
+    inner_engine.process_batch.assert_called_once_with(["hello"], "en", batch_size=1)
+
+
+def test_concurrent_calls_are_batched(inner_engine):
+    engine = BatchingNlpEngine(inner_engine, max_batch_size=8, max_wait_ms=200)
+    texts = [f"text {i}" for i in range(8)]
+    results = {}
+    start = threading.Barrier(len(texts))
+
+    def call(text):
+        start.wait()
+        results[text] = engine.process_text(text, "en")
+
+    threads = [threading.Thread(target=call, args=(text,)) for text in texts]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert results == {text: f"artifacts:{text}" for text in texts}
+    assert engine.stats()["texts"] == len(texts)
+    assert engine.stats()["batches"] < len(texts)
+
+
+def test_batch_failure_raised_to_callers(inner_engine):
+    inner_engine.process_batch.side_effect = RuntimeError("boom")
+    engine = BatchingNlpEngine(inner_engine, max_wait_ms=1)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        engine.process_text("hello", "en")
+
+    # The worker keeps serving after a failed batch.
+    inner_engine.process_batch.side_effect = None
+    inner_engine.process_batch.return_value = [("again", "ok")]
+    assert engine.process_text("again", "en") == "ok"
+
+
+def test_delegates_engine_queries(inner_engine):
+    engine = BatchingNlpEngine(inner_engine)
+
+    engine.is_stopword("the", "en")
+    engine.get_supported_entities()
+
+    inner_engine.is_stopword.assert_called_once_with("the", "en")
+    inner_engine.get_supported_entities.assert_called_once()
@@ -0,0 +1,52 @@
+import re
+
+from app.core.validators.utils.bias_lexicon import BiasLexicon
+
+
+def _apply_sequentially(entries, value):
+    detected = []
+    for entry in entries:
+        pattern = rf"\b{re.escape(entry['word'])}\b"
+        if re.search(pattern, value, flags=re.IGNORECASE):
+            detected.append(entry["word"])
+            value = re.sub(pattern, entry["neutral-term"], value, flags=re.IGNORECASE)
+    return detected, value
+
+
+ENTRIES = [
+    {"word": "he", "neutral-term": "they"},
+    {"word": "woh", "neutral-term": "woh"},
+    {"word": "ladki", "neutral-term": "baccha"},
+    {"word": "midwife", "neutral-term": "birth attendant"},
+    {"word": "attendant", "neutral-term": "attendant"},
+    {"word": "ladki", "neutral-term": "bachchi"},
+    {"word": "छात्रा", "neutral-term": "विद्यार्थी"},
+    {"word": "दुकानदारनी", "neutral-term": "दुकानदार"},
+    {"word": "beti", "neutral-term": "baccha"},
+]
+
+
+def test_apply_matches_sequential_substitution():
+    lexicon = BiasLexicon(ENTRIES)
+    texts = [
+        "",
+        "Nothing to see here.",
+        "He met the midwife, woh LADKI aur he.",
+        "the attendant and the midwife",
+        "वह छात्रा है, दुकानदारनी beti",
+        "दुकानदारनीbeti",  # glued words: entries interact through the text
+        "heattendant he_ he-he",
+    ]
+    for text in texts:
+        assert lexicon.apply(text) == _apply_sequentially(ENTRIES, text), text
+
+
+def test_pass_through_when_nothing_matches():
+    assert BiasLexicon(ENTRIES).apply("The theme was good.") == (
+        [],
+        "The theme was good.",
+    )
+
+
+def test_empty_lexicon():
+    assert BiasLexicon([]).apply("He is here.") == ([], "He is here.")
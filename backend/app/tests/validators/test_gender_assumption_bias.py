@@ -1,26 +1,29 @@
-import pandas as pd
 import pytest
 from unittest.mock import patch
 
 from app.core.enum import BiasCategories
 from app.core.validators.gender_assumption_bias import GenderAssumptionBias
+from app.core.validators.utils.lexicons import clear_artifact_cache
 from guardrails.validators import FailResult, PassResult
 
 
+LEXICONS_PATH = "app.core.validators.utils.lexicons"
+ARTIFACT_PATH = "app.core.validators.utils.lexicon_artifact"
+LOAD_ROWS_PATH = "app.core.validators.gender_assumption_bias.load_gender_bias_rows"
+
+
 @pytest.fixture
-def mock_gender_bias_df():
-    return pd.DataFrame(
-        [
-            {"word": "he", "neutral-term": "they", "type": "pronoun"},
-            {"word": "she", "neutral-term": "they", "type": "pronoun"},
-            {"word": "policeman", "neutral-term": "police officer", "type": "generic"},
-        ]
-    )
+def mock_gender_bias_rows():
+    return [
+        {"word": "he", "neutral-term": "they", "type": "pronoun"},
+        {"word": "she", "neutral-term": "they", "type": "pronoun"},
+        {"word": "policeman", "neutral-term": "police officer", "type": "generic"},
+    ]
 
 
 @pytest.fixture
-def validator(mock_gender_bias_df):
-    with patch("pandas.read_csv", return_value=mock_gender_bias_df):
+def validator(mock_gender_bias_rows):
+    with patch(LOAD_ROWS_PATH, return_value=mock_gender_bias_rows):
         return GenderAssumptionBias(categories=[BiasCategories.All])
 
 
@@ -61,8 +64,8 @@ def test_multiple_gender_biases_detected(validator):
     assert result.fix_value == "they and they are working."
 
 
-def test_category_filtering(mock_gender_bias_df):
-    with patch("pandas.read_csv", return_value=mock_gender_bias_df):
+def test_category_filtering(mock_gender_bias_rows):
+    with patch(LOAD_ROWS_PATH, return_value=mock_gender_bias_rows):
         validator = GenderAssumptionBias(categories=[BiasCategories.Generic])
 
     result = validator._validate("He is a policeman.")
@@ -72,12 +75,83 @@ def test_category_filtering(mock_gender_bias_df):
 
 
 def test_missing_gender_bias_file_raises_error():
-    with patch("pandas.read_csv", side_effect=FileNotFoundError):
+    clear_artifact_cache()
+    with patch(LEXICONS_PATH + ".load_artifact", return_value=None), patch(
+        ARTIFACT_PATH + ".read_csv_rows", side_effect=FileNotFoundError
+    ):
         with pytest.raises(FileNotFoundError):
             GenderAssumptionBias(categories=[BiasCategories.All])
 
 
 def test_csv_load_failure_raises_value_error():
-    with patch("pandas.read_csv", side_effect=Exception("boom")):
+    clear_artifact_cache()
+    with patch(LEXICONS_PATH + ".load_artifact", return_value=None), patch(
+        ARTIFACT_PATH + ".read_csv_rows", side_effect=Exception("boom")
+    ):
         with pytest.raises(ValueError):
             GenderAssumptionBias(categories=[BiasCategories.All])
+
+
+def test_chained_replacement_matches_sequential_substitution():
+    rows = [
+        {"word": "midwife", "neutral-term": "birth attendant", "type": "generic"},
+        {"word": "attendant", "neutral-term": "caregiver", "type": "generic"},
+    ]
+    with patch(LOAD_ROWS_PATH, return_value=rows):
+        validator = GenderAssumptionBias(categories=[BiasCategories.All])
+
+    result = validator._validate("The midwife arrived.")
+    assert isinstance(result, FailResult)
+    assert result.fix_value == "The birth caregiver arrived."
+    assert result.error_message == (
+        "Detected gender assumption bias: ['midwife', 'attendant']"
+    )
+
+
+def test_duplicate_entries_reported_once(mock_gender_bias_rows):
+    rows = mock_gender_bias_rows + [
+        {"word": "he", "neutral-term": "they", "type": "generic"}
+    ]
+    with patch(LOAD_ROWS_PATH, return_value=rows):
+        validator = GenderAssumptionBias(categories=[BiasCategories.All])
+
+    result = validator._validate("He said he would.")
+    assert result.fix_value == "they said they would."
+    assert result.error_message == "Detected gender assumption bias: ['he']"
+
+
+def test_lexicon_shared_across_instances(mock_gender_bias_rows):
+    with patch(LOAD_ROWS_PATH, return_value=mock_gender_bias_rows):
+        first = GenderAssumptionBias(categories=[BiasCategories.Generic])
+        second = GenderAssumptionBias(categories=[BiasCategories.Generic])
+
+    assert first.lexicon is second.lexicon
+
+
+def test_lexicon_rebuilt_when_rows_change(mock_gender_bias_rows):
+    with patch(LOAD_ROWS_PATH, return_value=mock_gender_bias_rows):
+        first = GenderAssumptionBias(categories=[BiasCategories.Generic])
+    with patch(LOAD_ROWS_PATH, return_value=mock_gender_bias_rows[:2]):
+        second = GenderAssumptionBias(categories=[BiasCategories.Generic])
+
+    assert first.lexicon is not second.lexicon
+    assert isinstance(second._validate("He is a policeman."), PassResult)
+
+
+def test_overlapping_categories_match_each_word_once(mock_gender_bias_rows):
+    with patch(LOAD_ROWS_PATH, return_value=mock_gender_bias_rows):
+        validator = GenderAssumptionBias(
+            categories=[BiasCategories.Generic, BiasCategories.All]
+        )
+
+    assert validator.lexicon.words == ["he", "she", "policeman"]
+
+
+def test_cache_info_reports_memory(mock_gender_bias_rows):
+    with patch(LOAD_ROWS_PATH, return_value=mock_gender_bias_rows):
+        GenderAssumptionBias(categories=[BiasCategories.All])
+
+    info = GenderAssumptionBias.cache_info()
+    assert info["entries"] >= 1
+    assert info["lexicons"]["all"] > 0
+    assert info["memory_bytes"] >= info["lexicons"]["all"]
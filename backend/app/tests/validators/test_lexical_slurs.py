@@ -1,8 +1,11 @@
+from unittest.mock import patch
+
 import pandas as pd
 import pytest
 
-from app.core.validators.lexical_slur import LexicalSlur, SlurSeverity
 from app.core.config import Settings
+from app.core.validators.lexical_slur import LexicalSlur, SlurSeverity
+from app.core.validators.utils.text_normalization import normalize_with_offsets
 
 
 # ---------------------------------------
@@ -141,3 +144,91 @@ def test_severity_high_includes_only_h(patch_slur_load, monkeypatch, slur_csv):
 
     validator = LexicalSlur(severity=SlurSeverity.High)
     assert validator.slur_list == ["highone"]
+
+
+@pytest.mark.usefixtures("patch_slur_load")
+def test_matcher_shared_across_instances():
+    first = build_validator()
+    second = build_validator()
+
+    assert first._slur_matcher is second._slur_matcher
+
+
+@pytest.mark.usefixtures("patch_slur_load")
+def test_matcher_rebuilt_when_slur_list_changes(monkeypatch):
+    first = build_validator()
+
+    monkeypatch.setattr(LexicalSlur, "load_slur_list", lambda self: ["otherword"])
+    second = build_validator()
+
+    assert first._slur_matcher is not second._slur_matcher
+    assert second._validate("you otherword").outcome == "fail"
+
+
+@pytest.mark.usefixtures("patch_slur_load")
+def test_cache_info_reports_memory():
+    build_validator(severity="high", languages=["en"])
+
+    info = LexicalSlur.cache_info()
+
+    assert info["entries"] >= 1
+    assert info["matchers"]["high:en"] > 0
+    assert info["memory_bytes"] >= info["matchers"]["high:en"]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Hello   World\tagain\n",
+        "  spaced out  ",
+        "fish &amp; chips",
+        "bell\x07char",
+        "Ｆｕｌｌｗｉｄｔｈ text",
+        "emoji 🤮 inside",
+        "हिंदी text",
+    ],
+)
+@pytest.mark.usefixtures("patch_slur_load")
+def test_tiered_normalization_matches_full_pipeline(text):
+    validator = build_validator()
+
+    assert validator.normalize_for_matching(text) == validator.normalize_full(text)
+
+
+def test_clean_ascii_detection():
+    assert LexicalSlur.is_clean_ascii("plain text, with punctuation!")
+    assert not LexicalSlur.is_clean_ascii("html &amp; entity")
+    assert not LexicalSlur.is_clean_ascii("control\x00char")
+    assert not LexicalSlur.is_clean_ascii("naïve")
+
+
+@pytest.mark.usefixtures("patch_slur_load")
+def test_fix_value_preserves_original_text_outside_slurs():
+    validator = build_validator()
+    result = validator._validate("You  are a BADWORD 🙂 friend!")
+
+    assert result.outcome == "fail"
+    assert result.fix_value == "You  are a [REDACTED_SLUR] 🙂 friend!"
+
+
+@pytest.mark.usefixtures("patch_slur_load")
+def test_fix_value_redacts_slur_containing_emoji():
+    validator = build_validator()
+    result = validator._validate("Hey bad🤮word, hi")
+
+    assert result.outcome == "fail"
+    assert result.fix_value == "Hey [REDACTED_SLUR], hi"
+
+
+@pytest.mark.usefixtures("patch_slur_load")
+def test_full_normalization_runs_once_when_slur_found():
+    validator = build_validator()
+
+    with patch(
+        "app.core.validators.lexical_slur.normalize_with_offsets",
+        wraps=normalize_with_offsets,
+    ) as mock_normalize:
+        result = validator._validate("“BADWORD” here")
+
+    assert result.fix_value == "“[REDACTED_SLUR]” here"
+    mock_normalize.assert_called_once()
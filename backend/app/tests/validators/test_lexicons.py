@@ -0,0 +1,155 @@
+import os
+import pickle
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from app.core.config import Settings
+from app.core.validators.utils import lexicon_artifact, lexicons
+
+ARTIFACT_MODULE = "app.core.validators.utils.lexicon_artifact"
+
+SLUR_CSV = "id,label,severity\n1,BadWord,L\n2,mildslur,M\n3,highslur,H\n"
+GENDER_CSV = "word,neutral-term,type\nHe,They,generic\nchairman,chairperson,profession\n"
+
+
+@pytest.fixture
+def lexicon_files(tmp_path, monkeypatch):
+    slur_path = tmp_path / "slurs.csv"
+    gender_path = tmp_path / "gender.csv"
+    artifact_path = tmp_path / "lexicons.bin"
+    slur_path.write_text(SLUR_CSV, encoding="utf-8")
+    gender_path.write_text(GENDER_CSV, encoding="utf-8")
+
+    settings_cls = lexicons.Settings
+    monkeypatch.setattr(settings_cls, "SLUR_LIST_FILEPATH", slur_path)
+    monkeypatch.setattr(settings_cls, "GENDER_BIAS_LIST_FILEPATH", gender_path)
+    monkeypatch.setattr(settings_cls, "LEXICON_ARTIFACT_FILEPATH", artifact_path)
+    lexicons.clear_artifact_cache()
+    yield slur_path, gender_path, artifact_path
+    lexicons.clear_artifact_cache()
+
+
+@pytest.mark.usefixtures("lexicon_files")
+def test_loads_from_csv_without_artifact():
+    assert lexicons.load_slur_list("all") == ["badword", "mildslur", "highslur"]
+    assert lexicons.load_slur_list("medium") == ["mildslur", "highslur"]
+    assert lexicons.load_slur_list("high") == ["highslur"]
+    assert lexicons.load_gender_bias_rows()[0] == {
+        "word": "he",
+        "neutral-term": "they",
+        "type": "generic",
+    }
+
+
+def test_artifact_matches_csv(lexicon_files):
+    csv_slurs = lexicons.load_slur_list("low")
+    csv_rows = lexicons.load_gender_bias_rows()
+
+    lexicons.build_lexicon_artifact()
+    lexicons.clear_artifact_cache()
+
+    assert lexicons.load_artifact("slur", lexicon_files[0]) is not None
+    assert lexicons.load_slur_list("low") == csv_slurs
+    assert lexicons.load_gender_bias_rows() == csv_rows
+
+
+def test_artifact_holds_only_plain_data(lexicon_files):
+    _, _, artifact_path = lexicon_files
+    lexicons.build_lexicon_artifact()
+
+    payload = lexicon_artifact.read_artifact(artifact_path)
+
+    assert payload["version"] == lexicon_artifact.ARTIFACT_VERSION
+    assert payload["slurs"]["all"] == ["badword", "mildslur", "highslur"]
+    assert all(
+        isinstance(word, str) for words in payload["slurs"].values() for word in words
+    )
+
+
+def test_artifact_of_other_version_is_ignored(lexicon_files):
+    slur_path, _, artifact_path = lexicon_files
+    artifact_path.write_bytes(
+        lexicon_artifact.ARTIFACT_MAGIC
+        + (lexicon_artifact.ARTIFACT_VERSION - 1).to_bytes(2, "big")
+        + pickle.dumps({"version": lexicon_artifact.ARTIFACT_VERSION - 1})
+    )
+
+    assert lexicons.load_artifact("slur", slur_path) is None
+    assert lexicons.load_slur_list("high") == ["highslur"]
+
+
+@pytest.mark.usefixtures("lexicon_files")
+def test_csv_fallback_is_parsed_once():
+    with patch(
+        ARTIFACT_MODULE + ".read_csv_rows", wraps=lexicon_artifact.read_csv_rows
+    ) as mock_read:
+        first = lexicons.load_gender_bias_rows()
+        second = lexicons.load_gender_bias_rows()
+        lexicons.load_slur_list("all")
+        lexicons.load_slur_list("high")
+
+    assert first is second
+    assert mock_read.call_count == 2
+
+
+def test_builder_defaults_match_settings():
+    assert lexicon_artifact.DEFAULT_SLUR_PATH == Settings.SLUR_LIST_FILEPATH
+    assert (
+        lexicon_artifact.DEFAULT_GENDER_BIAS_PATH == Settings.GENDER_BIAS_LIST_FILEPATH
+    )
+    assert lexicon_artifact.DEFAULT_ARTIFACT_PATH == Settings.LEXICON_ARTIFACT_FILEPATH
+
+
+def test_builder_runs_without_settings(lexicon_files, tmp_path):
+    slur_path, gender_path, _ = lexicon_files
+    output = tmp_path / "built.bin"
+    # No AUTH_TOKEN, POSTGRES_* etc.: the image build has no environment.
+    env = {"PATH": os.environ.get("PATH", ""), "PYTHONPATH": os.getcwd()}
+
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "app.core.validators.utils.lexicon_artifact",
+            "--output",
+            str(output),
+            "--slur-csv",
+            str(slur_path),
+            "--gender-bias-csv",
+            str(gender_path),
+        ],
+        check=True,
+        env=env,
+        cwd=os.getcwd(),
+    )
+
+    assert lexicon_artifact.read_artifact(output)["slurs"]["high"] == ["highslur"]
+
+
+def test_stale_artifact_falls_back_to_csv(lexicon_files):
+    slur_path, _, _ = lexicon_files
+    lexicons.build_lexicon_artifact()
+    slur_path.write_text("id,label,severity\n1,newword,H\n", encoding="utf-8")
+    lexicons.clear_artifact_cache()
+
+    assert lexicons.load_artifact("slur", slur_path) is None
+    assert lexicons.load_slur_list("all") == ["newword"]
+
+
+def test_missing_slur_columns_raise_value_error(lexicon_files):
+    slur_path, _, _ = lexicon_files
+    slur_path.write_text("id,label\n1,badword\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="missing required columns"):
+        lexicons.load_slur_list("all")
+
+
+def test_missing_slur_file_raises_file_not_found(lexicon_files):
+    slur_path, _, _ = lexicon_files
+    slur_path.unlink()
+
+    with pytest.raises(FileNotFoundError, match="Slur list file not found"):
+        lexicons.load_slur_list("all")
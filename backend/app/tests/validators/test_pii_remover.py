@@ -12,10 +12,10 @@ from app.core.validators.pii_remover import ALL_ENTITY_TYPES, PIIRemover
 @pytest.fixture
 def mock_presidio():
     """
-    Mock AnalyzerEngine and AnonymizerEngine before validator loads.
+    Mock the shared analyzer and AnonymizerEngine before validator loads.
     """
     with patch(
-        "app.core.validators.pii_remover.AnalyzerEngine"
+        "app.core.validators.pii_remover.get_analyzer"
     ) as mock_analyzer, patch(
         "app.core.validators.pii_remover.AnonymizerEngine"
     ) as mock_anonymizer:
@@ -47,10 +47,15 @@ def test_pass_when_no_pii_detected(validator):
     assert result.outcome == "pass"
 
 
+def _result(entity_type="PERSON", score=0.85):
+    return MagicMock(entity_type=entity_type, score=score)
+
+
 def test_fail_when_pii_detected(validator):
     """
     If anonymized text differs, should FAIL with fix_value.
     """
+    validator.analyzer.analyze.return_value = [_result()]
     validator.anonymizer.anonymize.return_value = MagicMock(text="redacted text")
 
     result = validator._validate("original text")
@@ -67,6 +72,7 @@ def test_analyzer_called_with_correct_arguments(validator):
         text="hello",
         entities=validator.entity_types,
         language="en",
+        score_threshold=0.5,
     )
 
 
@@ -80,25 +86,74 @@ def test_custom_entity_types_override(mock_presidio):
     assert v.entity_types == ["EMAIL_ADDRESS"]
 
 
-def test_indian_recognizers_registered_when_requested():
-    """
-    Ensure Indian recognizers are conditionally registered.
-    """
-    with patch(
-        "app.core.validators.pii_remover.AnalyzerEngine"
-    ) as mock_analyzer, patch("app.core.validators.pii_remover.AnonymizerEngine"):
-        registry = mock_analyzer.return_value.registry
-
-        PIIRemover(
-            entity_types=[
-                "IN_AADHAAR",
-                "IN_PAN",
-                "IN_PASSPORT",
-                "IN_VEHICLE_REGISTRATION",
-                "IN_VOTER",
-            ],
-            threshold=0.5,
-        )
-
-        # Called once per recognizer
-        assert registry.add_recognizer.call_count == 5
+@pytest.mark.usefixtures("mock_presidio")
+def test_analyzer_requested_for_configured_entity_types():
+    with patch("app.core.validators.pii_remover.get_analyzer") as mock_get_analyzer:
+        v = PIIRemover(entity_types=["IN_PAN", "EMAIL_ADDRESS"], threshold=0.5)
+
+    mock_get_analyzer.assert_called_once_with(
+        ["IN_PAN", "EMAIL_ADDRESS"], {"IN_PAN": 0.5, "EMAIL_ADDRESS": 0.5}
+    )
+    assert v.analyzer is mock_get_analyzer.return_value
+
+
+def test_anonymizer_skipped_when_nothing_detected(validator):
+    result = validator._validate("original text")
+
+    assert result.outcome == "pass"
+    validator.anonymizer.anonymize.assert_not_called()
+
+
+@pytest.mark.usefixtures("mock_presidio")
+def test_per_entity_thresholds():
+    v = PIIRemover(
+        entity_types=["PERSON", "IN_PAN"], threshold={"PERSON": 0.9, "IN_PAN": 0.3}
+    )
+    person = _result("PERSON", 0.85)
+    pan = _result("IN_PAN", 0.4)
+    v.analyzer.analyze.return_value = [person, pan]
+    v.anonymizer.anonymize.return_value = MagicMock(text="redacted text")
+
+    v._validate("original text")
+
+    assert v.analyzer.analyze.call_args.kwargs["score_threshold"] == 0.3
+    v.anonymizer.anonymize.assert_called_once_with(
+        text="original text", analyzer_results=[pan]
+    )
+
+
+@pytest.mark.usefixtures("mock_presidio")
+def test_unlisted_entities_use_default_threshold():
+    v = PIIRemover(entity_types=["PERSON", "IN_PAN"], threshold={"IN_PAN": 0.8})
+
+    assert v.score_thresholds == {"PERSON": 0.5, "IN_PAN": 0.8}
+
+
+def test_long_text_analyzed_in_chunks(validator):
+    validator.max_chunk_chars = 50
+    validator.chunk_overlap = 20
+    # The first chunk ends between "John" and "Smith".
+    text = "filler " * 6 + "John Smith" + " filler" * 6
+    name_start = text.index("John Smith")
+
+    def analyze(text, **_kwargs):
+        start = text.find("John Smith")
+        if start == -1:
+            start = text.find("John")
+            end = start + len("John")
+        else:
+            end = start + len("John Smith")
+        if start == -1:
+            return []
+        return [MagicMock(entity_type="PERSON", score=0.85, start=start, end=end)]
+
+    validator.analyzer.analyze.side_effect = analyze
+    validator.anonymizer.anonymize.return_value = MagicMock(text="redacted text")
+
+    validator._validate(text)
+
+    assert validator.analyzer.analyze.call_count > 1
+    results = validator.anonymizer.anonymize.call_args.kwargs["analyzer_results"]
+    assert [(r.start, r.end) for r in results] == [
+        (name_start, name_start + len("John Smith"))
+    ]
@@ -0,0 +1,158 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from presidio_analyzer import Pattern, PatternRecognizer
+from presidio_analyzer.context_aware_enhancers import LemmaContextAwareEnhancer
+from presidio_analyzer.predefined_recognizers import SpacyRecognizer
+
+from app.core.validators.utils.batching_nlp_engine import BatchingNlpEngine
+from app.core.validators.utils.presidio_registry import (
+    PresidioRegistry,
+    max_reachable_score,
+)
+
+REGISTRY_PATH = "app.core.validators.utils.presidio_registry"
+
+
+def _recognizer(*entities, spec=None):
+    recognizer = MagicMock(spec=spec)
+    recognizer.supported_entities = list(entities)
+    return recognizer
+
+
+@pytest.fixture
+def registry():
+    person = _recognizer("PERSON", "LOCATION", "NRP", spec=SpacyRecognizer)
+    email = _recognizer("EMAIL_ADDRESS")
+    pan = _recognizer("IN_PAN")
+
+    with patch(f"{REGISTRY_PATH}.TrimmedSpacyNlpEngine") as mock_engine, patch(
+        f"{REGISTRY_PATH}.AnalyzerEngine"
+    ) as mock_analyzer, patch(f"{REGISTRY_PATH}.RecognizerRegistry"), patch(
+        f"{REGISTRY_PATH}.TokenizerNlpEngine"
+    ):
+        registry = PresidioRegistry()
+        registry._recognizers = [person, email, pan]
+        yield registry, mock_engine, mock_analyzer, (person, email, pan)
+
+
+def test_nlp_engine_created_once(registry):
+    reg, mock_engine, _, _ = registry
+
+    reg.get_analyzer(["EMAIL_ADDRESS"])
+    reg.get_analyzer(["PERSON"])
+
+    mock_engine.return_value.load.assert_called_once()
+
+
+def test_pattern_only_analyzer_does_not_load_nlp_model(registry):
+    reg, mock_engine, mock_analyzer, _ = registry
+
+    reg.get_analyzer(["IN_PAN", "EMAIL_ADDRESS"])
+
+    mock_engine.assert_not_called()
+    nlp_engine = mock_analyzer.call_args.kwargs["nlp_engine"]
+    assert nlp_engine is reg.get_tokenizer_engine()
+
+
+def test_ner_entities_use_nlp_model(registry):
+    reg, mock_engine, mock_analyzer, _ = registry
+
+    reg.get_analyzer(["PERSON", "IN_PAN"])
+
+    nlp_engine = mock_analyzer.call_args.kwargs["nlp_engine"]
+    assert nlp_engine is mock_engine.return_value
+
+
+def test_analyzer_cached_per_entity_set(registry):
+    reg, _, mock_analyzer, _ = registry
+
+    first = reg.get_analyzer(["EMAIL_ADDRESS", "IN_PAN"])
+    second = reg.get_analyzer(["IN_PAN", "EMAIL_ADDRESS"])
+
+    assert first is second
+    assert mock_analyzer.call_count == 1
+
+
+def test_analyzer_receives_only_matching_recognizers(registry):
+    reg, _, _, (person, email, pan) = registry
+
+    with patch(f"{REGISTRY_PATH}.RecognizerRegistry") as mock_registry:
+        reg.get_analyzer(["IN_PAN"])
+
+    recognizers = mock_registry.call_args.kwargs["recognizers"]
+    assert recognizers == [pan]
+
+
+def _pattern_recognizer(entity, score, context=None):
+    return PatternRecognizer(
+        supported_entity=entity,
+        patterns=[Pattern(name=entity.lower(), regex=r"\d{4}", score=score)],
+        context=context,
+    )
+
+
+def test_max_reachable_score_for_plain_pattern_recognizer():
+    enhancer = LemmaContextAwareEnhancer()
+
+    assert max_reachable_score(_pattern_recognizer("X", 0.3), enhancer) == 0.3
+    assert max_reachable_score(
+        _pattern_recognizer("X", 0.3, context=["code"]), enhancer
+    ) == pytest.approx(0.3 + enhancer.context_similarity_factor)
+    assert max_reachable_score(_recognizer("PERSON"), enhancer) == 1.0
+
+
+def test_recognizers_below_threshold_skipped(registry):
+    reg, _, _, (person, email, pan) = registry
+    weak = _pattern_recognizer("IN_PAN", 0.05)
+    reg._recognizers = [person, email, weak]
+
+    with patch(f"{REGISTRY_PATH}.RecognizerRegistry") as mock_registry:
+        reg.get_analyzer(["PERSON", "IN_PAN"], {"PERSON": 0.5, "IN_PAN": 0.5})
+    assert mock_registry.call_args.kwargs["recognizers"] == [person]
+
+    with patch(f"{REGISTRY_PATH}.RecognizerRegistry") as mock_registry:
+        reg.get_analyzer(["PERSON", "IN_PAN"], {"PERSON": 0.5, "IN_PAN": 0.01})
+    assert mock_registry.call_args.kwargs["recognizers"] == [person, weak]
+
+
+def test_nlp_engine_uses_configured_model(registry):
+    _, mock_engine, _, _ = registry
+
+    reg = PresidioRegistry(model_name="en_core_web_sm", excluded_components=["parser"])
+    reg.get_nlp_engine()
+
+    mock_engine.assert_called_once_with("en_core_web_sm", ["parser"], language="en")
+
+
+def test_configure_switches_model_and_drops_analyzers(registry):
+    reg, mock_engine, mock_analyzer, _ = registry
+    reg.get_analyzer(["PERSON"])
+
+    reg.configure(model_name="en_core_web_md", excluded_components=[])
+    reg.get_analyzer(["PERSON"])
+
+    assert reg.model_name == "en_core_web_md"
+    assert mock_engine.call_args.args == ("en_core_web_md", [])
+    assert mock_analyzer.call_count == 2
+
+
+def test_configure_keeps_recognizers(registry):
+    reg, _, _, _ = registry
+    recognizers = reg.get_recognizers()
+
+    reg.configure(model_name="en_core_web_md", excluded_components=[])
+
+    assert reg.get_recognizers() is recognizers
+
+
+def test_batching_wraps_nlp_model(registry):
+    _, mock_engine, mock_analyzer, (person, _, _) = registry
+    reg = PresidioRegistry(batching_enabled=True)
+    reg._recognizers = [person]
+
+    reg.get_analyzer(["PERSON"])
+
+    nlp_engine = mock_analyzer.call_args.kwargs["nlp_engine"]
+    assert isinstance(nlp_engine, BatchingNlpEngine)
+    assert nlp_engine.engine is mock_engine.return_value
@@ -0,0 +1,30 @@
+from unittest.mock import patch
+
+from app.core.validators.utils.spacy_nlp_engine import TrimmedSpacyNlpEngine
+
+SPACY_PATH = "app.core.validators.utils.spacy_nlp_engine.spacy"
+
+
+def test_load_excludes_components():
+    engine = TrimmedSpacyNlpEngine("en_core_web_sm", ["parser", "senter"])
+
+    with patch(SPACY_PATH) as mock_spacy:
+        mock_spacy.util.is_package.return_value = True
+        engine.load()
+
+    mock_spacy.load.assert_called_once_with(
+        "en_core_web_sm", exclude=["parser", "senter"]
+    )
+    mock_spacy.cli.download.assert_not_called()
+    assert engine.nlp == {"en": mock_spacy.load.return_value}
+
+
+def test_load_downloads_missing_model():
+    engine = TrimmedSpacyNlpEngine("en_core_web_md")
+
+    with patch(SPACY_PATH) as mock_spacy:
+        mock_spacy.util.is_package.return_value = False
+        engine.load()
+
+    mock_spacy.cli.download.assert_called_once_with("en_core_web_md")
+    mock_spacy.load.assert_called_once_with("en_core_web_md", exclude=[])
@@ -0,0 +1,134 @@
+import re
+from itertools import pairwise
+from types import SimpleNamespace
+
+from app.core.validators.utils.text_chunking import (
+    ChunkExecutor,
+    TextChunk,
+    merge_spans,
+    split_text,
+)
+
+
+def _span(entity_type, start, end, score=0.85):
+    return SimpleNamespace(entity_type=entity_type, start=start, end=end, score=score)
+
+
+def _analyze(chunk):
+    return [
+        _span("PERSON", m.start() + chunk.start, m.end() + chunk.start)
+        for m in re.finditer(r"John(?: Smith)?", chunk.text)
+    ]
+
+
+def test_short_text_is_one_chunk():
+    assert split_text("short text", max_chars=100, overlap=10) == [
+        TextChunk(0, "short text")
+    ]
+
+
+def test_zero_max_chars_disables_chunking():
+    text = "word " * 100
+
+    assert split_text(text, max_chars=0, overlap=10) == [TextChunk(0, text)]
+
+
+def test_chunks_cover_text_with_offsets():
+    text = " ".join(f"word{i}." for i in range(200))
+
+    chunks = split_text(text, max_chars=100, overlap=20)
+
+    assert len(chunks) > 1
+    assert chunks[0].start == 0
+    assert chunks[-1].start + len(chunks[-1].text) == len(text)
+    for chunk in chunks:
+        assert len(chunk.text) <= 100
+        assert text[chunk.start : chunk.start + len(chunk.text)] == chunk.text
+    for previous, chunk in pairwise(chunks):
+        assert previous.start < chunk.start <= previous.start + len(previous.text)
+
+
+def test_chunks_end_at_sentence_boundaries():
+    sentence = "This sentence is about forty chars long. "
+    text = sentence * 10
+
+    chunks = split_text(text, max_chars=100, overlap=20)
+
+    for chunk in chunks[:-1]:
+        assert chunk.text.endswith(". ")
+
+
+def test_chunks_start_at_word_boundaries():
+    text = "alpha beta gamma delta " * 20
+
+    chunks = split_text(text, max_chars=50, overlap=15)
+
+    for chunk in chunks[1:]:
+        assert text[chunk.start - 1].isspace()
+        assert not chunk.text[0].isspace()
+
+
+def test_unbroken_text_is_cut_hard():
+    text = "x" * 250
+
+    chunks = split_text(text, max_chars=100, overlap=10)
+
+    assert "".join(c.text for c in chunks) != text  # overlapping
+    assert all(len(c.text) <= 100 for c in chunks)
+    assert chunks[-1].start + len(chunks[-1].text) == 250
+
+
+def test_entity_crossing_chunk_boundary_is_found_whole():
+    text = ("filler " * 13) + "John Smith" + (" filler" * 13)
+    chunks = split_text(text, max_chars=100, overlap=30)
+    # One chunk ends between "John" and "Smith".
+    assert any(
+        text.index("John") < c.start + len(c.text) <= text.index("Smith")
+        for c in chunks
+    )
+
+    spans = merge_spans(result for c in chunks for result in _analyze(c))
+
+    assert [(s.start, s.end) for s in spans] == [
+        (text.index("John"), text.index("Smith") + len("Smith"))
+    ]
+
+
+def test_merge_spans_deduplicates_overlapping_chunks():
+    spans = merge_spans(
+        [
+            _span("PERSON", 10, 20, score=0.6),
+            _span("PERSON", 10, 20, score=0.85),
+            _span("PERSON", 10, 14),
+            _span("EMAIL_ADDRESS", 30, 40),
+        ]
+    )
+
+    assert [(s.entity_type, s.start, s.end, s.score) for s in spans] == [
+        ("PERSON", 10, 20, 0.85),
+        ("EMAIL_ADDRESS", 30, 40, 0.85),
+    ]
+
+
+def test_merge_spans_keeps_other_entity_types_and_adjacent_spans():
+    spans = merge_spans(
+        [
+            _span("PERSON", 0, 5),
+            _span("PERSON", 5, 10),
+            _span("LOCATION", 3, 8),
+        ]
+    )
+
+    assert [(s.entity_type, s.start, s.end) for s in spans] == [
+        ("PERSON", 0, 5),
+        ("LOCATION", 3, 8),
+        ("PERSON", 5, 10),
+    ]
+
+
+def test_executor_keeps_chunk_order():
+    chunks = [TextChunk(i, str(i)) for i in range(10)]
+
+    assert ChunkExecutor(max_workers=4).map(lambda c: c.start, chunks) == list(
+        range(10)
+    )
@@ -0,0 +1,80 @@
+import pytest
+
+from app.core.validators.utils.text_edits import (
+    TextEdit,
+    apply_edits,
+    diff_edits,
+    merge_edits,
+)
+
+
+@pytest.mark.parametrize(
+    "original, fixed",
+    [
+        ("John Smith is the chairman.", "<PERSON> is the chairperson."),
+        ("no change", "no change"),
+        ("", "inserted"),
+        ("removed", ""),
+        ("mail a@b.com now", "mail <EMAIL_ADDRESS> now"),
+        ("यह एक गाली है", "यह एक [REDACTED_SLUR] है"),
+    ],
+)
+def test_diff_edits_reproduce_fix(original, fixed):
+    edits = diff_edits(original, fixed)
+
+    assert apply_edits(original, edits) == fixed
+
+
+def test_diff_edits_replace_whole_words():
+    edits = diff_edits("John Smith is the chairman.", "<PERSON> is the chairperson.")
+
+    assert [(e.start, e.end, e.replacement) for e in edits] == [
+        (0, 10, "<PERSON>"),
+        (18, 26, "chairperson"),
+    ]
+
+
+def test_diff_edits_record_source():
+    assert diff_edits("a b", "a c", source=2) == [TextEdit(2, 3, "c", 2)]
+
+
+def test_merge_keeps_disjoint_edits_of_all_validators():
+    text = "John is the chairman"
+    edits = diff_edits(text, "<PERSON> is the chairman", source=0) + diff_edits(
+        text, "John is the chairperson", source=1
+    )
+
+    assert apply_edits(text, merge_edits(edits)) == "<PERSON> is the chairperson"
+
+
+def test_merge_keeps_identical_edits_once():
+    merged = merge_edits([TextEdit(0, 4, "[X]", 1), TextEdit(0, 4, "[X]", 0)])
+
+    assert merged == [TextEdit(0, 4, "[X]", 0)]
+
+
+def test_merge_prefers_covering_edit():
+    merged = merge_edits([TextEdit(5, 9, "[SLUR]", 0), TextEdit(0, 10, "<PERSON>", 1)])
+
+    assert merged == [TextEdit(0, 10, "<PERSON>", 1)]
+
+
+def test_merge_covering_tie_goes_to_earlier_validator():
+    merged = merge_edits([TextEdit(0, 4, "[B]", 1), TextEdit(0, 4, "[A]", 0)])
+
+    assert merged == [TextEdit(0, 4, "[A]", 0)]
+
+
+def test_merge_replaces_union_of_partial_overlaps():
+    text = "John Slurword here"
+
+    merged = merge_edits([TextEdit(0, 9, "<PERSON>", 0), TextEdit(5, 13, "[SLUR]", 1)])
+
+    assert merged == [TextEdit(0, 13, "<PERSON>[SLUR]", 0)]
+    assert apply_edits(text, merged) == "<PERSON>[SLUR] here"
+
+
+def test_merge_keeps_touching_edits_apart():
+    merged = merge_edits([TextEdit(0, 4, "[A]", 0), TextEdit(4, 4, "!", 1)])
+
+    assert merged == [TextEdit(0, 4, "[A]", 0), TextEdit(4, 4, "!", 1)]
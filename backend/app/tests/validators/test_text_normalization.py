@@ -0,0 +1,59 @@
+import time
+
+import pytest
+
+from app.core.validators.utils.text_normalization import (
+    normalize_with_offsets,
+    redact_spans,
+)
+
+
+@pytest.mark.parametrize(
+    "text, word, original",
+    [
+        ("  Hello   BIG   World  ", "world", "World"),
+        ("line\nbreak\tTAB", "tab", "TAB"),
+        ("Ｗｉｄｅ text", "wide", "Ｗｉｄｅ"),
+        ("ﬁne print", "fine", "ﬁne"),
+        ("café menu", "café", "café"),
+        ("smile 😀 then WORD", "word", "WORD"),
+    ],
+)
+def test_normalized_spans_map_back_to_original(text, word, original):
+    offset_text = normalize_with_offsets(text)
+    start = offset_text.text.index(word)
+
+    original_start, original_end = offset_text.original_span(start, start + len(word))
+
+    assert text[original_start:original_end] == original
+
+
+def test_ascii_pipeline_collapses_whitespace_and_lowercases():
+    offset_text = normalize_with_offsets("  Some   TEXT ", clean_ascii=True)
+
+    assert offset_text.text == "some text"
+    assert offset_text.original_span(5, 9) == (9, 13)
+
+
+def test_redact_spans_merges_overlaps_and_keeps_rest():
+    assert (
+        redact_spans("one two three four", [(4, 7), (4, 13), (14, 18)], "[X]")
+        == "one [X] [X]"
+    )
+    assert redact_spans("unchanged", [], "[X]") == "unchanged"
+
+
+def test_long_input_with_encoding_fixes_aligns_in_linear_time():
+    # ftfy uncurls every quote, so the whole text goes through the alignment.
+    text = "He said “hello” to the world. " * 500 + "Final WORD"
+
+    start = time.perf_counter()
+    offset_text = normalize_with_offsets(text)
+    elapsed = time.perf_counter() - start
+
+    word_start = offset_text.text.rindex("word")
+    original_start, original_end = offset_text.original_span(
+        word_start, word_start + 4
+    )
+    assert text[original_start:original_end] == "WORD"
+    assert elapsed < 2.0
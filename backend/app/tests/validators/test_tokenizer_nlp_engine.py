@@ -0,0 +1,39 @@
+from app.core.validators.utils.tokenizer_nlp_engine import TokenizerNlpEngine
+
+
+def test_process_text_tokenizes_without_model():
+    engine = TokenizerNlpEngine()
+
+    artifacts = engine.process_text("My PAN is ABCDE1234F today", "en")
+
+    assert engine.is_loaded()
+    assert [token.text for token in artifacts.tokens] == [
+        "My",
+        "PAN",
+        "is",
+        "ABCDE1234F",
+        "today",
+    ]
+    assert artifacts.tokens_indices == [0, 3, 7, 10, 21]
+    assert artifacts.lemmas == ["my", "pan", "is", "abcde1234f", "today"]
+    assert artifacts.entities == []
+
+
+def test_process_batch_matches_process_text():
+    engine = TokenizerNlpEngine()
+    texts = ["first text", "Second TEXT"]
+
+    batch = list(engine.process_batch(texts, "en"))
+
+    assert [text for text, _ in batch] == texts
+    assert [artifacts.lemmas for _, artifacts in batch] == [
+        engine.process_text(text, "en").lemmas for text in texts
+    ]
+
+
+def test_stopwords_and_punctuation():
+    engine = TokenizerNlpEngine()
+
+    assert engine.is_stopword("the", "en")
+    assert not engine.is_stopword("aadhaar", "en")
+    assert engine.is_punct(".", "en")
@@ -0,0 +1,77 @@
+import re
+
+from app.core.validators.utils.word_matcher import WordMatcher
+
+
+def _regex_reference(words, text):
+    """
+    Per-word regex search + sequential substitution, longest word first.
+    """
+    patterns = sorted(
+        ((w, re.compile(rf"(?<!\w){re.escape(w)}(?!\w)")) for w in words),
+        key=lambda x: len(x[0]),
+        reverse=True,
+    )
+    detected = [w for w, p in patterns if p.search(text)]
+    redacted = text
+    for w, p in patterns:
+        if w in detected:
+            redacted = p.sub("[X]", redacted)
+    return detected, redacted
+
+
+def _matcher_result(words, text):
+    matcher = WordMatcher(words)
+    matches = matcher.find_all(text)
+    return matcher.matched_words(matches), matcher.replace(text, matches, "[X]")
+
+
+def test_finds_all_words_with_spans():
+    matcher = WordMatcher(["bad", "worse"])
+
+    matches = matcher.find_all("bad and worse")
+
+    assert [(m.start, m.end, matcher.words[m.index]) for m in matches] == [
+        (0, 3, "bad"),
+        (8, 13, "worse"),
+    ]
+
+
+def test_respects_word_boundaries():
+    matcher = WordMatcher(["bad"])
+
+    assert matcher.find_all("badly unbad bad_ bad1") == []
+    assert len(matcher.find_all("(bad), bad!")) == 2
+
+
+def test_reports_overlapping_words():
+    words, _ = _matcher_result(["foo bar", "bar"], "foo bar")
+
+    assert words == ["foo bar", "bar"]
+
+
+def test_longest_match_wins_redaction():
+    _, redacted = _matcher_result(["foo", "foo bar", "bar baz"], "foo bar baz")
+
+    assert redacted == "[X] baz"
+
+
+def test_unicode_word_boundaries():
+    matcher = WordMatcher(["कुत्ता"])
+
+    assert len(matcher.find_all("तुम कुत्ता हो")) == 1
+    assert matcher.find_all("तुमकुत्ता") == []
+
+
+def test_matches_regex_reference():
+    words = ["ab", "abc", "b c", "c", "abc d", "d_e"]
+    texts = [
+        "ab abc b c c abc d",
+        "abcd ab-c abc.d d_e",
+        "c c c ab ab",
+        "xabc abcx b cd",
+        "",
+    ]
+
+    for text in texts:
+        assert _matcher_result(words, text) == _regex_reference(words, text)
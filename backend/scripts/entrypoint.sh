@@ -1,8 +1,17 @@
 #!/usr/bin/env bash
 set -euo pipefail
 
+# SERVER_MODE=prefork loads and warms validator models once in a master process
+# and forks the workers from it, so model memory is shared copy-on-write.
+SERVER_MODE="${SERVER_MODE:-fastapi}"
+WEB_CONCURRENCY="${WEB_CONCURRENCY:-4}"
+
 echo "Running Guardrails setup..."
 ./scripts/install_guardrails_from_hub.sh
 
-echo "Starting FastAPI server..."
-exec fastapi run --workers 4 app/main.py
+echo "Starting FastAPI server (mode: $SERVER_MODE)..."
+if [[ "$SERVER_MODE" == "prefork" ]]; then
+  exec python -m app.prefork --workers "$WEB_CONCURRENCY"
+fi
+
+exec fastapi run --workers "$WEB_CONCURRENCY" app/main.py